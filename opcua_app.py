@@ -47,6 +47,13 @@ logger = logging.getLogger(__name__)
 
 DEFAULT_SERVER_URL = "opc.tcp://mkketi:62541/Quickstarts/ReferenceServer"
 
+# 종료 명령어 집합 - 핫 루프에서 리스트를 매번 생성하지 않도록 모듈 수준에 정의
+_EXIT_TOKENS = frozenset({'q', 'exit', 'quit'})
+
+# 연결 감시 대상 세션 - 세션 수와 무관하게 단일 감시 태스크가 전체를 담당
+_monitored_sessions: Dict[str, Dict[str, Any]] = {}
+_connection_supervisor_task: Optional[asyncio.Task] = None
+
 # 전역 변수로 세션 관리
 session_manager = connection.MultiSessionManager()
 current_session_id = None  # 현재 활성 세션 ID
@@ -280,9 +287,173 @@ async def check_and_reconnect(preserve_subscriptions=True):
         except Exception as reconnect_err:
             logger.error(f"Failed to reconnect: {reconnect_err}")
             return None, False
-    
+
+    # 재연결된 경우 구독 복구 - 호출자마다 반복하지 않고 여기서 한 번만 처리
+    if reconnected and preserve_subscriptions and current_session_id in subscription_lists:
+        subscription_list = subscription_lists[current_session_id]
+
+        # 서버측 구독이 살아있으면 TransferSubscriptions로 새 세션에 인계
+        failed = await _try_transfer_subscriptions(client_connection, subscription_list)
+        if failed is None:
+            # 서비스 미지원 등 - 기존 경로로 전체 재생성
+            print("Connection was re-established. Recreating subscriptions...")
+            subscription_lists[current_session_id] = await recreate_subscriptions(
+                client_connection, subscription_list)
+        elif failed:
+            # 인계에 실패한 구독만 재생성
+            print("Connection was re-established. Recreating subscriptions that could not be transferred...")
+            failed_ids = {id(sub_info) for sub_info in failed}
+            transferred = [sub_info for sub_info in subscription_list if id(sub_info) not in failed_ids]
+            recreated = await recreate_subscriptions(client_connection, failed)
+            subscription_lists[current_session_id] = transferred + (recreated or [])
+        else:
+            print("Connection was re-established. Existing subscriptions were transferred to the new session.")
+
     return client_connection, reconnected
 
+def _select_subscription(subscription_list, selection_input):
+    """
+    목록 번호 또는 실제 구독 ID로 구독 정보를 선택합니다.
+
+    입력을 한 번만 int로 변환해 정수끼리 비교하므로 구독마다
+    str() 변환과 문자열 비교를 반복하지 않습니다.
+
+    Args:
+        subscription_list: 구독 정보 목록
+        selection_input: 사용자가 입력한 선택 문자열
+
+    Returns:
+        선택된 구독 정보 딕셔너리 또는 None
+    """
+    try:
+        selection_number = int(selection_input)
+    except ValueError:
+        # 구독 ID는 서버가 할당한 정수이므로 숫자가 아닌 입력은 매칭될 수 없음
+        return None
+
+    # 먼저 목록 번호로 시도 (1, 2, 3...)
+    selection_idx = selection_number - 1
+    if 0 <= selection_idx < len(subscription_list):
+        return subscription_list[selection_idx]
+
+    # 목록 번호가 잘못된 경우 실제 구독 ID로 시도
+    return next((sub_info for sub_info in subscription_list
+                 if sub_info['id'] == selection_number), None)
+
+def _watch_session_connection(session_id):
+    """
+    세션을 공용 연결 감시 태스크에 등록합니다.
+
+    세션마다 폴링 태스크를 만드는 대신 등록된 세션 전체를 하나의
+    태스크가 확인하므로 백그라운드 태스크 수가 세션 수와 무관합니다.
+
+    Returns:
+        'connected' 키를 갖는 상태 딕셔너리. 연결이 끊기면 False로 바뀝니다.
+    """
+    global _connection_supervisor_task
+
+    state = {'connected': True}
+    _monitored_sessions[session_id] = state
+
+    if _connection_supervisor_task is None or _connection_supervisor_task.done():
+        _connection_supervisor_task = asyncio.create_task(_connection_supervisor())
+
+    return state
+
+def _unwatch_session_connection(session_id):
+    """세션을 공용 연결 감시 태스크에서 제거합니다."""
+    _monitored_sessions.pop(session_id, None)
+
+async def _connection_supervisor():
+    """
+    등록된 모든 세션의 연결 상태를 하나의 태스크로 감시합니다.
+
+    등록된 세션이 없어지면 스스로 종료합니다.
+    """
+    while _monitored_sessions:
+        pending = []
+        for session_id in list(_monitored_sessions):
+            client_connection = session_manager.get_session(session_id)
+            if client_connection is None:
+                state = _monitored_sessions.get(session_id)
+                if state is not None:
+                    state['connected'] = False
+                continue
+            pending.append((session_id, client_connection.get_namespace_array()))
+
+        if pending:
+            results = await asyncio.gather(*(coro for _, coro in pending), return_exceptions=True)
+            for (session_id, _), result in zip(pending, results):
+                if isinstance(result, Exception):
+                    state = _monitored_sessions.get(session_id)
+                    if state is not None and state['connected']:
+                        print(f"\n연결 오류가 발생했습니다: {result}")
+                        state['connected'] = False
+
+        await asyncio.sleep(5)  # 5초마다 연결 상태 확인
+
+async def _try_transfer_subscriptions(new_client, subscription_list):
+    """
+    TransferSubscriptions 서비스로 기존 서버측 구독을 새 세션에 인계합니다.
+
+    인계에 성공한 구독은 모니터링 항목을 다시 만들 필요가 없으므로
+    재연결 비용이 크게 줄어듭니다.
+
+    Args:
+        new_client: 재연결된 클라이언트
+        subscription_list: 기존 세션의 구독 정보 목록
+
+    Returns:
+        인계에 실패한 구독 정보 목록. 서비스 자체를 사용할 수 없으면 None
+    """
+    transferable = [sub_info for sub_info in subscription_list if sub_info.get('id')]
+    sub_ids = [sub_info['id'] for sub_info in transferable]
+    if not sub_ids or not hasattr(new_client.uaclient, 'transfer_subscriptions'):
+        return None
+
+    uaclient = new_client.uaclient
+    # 인계만으로는 부족 - 새 UaClient는 이 구독의 publish 콜백을 모르고
+    # publish 요청도 보내지 않으므로, 콜백 레지스트리에 접근할 수 없으면
+    # 조용히 알림이 끊긴다. 그 경우 재생성 경로가 차라리 낫다.
+    subscription_callbacks = getattr(uaclient, '_subscription_callbacks', None)
+    if subscription_callbacks is None:
+        return None
+
+    try:
+        params = ua.TransferSubscriptionsParameters()
+        params.SubscriptionIds = sub_ids
+        params.SendInitialValues = True
+        results = await uaclient.transfer_subscriptions(params)
+    except Exception as transfer_err:
+        logger.warning(f"TransferSubscriptions failed, falling back to recreate: {transfer_err}")
+        return None
+
+    # id가 없어 인계를 시도할 수 없었던 항목은 바로 재생성 대상으로
+    failed = [sub_info for sub_info in subscription_list if not sub_info.get('id')]
+    transferred_any = False
+    for sub_info, result in zip(transferable, results):
+        status = getattr(result, 'StatusCode', result)
+        sub = sub_info.get('subscription')
+        if (hasattr(status, 'is_good') and status.is_good()
+                and sub is not None and hasattr(sub, 'publish_callback')):
+            # 서버측 상태는 그대로 - 래퍼와 publish 콜백을 새 세션으로 옮김
+            sub.server = uaclient
+            subscription_callbacks[sub_info['id']] = sub.publish_callback
+            transferred_any = True
+            logger.info(f"Transferred subscription {sub_info['id']} to new session")
+        else:
+            logger.warning(f"Subscription {sub_info.get('id')} could not be transferred: {status}")
+            failed.append(sub_info)
+
+    if transferred_any:
+        # 새 세션에서 publish 루프가 돌고 있지 않으면 시작해 알림 수신 재개
+        publish_task = getattr(uaclient, '_publish_task', None)
+        publish_loop = getattr(uaclient, '_publish_loop', None)
+        if publish_loop is not None and (publish_task is None or publish_task.done()):
+            uaclient._publish_task = asyncio.create_task(publish_loop())
+
+    return failed
+
 async def get_node_info(client_connection):
     if not client_connection:
         logger.info("Not connected to any server")
@@ -547,18 +718,27 @@ async def browse_nodes(client_connection):
             tree = await node.browse_nodes_recursive(client_connection, node_id, max_depth)
             
             # 트리 형태로 출력
-            await _print_node_tree(tree)
+            _print_node_tree(tree)
     except Exception as e:
         logger.error(f"Failed to browse nodes: {e}")
 
-async def _print_node_tree(node_info, indent=0):
-    """노드 트리를 계층적으로 출력"""
-    # 현재 노드 출력
-    print(f"{' ' * indent}├─ {node_info.get('DisplayName', 'Unknown')} ({node_info.get('NodeId', 'Unknown')}) - {node_info.get('NodeClass', 'Unknown')}")
-    
-    # 자식 노드들을 재귀적으로 출력
-    for child in node_info.get('Children', []):
-        await _print_node_tree(child, indent + 2)
+# 트리 출력용 명시적 스택 - 호출마다 새로 할당하지 않고 재사용
+_print_stack = []
+
+
+def _print_node_tree(node_info, indent=0):
+    """노드 트리를 계층적으로 출력 (재귀 대신 명시적 스택 사용)"""
+    stack = _print_stack
+    stack.clear()
+    stack.append((node_info, indent))
+    lines = []
+    while stack:
+        current, ind = stack.pop()
+        lines.append(f"{' ' * ind}├─ {current.get('DisplayName', 'Unknown')} ({current.get('NodeId', 'Unknown')}) - {current.get('NodeClass', 'Unknown')}")
+        # pop 순서가 뒤집히므로 자식을 역순으로 쌓아 원래 출력 순서를 유지
+        stack.extend((child, ind + 2) for child in reversed(current.get('Children', [])))
+    # 노드당 print 1회 대신 트리 전체를 한 번의 write로 출력
+    sys.stdout.write("\n".join(lines) + "\n")
 
 async def find_nodes(client_connection):
     """서버에서 노드 검색"""
@@ -849,26 +1029,8 @@ async def add_monitored_item(client_connection, subscription_list):
         selection_input = input("\n모니터링 항목을 추가할 구독 번호를 선택하세요: ")
         
         # 사용자 입력 처리 - 목록 번호 또는 실제 구독 ID 모두 허용
-        selected_sub_info = None
-        
-        try:
-            # 먼저 목록 번호로 시도 (1, 2, 3...)
-            selection_idx = int(selection_input) - 1
-            if 0 <= selection_idx < len(subscription_list):
-                selected_sub_info = subscription_list[selection_idx]
-            else:
-                # 목록 번호가 잘못된 경우 실제 구독 ID로 시도
-                for sub_info in subscription_list:
-                    if str(sub_info['id']) == selection_input:
-                        selected_sub_info = sub_info
-                        break
-        except ValueError:
-            # 숫자가 아닌 경우 직접 구독 ID로 시도
-            for sub_info in subscription_list:
-                if str(sub_info['id']) == selection_input:
-                    selected_sub_info = sub_info
-                    break
-        
+        selected_sub_info = _select_subscription(subscription_list, selection_input)
+
         if not selected_sub_info:
             print("잘못된 선택입니다. 유효한 구독 번호 또는 ID를 입력하세요.")
             return subscription_list
@@ -975,13 +1137,14 @@ async def add_monitored_item(client_connection, subscription_list):
                 advanced_handler_options=handler_options
             )
             
-            # 모니터링 항목 정보 저장
+            # 모니터링 항목 정보 저장 - 파싱된 NodeId도 함께 저장해 재생성 시 재파싱을 피함
             monitored_item = {
                 "handle": handle,
                 "node_id": node_id_str,
+                "node_id_obj": node_obj.nodeid,
                 "sampling_interval": sampling_interval
             }
-            
+
             selected_sub_info["monitored_items"].append(monitored_item)
             print(f"모니터링 항목이 추가되었습니다. 핸들: {handle}")
         except Exception as sub_err:
@@ -1022,26 +1185,8 @@ async def modify_subscription(subscription_list):
         selection_input = input("\n수정할 구독 번호를 선택하세요: ")
         
         # 사용자 입력 처리 - 목록 번호 또는 실제 구독 ID 모두 허용
-        selected_sub = None
-        
-        try:
-            # 먼저 목록 번호로 시도 (1, 2, 3...)
-            selection_idx = int(selection_input) - 1
-            if 0 <= selection_idx < len(subscription_list):
-                selected_sub = subscription_list[selection_idx]
-            else:
-                # 목록 번호가 잘못된 경우 실제 구독 ID로 시도
-                for sub_info in subscription_list:
-                    if str(sub_info['id']) == selection_input:
-                        selected_sub = sub_info
-                        break
-        except ValueError:
-            # 숫자가 아닌 경우 직접 구독 ID로 시도
-            for sub_info in subscription_list:
-                if str(sub_info['id']) == selection_input:
-                    selected_sub = sub_info
-                    break
-        
+        selected_sub = _select_subscription(subscription_list, selection_input)
+
         if not selected_sub:
             print("잘못된 선택입니다. 유효한 구독 번호 또는 ID를 입력하세요.")
             return subscription_list
@@ -1324,33 +1469,15 @@ async def delete_subscription(subscription_list):
         
         selection = input("\nSelect subscription to delete (number/ID) or 'all' to delete all: ")
         
-        if selection.lower() == 'all':
+        if selection.strip().casefold() == 'all':
             for sub in subscription_list:
                 result = await subscription.delete_subscription(sub['subscription'])
                 print(f"Deleted subscription ID: {sub['id']}" if result else f"Failed to delete subscription ID: {sub['id']}")
             return []
         else:
             # 사용자 입력 처리 - 목록 번호 또는 실제 구독 ID 모두 허용
-            selected_sub = None
-            
-            try:
-                # 먼저 목록 번호로 시도 (1, 2, 3...)
-                selection_idx = int(selection) - 1
-                if 0 <= selection_idx < len(subscription_list):
-                    selected_sub = subscription_list[selection_idx]
-                else:
-                    # 목록 번호가 잘못된 경우 실제 구독 ID로 시도
-                    for sub_info in subscription_list:
-                        if str(sub_info['id']) == selection:
-                            selected_sub = sub_info
-                            break
-            except ValueError:
-                # 숫자가 아닌 경우 직접 구독 ID로 시도
-                for sub_info in subscription_list:
-                    if str(sub_info['id']) == selection:
-                        selected_sub = sub_info
-                        break
-            
+            selected_sub = _select_subscription(subscription_list, selection)
+
             if not selected_sub:
                 print("Invalid selection. Please enter a valid number or subscription ID.")
                 return subscription_list
@@ -1368,10 +1495,32 @@ async def delete_subscription(subscription_list):
     
     return subscription_list
 
+def _example_files(examples_dir="examples"):
+    """
+    예제 스크립트 목록을 반환합니다. 디렉터리 mtime이 변하지 않는 한
+    캐시된 목록을 재사용해 메뉴 선택마다 디렉터리를 다시 읽지 않습니다.
+    """
+    try:
+        dir_mtime = os.stat(examples_dir).st_mtime
+    except OSError:
+        return []
+
+    cached = _example_files._cache
+    if cached is not None and cached[0] == dir_mtime:
+        return cached[1]
+
+    files = sorted(
+        entry.name for entry in os.scandir(examples_dir)
+        if entry.is_file() and entry.name.endswith('.py') and not entry.name.startswith('__'))
+    _example_files._cache = (dir_mtime, files)
+    return files
+
+_example_files._cache = None
+
 async def execute_example_script():
     examples_dir = "examples"
-    example_files = [f for f in os.listdir(examples_dir) if f.endswith('.py') and not f.startswith('__')]
-    
+    example_files = _example_files(examples_dir)
+
     print("\nAvailable example scripts:")
     for i, file in enumerate(example_files, 1):
         print(f"{i}. {file}")
@@ -1470,6 +1619,8 @@ async def recreate_subscriptions(client_connection, subscription_list):
             for item in sub_info.get('monitored_items', []):
                 try:
                     node_id = item.get('node_id')
+                    # 구독 시점에 파싱해 둔 NodeId가 있으면 문자열 재파싱을 생략
+                    node_id_obj = item.get('node_id_obj')
                     sampling_interval = item.get('sampling_interval', 100)
                     
                     # 데이터 변경 콜백 함수 정의
@@ -1498,15 +1649,16 @@ async def recreate_subscriptions(client_connection, subscription_list):
                     
                     # 구독 핸들 가져오기
                     handle = await subscription.subscribe_data_change(
-                        new_sub, node_id, 
+                        new_sub, node_id_obj if node_id_obj is not None else node_id,
                         sampling_interval=sampling_interval,
                         advanced_handler_options=handler_options
                     )
-                    
+
                     # 모니터링 항목 정보 저장
                     monitored_item = {
                         "handle": handle,
                         "node_id": node_id,
+                        "node_id_obj": node_id_obj,
                         "sampling_interval": sampling_interval
                     }
                     
@@ -1533,6 +1685,10 @@ async def recreate_subscriptions(client_connection, subscription_list):
     print(f"{len(new_subscriptions)}개의 구독이 재생성되었습니다.")
     return new_subscriptions
 
+def _count_monitored_items(subscription_list):
+    """구독 목록의 데이터 모니터링 항목 수를 반환합니다."""
+    return sum(len(sub_info.get("monitored_items", ())) for sub_info in subscription_list)
+
 async def enter_monitoring_mode(client_connection, subscription_list):
     """구독 데이터 모니터링 모드로 진입합니다."""
     if not client_connection:
@@ -1549,17 +1705,9 @@ async def enter_monitoring_mode(client_connection, subscription_list):
             return subscription_list
     
     # 모니터링 항목 확인 (데이터 변경 구독만)
-    has_monitored_items = False
-    total_data_items = 0
-    
-    for sub_info in subscription_list:
-        # 데이터 변경 모니터링 항목 확인
-        data_items = sub_info.get("monitored_items", [])
-        for item in data_items:
-            total_data_items += 1
-            has_monitored_items = True
-    
-    if not has_monitored_items:
+    total_data_items = _count_monitored_items(subscription_list)
+
+    if not total_data_items:
         print("\n모니터링할 데이터 항목이 없습니다.")
         print("데이터 변경 모니터링 항목을 추가하세요.")
         print("(이벤트 모니터링은 메뉴 15번 'Event View'를 사용하세요)")
@@ -1572,16 +1720,9 @@ async def enter_monitoring_mode(client_connection, subscription_list):
             return subscription_list
             
         # 다시 확인
-        has_monitored_items = False
-        total_data_items = 0
-        
-        for sub_info in subscription_list:
-            data_items = sub_info.get("monitored_items", [])
-            for item in data_items:
-                total_data_items += 1
-                has_monitored_items = True
-        
-        if not has_monitored_items:
+        total_data_items = _count_monitored_items(subscription_list)
+
+        if not total_data_items:
             print("모니터링 항목이 추가되지 않았습니다. 모니터링 모드를 종료합니다.")
             return subscription_list
     
@@ -1625,33 +1766,23 @@ async def enter_monitoring_mode(client_connection, subscription_list):
         while monitoring_active:
             # 비동기 방식으로 입력 받기
             exit_command = await asyncio.to_thread(input, "")
-            if exit_command.lower() in ['q', 'exit', 'quit']:
+            if exit_command.strip().casefold() in _EXIT_TOKENS:
                 print("모니터링 모드 종료...")
                 monitoring_active = False
                 return
             await asyncio.sleep(0.1)
     
-    # 연결 상태 확인 태스크
-    async def check_connection_status():
-        nonlocal monitoring_active
-        while monitoring_active:
-            try:
-                # 간단한 연결 상태 확인
-                await client_connection.get_namespace_array()
-            except Exception as e:
-                print("\n연결 오류가 발생했습니다: {e}")
-                print("모니터링 종료.")
-                monitoring_active = False
-                return
-            await asyncio.sleep(5)  # 5초마다 연결 상태 확인
-    
-    # 모니터링 태스크 시작
+    # 모니터링 태스크 시작 - 연결 상태는 공용 감시 태스크에 위임
     input_task = asyncio.create_task(check_exit_command())
-    connection_task = asyncio.create_task(check_connection_status())
-    
+    conn_state = _watch_session_connection(current_session_id)
+
     try:
         # 모니터링 모드 유지
         while monitoring_active:
+            if not conn_state['connected']:
+                print("모니터링 종료.")
+                monitoring_active = False
+                break
             await asyncio.sleep(1)
     except asyncio.CancelledError:
         print("모니터링이 취소되었습니다.")
@@ -1659,22 +1790,12 @@ async def enter_monitoring_mode(client_connection, subscription_list):
         logger.error(f"모니터링 중 오류 발생: {e}")
         print(f"오류가 발생했습니다: {e}")
     finally:
-        # 태스크 정리
+        # 태스크 정리 - 감시 등록을 해제하고 입력 태스크를 취소
+        _unwatch_session_connection(current_session_id)
         if not input_task.done():
             input_task.cancel()
-        if not connection_task.done():
-            connection_task.cancel()
-        
-        try:
-            await input_task
-        except asyncio.CancelledError:
-            pass
-        
-        try:
-            await connection_task
-        except asyncio.CancelledError:
-            pass
-        
+        await asyncio.gather(input_task, return_exceptions=True)
+
         print("\n===== 모니터링 모드 종료 =====")
     
     return subscription_list
@@ -1939,7 +2060,7 @@ async def enter_event_view(client_connection):
             while monitoring_active:
                 try:
                     exit_command = await asyncio.to_thread(input, "")
-                    if exit_command.lower() in ['q', 'exit', 'quit']:
+                    if exit_command.strip().casefold() in _EXIT_TOKENS:
                         print("\nEvent View 종료 중...")
                         monitoring_active = False
                         return
@@ -2042,7 +2163,7 @@ async def main():
             choice = await display_menu()
             
             try:
-                if choice == '99' or choice.lower() == 'q':
+                if choice == '99' or choice.strip().casefold() in _EXIT_TOKENS:
                     # Clean up before exit
                     try:
                         await session_manager.close_all_sessions()
@@ -2067,67 +2188,31 @@ async def main():
                     client_connection, reconnected = await check_and_reconnect()
                     if client_connection:
                         await get_node_info(client_connection)
-                        
-                        # 재연결된 경우 구독 복구
-                        if reconnected and current_session_id in subscription_lists:
-                            print("Connection was re-established. Recreating subscriptions...")
-                            subscription_lists[current_session_id] = await recreate_subscriptions(
-                                client_connection, subscription_lists[current_session_id])
                     
                 elif choice == '5':  # Read Node Value
                     client_connection, reconnected = await check_and_reconnect()
                     if client_connection:
                         await read_node_value(client_connection)
-                        
-                        # 재연결된 경우 구독 복구
-                        if reconnected and current_session_id in subscription_lists:
-                            print("Connection was re-established. Recreating subscriptions...")
-                            subscription_lists[current_session_id] = await recreate_subscriptions(
-                                client_connection, subscription_lists[current_session_id])
                     
                 elif choice == '6':  # Write Node Value
                     client_connection, reconnected = await check_and_reconnect()
                     if client_connection:
                         await write_node_value(client_connection)
-                        
-                        # 재연결된 경우 구독 복구
-                        if reconnected and current_session_id in subscription_lists:
-                            print("Connection was re-established. Recreating subscriptions...")
-                            subscription_lists[current_session_id] = await recreate_subscriptions(
-                                client_connection, subscription_lists[current_session_id])
                     
                 elif choice == '7':  # Browse Nodes
                     client_connection, reconnected = await check_and_reconnect()
                     if client_connection:
                         await browse_nodes(client_connection)
-                        
-                        # 재연결된 경우 구독 복구
-                        if reconnected and current_session_id in subscription_lists:
-                            print("Connection was re-established. Recreating subscriptions...")
-                            subscription_lists[current_session_id] = await recreate_subscriptions(
-                                client_connection, subscription_lists[current_session_id])
                     
                 elif choice == '8':  # Search Nodes
                     client_connection, reconnected = await check_and_reconnect()
                     if client_connection:
                         await find_nodes(client_connection)
-                        
-                        # 재연결된 경우 구독 복구
-                        if reconnected and current_session_id in subscription_lists:
-                            print("Connection was re-established. Recreating subscriptions...")
-                            subscription_lists[current_session_id] = await recreate_subscriptions(
-                                client_connection, subscription_lists[current_session_id])
                     
                 elif choice == '9':  # Call Method
                     client_connection, reconnected = await check_and_reconnect()
                     if client_connection:
                         await call_method(client_connection)
-                        
-                        # 재연결된 경우 구독 복구
-                        if reconnected and current_session_id in subscription_lists:
-                            print("Connection was re-established. Recreating subscriptions...")
-                            subscription_lists[current_session_id] = await recreate_subscriptions(
-                                client_connection, subscription_lists[current_session_id])
                     
                 elif choice == '10':  # Create Subscription
                     client_connection, reconnected = await check_and_reconnect()
@@ -2141,11 +2226,6 @@ async def main():
                 elif choice == '11':  # Modify Subscription
                     client_connection, reconnected = await check_and_reconnect()
                     if client_connection:
-                        if reconnected and current_session_id in subscription_lists:
-                            print("Connection was re-established. Recreating subscriptions...")
-                            subscription_lists[current_session_id] = await recreate_subscriptions(
-                                client_connection, subscription_lists[current_session_id])
-                        
                         if current_session_id in subscription_lists:
                             subscription_lists[current_session_id] = await modify_subscription(
                                 subscription_lists[current_session_id])
@@ -2155,11 +2235,6 @@ async def main():
                 elif choice == '12':  # Delete Subscription
                     client_connection, reconnected = await check_and_reconnect()
                     if client_connection:
-                        if reconnected and current_session_id in subscription_lists:
-                            print("Connection was re-established. Recreating subscriptions...")
-                            subscription_lists[current_session_id] = await recreate_subscriptions(
-                                client_connection, subscription_lists[current_session_id])
-                        
                         if current_session_id in subscription_lists:
                             subscription_lists[current_session_id] = await delete_subscription(
                                 subscription_lists[current_session_id])
@@ -2172,11 +2247,6 @@ async def main():
                 elif choice == '14':  # Enter Monitoring Mode
                     client_connection, reconnected = await check_and_reconnect()
                     if client_connection:
-                        if reconnected and current_session_id in subscription_lists:
-                            print("Connection was re-established. Recreating subscriptions...")
-                            subscription_lists[current_session_id] = await recreate_subscriptions(
-                                client_connection, subscription_lists[current_session_id])
-                        
                         if current_session_id in subscription_lists:
                             subscription_lists[current_session_id] = await enter_monitoring_mode(
                                 client_connection, subscription_lists[current_session_id])
@@ -6,16 +6,14 @@ OPC UA 클라이언트 애플리케이션 핸들러
 
 #!/usr/bin/env python3
 import asyncio
+import functools
 import logging
 import sys
 import os
 import time
-import json
-import inspect
-import traceback
+from dataclasses import dataclass, field
 from typing import Optional, List, Dict, Any, Union, Tuple, Callable
 from asyncua import ua, Client
-import datetime
 
 # 라이브러리 경로 추가
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -23,22 +21,169 @@ parent_dir = os.path.dirname(current_dir)
 if parent_dir not in sys.path:
     sys.path.insert(0, parent_dir)
 
-# OPC UA 클라이언트 모듈 가져오기
+# OPC UA 클라이언트 모듈 가져오기 - 실제로 사용하는 모듈만 로드해 시작 시간을 줄임
 from opcua_client import connection
-from opcua_client import client
 from opcua_client import node
 from opcua_client import method
 from opcua_client import subscription
-from opcua_client import event
-from opcua_client import utils
-from asyncua.ua import NodeId, NodeClass, DataChangeNotification, MonitoringMode, VariantType, DataValue, Variant
-from asyncua.common.subscription import SubscriptionItemData
-from asyncua.common.node import Node as AsyncuaNode
-from asyncua.ua.uaerrors import UaStatusCodeError
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# 자주 쓰는 표준 NodeId - 호출 시마다 객체를 새로 만들지 않도록 모듈 수준에 정의
+_SERVER_TIME_NODEID = ua.NodeId(2258, 0)       # Server_ServerStatus_CurrentTime
+_NAMESPACE_ARRAY_NODEID = ua.NodeId(2255, 0)   # Server_NamespaceArray
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_node_id(node_id_str: str) -> ua.NodeId:
+    """문자열 NodeId 파싱 결과를 메모이즈합니다."""
+    return ua.NodeId.from_string(node_id_str)
+
+
+# 사용자 입력 타입 변환 테이블 - write/call 핸들러가 동일한 분기문을 반복하지 않도록 공유
+_COERCERS = {
+    "int": int,
+    "float": float,
+    "bool": lambda s: s.lower() in ("true", "yes", "1", "y"),
+    "string": str,
+}
+
+
+# 재접속 서킷 브레이커 - 서버가 완전히 내려간 동안 핸들러마다 비싼
+# 실패 경로(엔드포인트 조회, TCP 핸드셰이크 타임아웃)를 반복하지 않도록
+# 연속 실패가 임계값을 넘으면 잠시 재시도를 차단합니다.
+_CB_FAIL_THRESHOLD = 3
+_CB_COOLDOWN_SECONDS = 30.0
+_cb = {"fails": 0, "open_until": 0.0}
+
+
+def _circuit_is_open() -> bool:
+    """재접속 서킷이 열려(차단 중) 있는지 확인합니다."""
+    return time.monotonic() < _cb["open_until"]
+
+
+def _record_reconnect_failure():
+    """재접속 실패를 기록하고 임계값을 넘으면 서킷을 엽니다."""
+    _cb["fails"] += 1
+    if _cb["fails"] >= _CB_FAIL_THRESHOLD:
+        _cb["open_until"] = time.monotonic() + _CB_COOLDOWN_SECONDS
+        logging.warning(
+            "Reconnect circuit opened for %.0fs after %d consecutive failures",
+            _CB_COOLDOWN_SECONDS, _cb["fails"])
+
+
+def _record_reconnect_success():
+    """재접속 성공 시 서킷 상태를 초기화합니다."""
+    _cb["fails"] = 0
+    _cb["open_until"] = 0.0
+
+
+# 연결 생존 신호 캐시 - 구독 알림 등 실제 트래픽이 곧 생존 증거이므로
+# 신선한 동안에는 확인용 ping Read를 생략합니다.
+_ALIVE_THRESHOLD_SECONDS = 5.0
+_last_alive_ts = 0.0
+
+
+def _mark_alive():
+    """서버로부터 성공적인 응답을 받았음을 기록합니다."""
+    global _last_alive_ts
+    _last_alive_ts = time.monotonic()
+
+
+def _connection_is_fresh() -> bool:
+    """최근 생존 신호가 임계값 이내인지 확인합니다."""
+    return (time.monotonic() - _last_alive_ts) < _ALIVE_THRESHOLD_SECONDS
+
+
+# Node 객체 캐시 - (세션 id, node_id 문자열) -> Node
+# 재접속 후 같은 노드를 다시 등록할 때 NodeId 파싱을 반복하지 않습니다.
+_node_cache: Dict[Tuple[int, str], Any] = {}
+
+
+def _get_cached_node(client_obj, node_id: str):
+    """세션별로 Node 객체를 메모이즈해 반환합니다."""
+    key = (id(client_obj), node_id)
+    cached = _node_cache.get(key)
+    if cached is None:
+        # 세션이 바뀌어 Node 캐시가 미스여도 NodeId 파싱 결과는 재사용
+        cached = _node_cache[key] = client_obj.get_node(_parse_node_id(node_id))
+    return cached
+
+
+# str(node.nodeid) 결과 캐시 - NodeId.__str__는 알림마다 호출하면
+# 고속 구독에서 무시 못 할 비용이므로 노드별로 한 번만 계산합니다.
+_nodeid_str_cache: Dict[Any, str] = {}
+
+
+def _nodeid_str(node_obj) -> str:
+    """노드의 NodeId 문자열을 메모이즈해 반환합니다."""
+    cached = _nodeid_str_cache.get(node_obj)
+    if cached is None:
+        cached = _nodeid_str_cache[node_obj] = str(node_obj.nodeid)
+    return cached
+
+
+# 모니터링 항목 등록 시 한 번 조회한 BrowseName 캐시 (node_id 문자열 -> 이름)
+# 콜백이 알림마다 read_browse_name() 왕복을 하지 않도록 합니다.
+_browse_name_cache: Dict[str, str] = {}
+
+# 알림 출력 프리픽스 캐시 - "Data change: name (nid) = " 부분은 항목마다
+# 고정이므로 매 알림마다 f-string으로 다시 만들지 않습니다.
+_notif_prefix_cache: Dict[str, str] = {}
+
+# 데이터 변경 알림 출력 큐 - 수신 경로는 put_nowait만 수행하고
+# 포맷과 터미널 출력은 별도의 프린터 태스크가 담당합니다.
+_NOTIF_QUEUE_MAXSIZE = 10000
+_notif_queue: Optional[asyncio.Queue] = None
+_printer_task: Optional[asyncio.Task] = None
+_dropped_notifications = 0
+
+
+def _enqueue_notification(node_id_str: str, value: Any):
+    """알림을 출력 큐에 넣습니다. 큐가 가득 차면 버리고 카운터만 올립니다."""
+    global _notif_queue, _printer_task, _dropped_notifications
+
+    if _notif_queue is None:
+        _notif_queue = asyncio.Queue(maxsize=_NOTIF_QUEUE_MAXSIZE)
+    if _printer_task is None or _printer_task.done():
+        _printer_task = asyncio.create_task(_drain_notif_queue())
+
+    try:
+        _notif_queue.put_nowait((node_id_str, value, time.monotonic()))
+    except asyncio.QueueFull:
+        _dropped_notifications += 1
+
+
+def _format_value_short(value, limit):
+    """값을 표시용으로 요약합니다.
+
+    큰 배열을 통째로 str()한 뒤 자르면 알림마다 O(N) 비용이 들므로,
+    긴 시퀀스는 앞 몇 개 요소만 포맷하고 길이를 덧붙입니다.
+    """
+    if isinstance(value, (list, tuple, bytes, bytearray)) and len(value) > 10:
+        head = ", ".join(str(item) for item in value[:5])
+        return f"[{head}, ... len={len(value)}]"
+    value_str = str(value)
+    if len(value_str) > limit:
+        return f"{value_str[:limit]}..."
+    return value_str
+
+
+async def _drain_notif_queue():
+    """큐에 쌓인 알림을 꺼내 포맷한 뒤 출력합니다."""
+    while True:
+        node_id_str, value, _ts = await _notif_queue.get()
+        try:
+            prefix = _notif_prefix_cache.get(node_id_str)
+            if prefix is None:
+                name = _browse_name_cache.get(node_id_str, node_id_str)
+                prefix = _notif_prefix_cache[node_id_str] = f"Data change: {name} ({node_id_str}) = "
+            sys.stdout.write(prefix + _format_value_short(value, 60) + "\n")
+        except Exception as e:
+            logger.error(f"Error printing notification: {e}")
+
+
 # Global variables
 SERVER_URL = "opc.tcp://mk:62541/Quickstarts/ReferenceServer"
 active_connection = None
@@ -46,6 +191,88 @@ active_client = None
 active_subscriptions = {}
 subscription_counter = 0
 
+
+@dataclass(slots=True)
+class SubRecord:
+    """구독 하나의 상태.
+
+    handle과 node_id 양쪽으로 O(1) 조회가 가능하도록 두 개의 인덱스를
+    유지하며, slots로 레코드당 __dict__ 오버헤드를 없앱니다.
+    """
+    sub: Any
+    by_handle: Dict[int, dict] = field(default_factory=dict)
+    by_node: Dict[str, dict] = field(default_factory=dict)
+
+    def add_item(self, info: dict):
+        """모니터링 항목을 양쪽 인덱스에 등록합니다."""
+        self.by_handle[info['handle']] = info
+        self.by_node[info['node_id']] = info
+
+# 세션 풀 - 서버 호출 처리량을 높이기 위한 보조 세션들
+# 주의: 구독/모니터링 항목은 세션에 종속되므로 반드시 원래 생성된
+# active_connection에 묶어 두어야 하며, 풀 세션은 browse/read 류의
+# 무상태(stateless) 호출에만 사용합니다.
+POOL_SIZE = max(1, int(os.environ.get("OPCUA_POOL_SIZE", "4")))
+_pool = []
+_pool_index = 0
+
+
+async def _acquire() -> Client:
+    """다음에 사용할 세션을 라운드 로빈으로 반환합니다.
+
+    풀이 비어 있으면 기본 세션(active_connection)을 그대로 반환합니다.
+    """
+    global _pool_index
+    candidates = [active_connection] + _pool
+    session = candidates[_pool_index % len(candidates)]
+    _pool_index += 1
+    return session
+
+
+async def _refill_pool():
+    """보조 세션을 정리하고 POOL_SIZE에 맞게 다시 채웁니다."""
+    global _pool
+    await _close_pool()
+    if POOL_SIZE <= 1:
+        return
+    results = await asyncio.gather(
+        *(connection.create_session(SERVER_URL) for _ in range(POOL_SIZE - 1)),
+        return_exceptions=True)
+    _pool = [result for result in results if not isinstance(result, Exception)]
+    for result in results:
+        if isinstance(result, Exception):
+            logging.warning(f"Failed to create pool session: {result}")
+
+
+async def _close_session_bounded(session, timeout: float = 2.0):
+    """세션 종료를 제한 시간 안에 끝냅니다.
+
+    반쯤 끊긴 TCP 연결에서는 CloseSession이 OS TCP 타임아웃까지 수 분간
+    블록될 수 있으므로, 시간 초과 시 소켓을 강제로 닫고 넘어갑니다.
+    """
+    try:
+        await asyncio.wait_for(connection.close_session(session), timeout=timeout)
+    except asyncio.TimeoutError:
+        logging.warning("close_session timed out; forcing socket disconnect")
+        try:
+            session.uaclient.disconnect_socket()
+        except Exception:
+            pass
+
+
+async def _close_pool():
+    """풀의 보조 세션을 모두 닫습니다."""
+    global _pool
+    if not _pool:
+        return
+    results = await asyncio.gather(
+        *(connection.close_session(session) for session in _pool),
+        return_exceptions=True)
+    for result in results:
+        if isinstance(result, Exception):
+            logging.warning(f"Error closing pool session: {result}")
+    _pool = []
+
 # Data change notification handler
 async def data_change_notification(subscription_id, node, value, data):
     """Handle data change notification from subscribed nodes."""
@@ -53,42 +280,46 @@ async def data_change_notification(subscription_id, node, value, data):
     logging.info(f"Subscription {subscription_id}: {node_name} = {value}")
     print(f"Data change notification from {node_name}: {value}")
 
+async def _ainput(prompt: str = "") -> str:
+    """
+    블로킹 input()을 스레드 풀에서 실행합니다.
+
+    프롬프트 대기 중에도 이벤트 루프가 구독 알림과 publish 응답을
+    계속 처리할 수 있습니다.
+    """
+    return await asyncio.get_running_loop().run_in_executor(None, input, prompt)
+
+
+async def _batch_read_attributes(client_obj, nodes, attrs):
+    """
+    여러 노드의 속성들을 단일 ReadRequest로 일괄 조회합니다.
+
+    노드마다 attrs 순서대로 DataValue가 배치된 평면 리스트를 반환하므로
+    노드 N개 × 속성 A개 조회가 3N회 왕복 대신 1회 왕복으로 끝납니다.
+    """
+    params = ua.ReadParameters()
+    for node_obj in nodes:
+        for attr in attrs:
+            rv = ua.ReadValueId()
+            rv.NodeId = node_obj.nodeid
+            rv.AttributeId = attr
+            params.NodesToRead.append(rv)
+    return await client_obj.uaclient.read(params)
+
+
 # 메뉴 출력 함수
 def print_menu():
     """Print the application menu."""
-    print("\n=== OPC UA Client Application Menu ===")
-    print("1. Connect to OPC UA Server")
-    print("2. Disconnect from OPC UA Server")
-    print("3. Read Node Value")
-    print("4. Write Node Value")
-    print("5. Browse Server Nodes")
-    print("6. Create Subscription")
-    print("7. Modify Subscription")
-    print("8. Subscribe to Data Change")
-    print("9. Set Publishing Mode")
-    print("10. Delete Subscription")
-    print("11. Exit")
-    print("=====================================")
+    sys.stdout.write(_MENU_TEXT)
 
 
 async def handle_user_choice(choice: int):
     """Handle the user's menu choice."""
-    choice_handlers = {
-        1: handle_connect,
-        2: handle_disconnect,
-        3: handle_read_node,
-        4: handle_write_node,
-        5: handle_browse_nodes,
-        6: handle_create_subscription,
-        7: handle_modify_subscription,
-        8: handle_subscribe_data_change,
-        9: handle_set_publishing_mode, 
-        10: handle_delete_subscription
-    }
-    
-    if choice in choice_handlers:
+    handler = _HANDLERS[choice] if 1 <= choice < len(_HANDLERS) else None
+
+    if handler is not None:
         await check_connection(choice)
-        await choice_handlers[choice]()
+        await handler()
     else:
         print("Invalid choice. Please select a number between 1 and 11.")
 
@@ -117,7 +348,7 @@ async def handle_connect():
     
     try:
         # Allow user to specify a server URL or use the default
-        user_url = input(f"Enter server URL (or press Enter for default {SERVER_URL}): ")
+        user_url = await _ainput(f"Enter server URL (or press Enter for default {SERVER_URL}): ")
         if user_url.strip():
             SERVER_URL = user_url
         
@@ -125,12 +356,17 @@ async def handle_connect():
         active_connection = await connection.create_session(SERVER_URL)
         
         # Test connection by reading server time
-        server_time_node = active_connection.get_node(ua.NodeId(2258, 0))  # Server current time node
+        server_time_node = active_connection.get_node(_SERVER_TIME_NODEID)  # Server current time node
         server_time = await server_time_node.read_value()
         
-        ns_node = active_connection.get_node(ua.NodeId(2255, 0))  # NamespaceArray node
+        ns_node = active_connection.get_node(_NAMESPACE_ARRAY_NODEID)  # NamespaceArray node
         namespaces = await ns_node.read_value()
         
+        _mark_alive()
+
+        # browse/read 처리량을 위한 보조 세션 풀 구성 (실패해도 기본 세션으로 동작)
+        await _refill_pool()
+
         print(f"Connected to {SERVER_URL}")
         print(f"Server time: {server_time}")
         print(f"Server has {len(namespaces)} namespaces")
@@ -153,21 +389,27 @@ async def handle_disconnect():
         return
     
     try:
-        # Clean up any active subscriptions
-        for sub_id, (sub, _) in list(active_subscriptions.items()):
-            try:
-                print(f"Deleting subscription {sub_id}...")
-                await sub.delete()
-                del active_subscriptions[sub_id]
-            except Exception as e:
-                logging.error(f"Error deleting subscription {sub_id}: {e}")
-        
-        # Disconnect from server
+        # Clean up any active subscriptions - 순차 대기 대신 동시에 삭제
+        if active_subscriptions:
+            sub_ids = list(active_subscriptions)
+            print(f"Deleting {len(sub_ids)} subscription(s)...")
+            results = await asyncio.gather(
+                *(active_subscriptions[sub_id].sub.delete() for sub_id in sub_ids),
+                return_exceptions=True)
+            for sub_id, result in zip(sub_ids, results):
+                if isinstance(result, Exception):
+                    logging.error(f"Error deleting subscription {sub_id}: {result}")
+            active_subscriptions = {}
+
+        # Disconnect from server - 보조 세션 풀부터 정리
+        await _close_pool()
         await connection.close_session(active_connection)
         print(f"Disconnected from {SERVER_URL}")
         logging.info(f"Disconnected from {SERVER_URL}")
         
         # Reset connection objects
+        _node_cache.clear()
+        _nodeid_str_cache.clear()
         active_connection = None
         active_client = None
         active_subscriptions = {}
@@ -188,66 +430,80 @@ async def handle_browse_nodes():
         print("1. Browse single level")
         print("2. Browse recursively")
         print("3. Find nodes by name")
-        option = input("\nSelect option [1]: ") or "1"
-        
+        option = await _ainput("\nSelect option [1]: ") or "1"
+
+        # 풀에서 세션을 골라 browse 트래픽을 분산 (구독 상태와 무관한 호출)
+        browse_client = await _acquire()
+
         if option == "1":
             # 단일 레벨 탐색
-            node_id_input = input("Enter starting NodeId (or press Enter for root): ")
+            node_id_input = await _ainput("Enter starting NodeId (or press Enter for root): ")
             
             if not node_id_input:
                 node_id_input = None  # Use None for root node
             
             # Browse for child nodes
             print(f"Browsing nodes under {node_id_input or 'root'}...")
-            children = await node.browse_node(active_connection, node_id_input)
+            children = await node.browse_node(browse_client, node_id_input)
             
             if not children:
                 print("No child nodes found")
                 return
             
             print(f"Found {len(children)} child nodes:")
+
+            # 자식별 3회 왕복 대신 모든 속성을 하나의 ReadRequest로 일괄 조회
+            results = await _batch_read_attributes(
+                browse_client, children,
+                (ua.AttributeIds.BrowseName, ua.AttributeIds.DisplayName, ua.AttributeIds.NodeClass))
+
+            # 자식마다 print 5회 대신 한 번의 write로 모아서 출력
+            lines = []
             for i, child in enumerate(children, 1):
-                browse_name = await child.read_browse_name()
-                display_name = await child.read_display_name()
-                node_class = await child.read_node_class()
-                
-                print(f"{i}. NodeId: {child.nodeid}")
-                print(f"   BrowseName: {browse_name.Name}")
-                print(f"   DisplayName: {display_name.Text}")
-                print(f"   NodeClass: {node_class.name}")
-                print("---")
+                base = (i - 1) * 3
+                browse_name = results[base].Value.Value
+                display_name = results[base + 1].Value.Value
+                node_class = ua.NodeClass(results[base + 2].Value.Value)
+
+                lines.append(
+                    f"{i}. NodeId: {child.nodeid}\n"
+                    f"   BrowseName: {browse_name.Name}\n"
+                    f"   DisplayName: {display_name.Text}\n"
+                    f"   NodeClass: {node_class.name}\n"
+                    "---")
+            sys.stdout.write("\n".join(lines) + "\n")
                 
         elif option == "2":
             # 재귀적 탐색
-            node_id_input = input("Enter starting NodeId (or press Enter for root): ")
+            node_id_input = await _ainput("Enter starting NodeId (or press Enter for root): ")
             
             if not node_id_input:
                 node_id_input = None
                 
             # 탐색 깊이 입력
-            max_depth = int(input("Enter max depth (1-5) [2]: ") or "2")
+            max_depth = int(await _ainput("Enter max depth (1-5) [2]: ") or "2")
             max_depth = max(1, min(max_depth, 5))  # 1-5 사이로 제한
             
             print(f"Browsing nodes under {node_id_input or 'root'} with depth {max_depth}...")
-            tree = await node.browse_nodes_recursive(active_connection, node_id_input, max_depth)
+            tree = await node.browse_nodes_recursive(browse_client, node_id_input, max_depth)
             
             # 트리 형태로 출력
             print("Node hierarchy:")
-            await _print_node_tree(tree)
+            _print_node_tree(tree)
             
         elif option == "3":
             # 이름으로 노드 검색
-            name_pattern = input("Enter name pattern to search for: ")
+            name_pattern = await _ainput("Enter name pattern to search for: ")
             if not name_pattern:
                 print("Search pattern is required")
                 return
                 
-            start_node = input("Enter starting NodeId (or press Enter for root): ") or None
-            case_sensitive = input("Case sensitive search? (y/n) [n]: ").lower() == 'y'
+            start_node = await _ainput("Enter starting NodeId (or press Enter for root): ") or None
+            case_sensitive = (await _ainput("Case sensitive search? (y/n) [n]: ")).lower() == 'y'
             
             print(f"Searching for nodes containing '{name_pattern}'...")
             nodes = await node.find_nodes_by_name(
-                active_connection, 
+                browse_client, 
                 name_pattern, 
                 start_node, 
                 case_sensitive
@@ -258,10 +514,17 @@ async def handle_browse_nodes():
                 return
                 
             print(f"Found {len(nodes)} matching nodes:")
+
+            # 검색 결과 전체의 속성을 하나의 ReadRequest로 일괄 조회
+            results = await _batch_read_attributes(
+                browse_client, nodes,
+                (ua.AttributeIds.DisplayName, ua.AttributeIds.NodeClass))
+
             for i, found_node in enumerate(nodes, 1):
+                base = (i - 1) * 2
                 try:
-                    display_name = await found_node.read_display_name()
-                    node_class = await found_node.read_node_class()
+                    display_name = results[base].Value.Value
+                    node_class = ua.NodeClass(results[base + 1].Value.Value)
                     print(f"{i}. {display_name.Text} ({found_node.nodeid}) - {node_class.name}")
                 except Exception as e:
                     print(f"{i}. {found_node.nodeid} - Error: {e}")
@@ -275,14 +538,23 @@ async def handle_browse_nodes():
         print(f"Failed to browse nodes: {e}")
 
 
-async def _print_node_tree(node_info, indent=0):
-    """노드 트리를 계층적으로 출력"""
-    # 현재 노드 출력
-    print(f"{' ' * indent}├─ {node_info['DisplayName']} ({node_info['NodeId']}) - {node_info['NodeClass']}")
-    
-    # 자식 노드들을 재귀적으로 출력
-    for child in node_info.get('Children', []):
-        await _print_node_tree(child, indent + 2)
+# 트리 출력용 명시적 스택 - 호출마다 새로 할당하지 않고 재사용
+_print_stack = []
+
+
+def _print_node_tree(node_info, indent=0):
+    """노드 트리를 계층적으로 출력 (재귀 대신 명시적 스택 사용)"""
+    stack = _print_stack
+    stack.clear()
+    stack.append((node_info, indent))
+    lines = []
+    while stack:
+        current, ind = stack.pop()
+        lines.append(f"{' ' * ind}├─ {current['DisplayName']} ({current['NodeId']}) - {current['NodeClass']}")
+        # pop 순서가 뒤집히므로 자식을 역순으로 쌓아 원래 출력 순서를 유지
+        stack.extend((child, ind + 2) for child in reversed(current.get('Children', [])))
+    # 노드당 print 1회 대신 트리 전체를 한 번의 write로 출력
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 async def handle_read_node():
@@ -296,14 +568,14 @@ async def handle_read_node():
         print("1. Read Value attribute")
         print("2. Read specific attribute")
         print("3. Read all attributes")
-        option = input("\nSelect option [1]: ") or "1"
+        option = await _ainput("\nSelect option [1]: ") or "1"
         
         # Get node identifier from user
-        node_id_input = input("Enter the NodeId (e.g., 'ns=1;i=1001' or 'i=2258'): ")
+        node_id_input = await _ainput("Enter the NodeId (e.g., 'ns=1;i=1001' or 'i=2258'): ")
         
         if node_id_input.lower() == 'server time':
             # Special case for server time
-            server_time_node = active_connection.get_node(ua.NodeId(2258, 0))  # Server current time node
+            server_time_node = active_connection.get_node(_SERVER_TIME_NODEID)  # Server current time node
             server_time = await server_time_node.read_value()
             print(f"Server time: {server_time}")
             return
@@ -329,7 +601,7 @@ async def handle_read_node():
             ]:
                 print(f"{attr_id.value}: {name}")
                 
-            attr_id_input = input("Enter attribute ID [13 for Value]: ") or "13"
+            attr_id_input = await _ainput("Enter attribute ID [13 for Value]: ") or "13"
             try:
                 attr_id = ua.AttributeIds(int(attr_id_input))
                 attr_value = await node.read_node_attribute(active_connection, node_id_input, attr_id)
@@ -349,10 +621,7 @@ async def handle_read_node():
             print(f"\nAttributes for node {node_id_input}:")
             for name, value in attributes.items():
                 # 값이 너무 길면 요약
-                value_str = str(value)
-                if len(value_str) > 100:
-                    value_str = f"{value_str[:100]}... [내용 생략]"
-                print(f"{name}: {value_str}")
+                print(f"{name}: {_format_value_short(value, 100)}")
         else:
             print("Invalid option")
             
@@ -370,19 +639,12 @@ async def handle_write_node():
     
     try:
         # Get node identifier and value from user
-        node_id_input = input("Enter the NodeId (e.g., 'ns=1;i=1001'): ")
-        value_input = input("Enter the value to write: ")
-        data_type = input("Enter the data type (int, float, bool, string) [default: string]: ").lower()
+        node_id_input = await _ainput("Enter the NodeId (e.g., 'ns=1;i=1001'): ")
+        value_input = await _ainput("Enter the value to write: ")
+        data_type = (await _ainput("Enter the data type (int, float, bool, string) [default: string]: ")).lower()
         
         # Convert input to the specified data type
-        if data_type == "int":
-            value = int(value_input)
-        elif data_type == "float":
-            value = float(value_input)
-        elif data_type == "bool":
-            value = value_input.lower() in ("true", "yes", "1", "y")
-        else:  # Default to string
-            value = value_input
+        value = _COERCERS.get(data_type, str)(value_input)
             
         # Write the value to the node
         await node.write_node_attribute(active_connection, node_id_input, value)
@@ -404,12 +666,12 @@ async def handle_call_method():
         print("\n=== Call Method ===")
         print("1. Direct method call")
         print("2. Browse and find methods")
-        option = input("\nSelect option [1]: ") or "1"
+        option = await _ainput("\nSelect option [1]: ") or "1"
         
         if option == "1":
             # 직접 메서드 호출
-            object_id_input = input("Enter object NodeId (parent node): ")
-            method_id_input = input("Enter method NodeId: ")
+            object_id_input = await _ainput("Enter object NodeId (parent node): ")
+            method_id_input = await _ainput("Enter method NodeId: ")
             
             # 메서드 정보 가져오기
             try:
@@ -437,26 +699,17 @@ async def handle_call_method():
                 print(f"Failed to get method info: {e}")
             
             # 입력 인자 수집
-            has_inputs = input("Does this method require input arguments? (y/n): ").lower() == 'y'
+            has_inputs = (await _ainput("Does this method require input arguments? (y/n): ")).lower() == 'y'
             input_args = []
             
             if has_inputs:
-                num_args = int(input("How many input arguments? "))
+                num_args = int(await _ainput("How many input arguments? "))
                 for i in range(num_args):
-                    arg_type = input(f"Argument {i+1} type (int, float, bool, string): ").lower()
-                    arg_value = input(f"Argument {i+1} value: ")
+                    arg_type = (await _ainput(f"Argument {i+1} type (int, float, bool, string): ")).lower()
+                    arg_value = await _ainput(f"Argument {i+1} value: ")
                     
                     # Convert input to the specified data type
-                    if arg_type == "int":
-                        value = int(arg_value)
-                    elif arg_type == "float":
-                        value = float(arg_value)
-                    elif arg_type == "bool":
-                        value = arg_value.lower() in ("true", "yes", "1", "y")
-                    else:  # Default to string
-                        value = arg_value
-                        
-                    input_args.append(value)
+                    input_args.append(_COERCERS.get(arg_type, str)(arg_value))
             
             # Call the method
             print(f"Calling method {method_id_input} on object {object_id_input}...")
@@ -466,7 +719,8 @@ async def handle_call_method():
             
         elif option == "2":
             # 메서드 찾기
-            parent_id = input("Enter starting node to find methods (default is Objects): ") or "i=85"
+            # 빈 입력이면 find_methods가 미리 만든 Objects NodeId를 사용
+            parent_id = await _ainput("Enter starting node to find methods (default is Objects): ") or None
             
             print(f"Searching for methods under {parent_id}...")
             methods = await method.find_methods(active_connection, parent_id)
@@ -481,7 +735,7 @@ async def handle_call_method():
                 print(f"   Parent: {m['ParentId']}")
                 
             # 메서드 선택
-            selection = input("\nSelect method to call (number) or 0 to cancel: ")
+            selection = await _ainput("\nSelect method to call (number) or 0 to cancel: ")
             if selection == "0" or not selection:
                 return
                 
@@ -515,7 +769,7 @@ async def handle_call_method():
                 for i, arg in enumerate(input_args_info, 1):
                     arg_name = arg.get('Name', f'Argument {i}')
                     arg_type = arg.get('DataType', 'String')
-                    arg_value = input(f"Enter value for {arg_name} ({arg_type}): ")
+                    arg_value = await _ainput(f"Enter value for {arg_name} ({arg_type}): ")
                     input_values.append(arg_value)
                     
                 # 메서드 호출 (자동 타입 변환)
@@ -559,10 +813,14 @@ async def handle_create_subscription():
     try:
         print("\n=== Create Subscription ===")
         # 구독 파라미터 수집
-        publishing_interval = float(input("Enter publishing interval in ms [1000]: ") or "1000")
-        lifetime_count = int(input("Enter lifetime count [2400]: ") or "2400")
-        max_keep_alive_count = int(input("Enter max keep alive count [10]: ") or "10")
-        priority = int(input("Enter priority [0]: ") or "0")
+        try:
+            publishing_interval = _COERCERS["float"](await _ainput("Enter publishing interval in ms [1000]: ") or "1000")
+            lifetime_count = _COERCERS["int"](await _ainput("Enter lifetime count [2400]: ") or "2400")
+            max_keep_alive_count = _COERCERS["int"](await _ainput("Enter max keep alive count [10]: ") or "10")
+            priority = _COERCERS["int"](await _ainput("Enter priority [0]: ") or "0")
+        except ValueError:
+            print("Invalid numeric parameter value")
+            return
         
         # 개선된 구독 생성 함수 사용
         sub = await subscription.create_subscription(
@@ -575,13 +833,13 @@ async def handle_create_subscription():
         
         # 구독 ID 생성 및 저장
         subscription_counter += 1
-        active_subscriptions[subscription_counter] = (sub, [])
+        active_subscriptions[subscription_counter] = SubRecord(sub)
         
         print(f"Created subscription with ID: {subscription_counter}")
         print(f"Server-assigned subscription ID: {sub.subscription_id}")
         
         # 모니터링 항목 추가 여부
-        add_items = input("Add monitored items now? (y/n): ").lower() == 'y'
+        add_items = (await _ainput("Add monitored items now? (y/n): ")).lower() == 'y'
         if add_items:
             await handle_create_monitored_item()
         
@@ -600,36 +858,43 @@ async def handle_create_monitored_item():
         print("Not connected to any server")
         return
     
-    # Check connection status
+    # Check connection status - 최근 생존 신호가 있으면 확인용 Read를 생략
     try:
-        # Simple check to verify connection is still active
-        await active_connection.get_namespace_array()
+        if not _connection_is_fresh():
+            # Simple check to verify connection is still active
+            await active_connection.get_namespace_array()
+            _mark_alive()
     except Exception as conn_err:
         print(f"Connection issue detected: {conn_err}")
-        reconnect = input("Try to reconnect? (y/n): ").lower() == 'y'
+        reconnect = (await _ainput("Try to reconnect? (y/n): ")).lower() == 'y'
         if reconnect:
+            if _circuit_is_open():
+                print("Too many recent reconnect failures; waiting before retrying")
+                return
             try:
-                # Try to close existing connection gracefully
+                # Try to close existing connection gracefully - 대기 시간 제한
                 try:
-                    await connection.close_session(active_connection)
+                    await _close_session_bounded(active_connection)
                 except:
                     pass
                 
-                # Reconnect to server
+                # Reconnect to server - 지수 백오프 + 지터로 일시적 장애를 견딤
                 print(f"Reconnecting to {SERVER_URL}...")
-                active_connection = await connection.create_session(SERVER_URL)
+                active_connection = await connection.reconnect_with_backoff(SERVER_URL)
+                _record_reconnect_success()
                 print(f"Reconnected successfully")
-                logging.info(f"Reconnected to {SERVER_URL}")
+                logging.info("Reconnected to %s", SERVER_URL)
                 
                 # User might need to recreate subscriptions
                 if active_subscriptions:
-                    recreate = input("Previous subscriptions may be invalid. Create a new subscription? (y/n): ").lower() == 'y'
+                    recreate = (await _ainput("Previous subscriptions may be invalid. Create a new subscription? (y/n): ")).lower() == 'y'
                     if recreate:
                         await handle_create_subscription()
                         return
             except Exception as re_err:
+                _record_reconnect_failure()
                 print(f"Failed to reconnect: {re_err}")
-                logging.error(f"Failed to reconnect: {re_err}")
+                logging.error("Failed to reconnect: %s", re_err)
                 return
         else:
             return
@@ -637,7 +902,7 @@ async def handle_create_monitored_item():
     # List active subscriptions
     if not active_subscriptions:
         print("No active subscriptions. Create a subscription first.")
-        create_new = input("Create a new subscription now? (y/n): ").lower() == 'y'
+        create_new = (await _ainput("Create a new subscription now? (y/n): ")).lower() == 'y'
         if create_new:
             await handle_create_subscription()
         else:
@@ -648,62 +913,74 @@ async def handle_create_monitored_item():
             return
     
     print("\nActive subscriptions:")
-    for sub_id, (sub, items) in active_subscriptions.items():
-        print(f"{sub_id}. Server ID: {sub.subscription_id} (Items: {len(items)})")
+    for sub_id, record in active_subscriptions.items():
+        print(f"{sub_id}. Server ID: {record.sub.subscription_id} (Items: {len(record.by_handle)})")
     
     try:
-        sub_id = int(input("\nSelect subscription ID: "))
+        sub_id = int(await _ainput("\nSelect subscription ID: "))
         if sub_id not in active_subscriptions:
             print("Invalid subscription selection")
             return
         
-        sub, monitored_items = active_subscriptions[sub_id]
+        record = active_subscriptions[sub_id]
+        sub = record.sub
     except ValueError:
         print("Invalid subscription ID")
         return
     
-    # Get node to monitor
-    node_id = input("Enter node ID to monitor: ")
-    if not node_id:
+    # Get node(s) to monitor - 쉼표로 구분하면 한 번의 요청으로 일괄 등록
+    node_id_input = await _ainput("Enter node ID to monitor (comma-separated for multiple): ")
+    node_ids = [part.strip() for part in node_id_input.split(',') if part.strip()]
+    if not node_ids:
         print("Node ID is required")
         return
-    
+
+    node_id = node_ids[0]
+
     # Validate node exists before trying to subscribe
-    try:
-        test_node = active_connection.get_node(node_id)
+    # (일괄 등록 시에는 서버가 항목별 상태를 돌려주므로 개별 확인을 생략)
+    if len(node_ids) == 1:
         try:
-            # Attempt to read something from the node to verify it's accessible
-            await test_node.read_browse_name()
-            print(f"Node {node_id} verified as accessible")
-        except Exception as browse_err:
-            print(f"Warning: Node exists but might not be fully accessible: {browse_err}")
-            print("Some nodes might be writable but not readable, or have restricted access")
-            if input("Continue anyway? (y/n): ").lower() != 'y':
+            test_node = _get_cached_node(active_connection, node_id)
+            try:
+                # Attempt to read something from the node to verify it's accessible
+                browse_name = await test_node.read_browse_name()
+                # 등록 시점에 한 번만 이름을 캐시해 콜백에서의 왕복을 제거
+                _browse_name_cache[node_id] = browse_name.Name
+                _browse_name_cache[str(test_node.nodeid)] = browse_name.Name
+                print(f"Node {node_id} verified as accessible")
+            except Exception as browse_err:
+                print(f"Warning: Node exists but might not be fully accessible: {browse_err}")
+                print("Some nodes might be writable but not readable, or have restricted access")
+                if (await _ainput("Continue anyway? (y/n): ")).lower() != 'y':
+                    return
+        except Exception as node_err:
+            print(f"Error: Could not access node {node_id}: {node_err}")
+            if (await _ainput("Continue anyway? (y/n): ")).lower() != 'y':
                 return
-    except Exception as node_err:
-        print(f"Error: Could not access node {node_id}: {node_err}")
-        if input("Continue anyway? (y/n): ").lower() != 'y':
-            return
     
     # Get sampling interval
     try:
-        sampling_interval = float(input("Enter sampling interval in ms [100]: ") or "100")
+        sampling_interval = float(await _ainput("Enter sampling interval in ms [100]: ") or "100")
     except ValueError:
         print("Invalid sampling interval, using default value of 100ms")
         sampling_interval = 100.0
     
     # Advanced options
-    store_values = input("Store values for analysis? (y/n): ").lower() == 'y'
+    store_values = (await _ainput("Store values for analysis? (y/n): ")).lower() == 'y'
     max_values = 100
     if store_values:
         try:
-            max_values = int(input("Maximum values to store [100]: ") or "100")
+            max_values = int(await _ainput("Maximum values to store [100]: ") or "100")
         except ValueError:
             max_values = 100
     
+    # 고속 구독에서는 출력 자체가 병목이 되므로 끌 수 있게 함
+    log_changes = (await _ainput("Print value changes? (y/n) [y]: ") or "y").lower() != 'n'
+    
     # Setup handler options
     handler_options = {
-        "log_changes": True,
+        "log_changes": log_changes,
         "store_values": store_values,
         "max_values": max_values,
         "timestamp_values": True
@@ -711,25 +988,55 @@ async def handle_create_monitored_item():
     
     try:
         async def data_change_callback(node, value, data):
+            # 수신 경로는 큐 삽입만 수행 - 포맷/출력은 프린터 태스크가 처리
             try:
-                node_id_str = str(node.nodeid)
-                try:
-                    display_name = await node.read_browse_name()
-                    name = display_name.Name
-                except:
-                    name = node_id_str
-                
-                value_str = str(value)
-                if len(value_str) > 60:
-                    value_str = f"{value_str[:60]}..."
-                print(f"Data change: {name} ({node_id_str}) = {value_str}")
+                _mark_alive()  # 알림 수신 자체가 연결 생존 증거
+                if not log_changes:
+                    return
+                _enqueue_notification(_nodeid_str(node), value)
             except Exception as e:
-                print(f"Error in callback: {e}")
-                logger.error(f"Error in data change callback: {e}")
+                logger.error("Error in data change callback: %s", e)
         
+        # 여러 노드는 하나의 CreateMonitoredItems 요청으로 등록
+        if len(node_ids) > 1:
+            print(f"Adding {len(node_ids)} monitored items in one request...")
+
+            # 콜백에서 쓸 BrowseName을 단일 ReadRequest로 미리 캐시
+            try:
+                bulk_nodes = [_get_cached_node(active_connection, single_id) for single_id in node_ids]
+                name_results = await _batch_read_attributes(
+                    active_connection, bulk_nodes, (ua.AttributeIds.BrowseName,))
+                for single_id, bulk_node, result in zip(node_ids, bulk_nodes, name_results):
+                    qname = getattr(result.Value, 'Value', None)
+                    if qname is not None:
+                        _browse_name_cache[single_id] = qname.Name
+                        _browse_name_cache[str(bulk_node.nodeid)] = qname.Name
+            except Exception as name_err:
+                logging.warning("Could not prefetch browse names: %s", name_err)
+
+            handles = await subscription.subscribe_data_change(
+                sub,
+                node_ids,
+                data_change_callback,
+                sampling_interval,
+                advanced_handler_options=handler_options
+            )
+
+            for single_id, handle in zip(node_ids, handles):
+                record.add_item({
+                    'handle': handle,
+                    'node_id': single_id,
+                    'sampling_interval': sampling_interval,
+                    'handler_options': handler_options
+                })
+
+            print(f"Successfully created {len(handles)} monitored items")
+            logging.info("Added %s monitored items to subscription %s", len(handles), sub_id)
+            return
+
         # Show message to user before potentially long operation
         print(f"Adding monitored item for node {node_id}...")
-        
+
         # Subscribe to data changes
         try:
             handle = await subscription.subscribe_data_change(
@@ -741,7 +1048,7 @@ async def handle_create_monitored_item():
             )
             
             # Store this monitored item
-            monitored_items.append({
+            record.add_item({
                 'handle': handle,
                 'node_id': node_id,
                 'sampling_interval': sampling_interval,
@@ -749,26 +1056,30 @@ async def handle_create_monitored_item():
             })
             
             print(f"Successfully created monitored item with handle {handle}")
-            logging.info(f"Added monitored item for node {node_id} to subscription {sub_id}")
+            logging.info("Added monitored item for node %s to subscription %s", node_id, sub_id)
             
         except Exception as sub_err:
-            logger.error(f"Failed to create monitored item: {sub_err}")
+            logger.error("Failed to create monitored item: %s", sub_err)
             print(f"Error: {sub_err}")
             
             # Check if error is related to connection issues
             if "connection" in str(sub_err).lower() or "closed" in str(sub_err).lower():
                 print("Connection issue detected. The server may have disconnected.")
-                reconnect = input("Try to reconnect and retry? (y/n): ").lower() == 'y'
+                reconnect = (await _ainput("Try to reconnect and retry? (y/n): ")).lower() == 'y'
                 if reconnect:
+                    if _circuit_is_open():
+                        print("Too many recent reconnect failures; waiting before retrying")
+                        return
                     try:
-                        # Reconnect to server
+                        # Reconnect to server - 종료 대기 시간 제한
                         try:
-                            await connection.close_session(active_connection)
+                            await _close_session_bounded(active_connection)
                         except:
                             pass
                         
                         print(f"Reconnecting to {SERVER_URL}...")
-                        active_connection = await connection.create_session(SERVER_URL)
+                        active_connection = await connection.reconnect_with_backoff(SERVER_URL)
+                        _record_reconnect_success()
                         print(f"Reconnected successfully. Creating new subscription...")
                         
                         # Create a new subscription with same parameters
@@ -786,7 +1097,7 @@ async def handle_create_monitored_item():
                             )
                             
                             # Replace old subscription with new one
-                            active_subscriptions[sub_id] = (new_sub, [])
+                            active_subscriptions[sub_id] = SubRecord(new_sub)
                             
                             # Try again with monitored item
                             handle = await subscription.subscribe_data_change(
@@ -798,10 +1109,10 @@ async def handle_create_monitored_item():
                             )
                             
                             # Update the monitored items list
-                            monitored_items = []
-                            active_subscriptions[sub_id] = (new_sub, monitored_items)
+                            record = SubRecord(new_sub)
+                            active_subscriptions[sub_id] = record
                             
-                            monitored_items.append({
+                            record.add_item({
                                 'handle': handle,
                                 'node_id': node_id,
                                 'sampling_interval': sampling_interval,
@@ -809,15 +1120,16 @@ async def handle_create_monitored_item():
                             })
                             
                             print(f"Successfully created monitored item after reconnection!")
-                            logging.info(f"Added monitored item for node {node_id} after reconnection")
+                            logging.info("Added monitored item for node %s after reconnection", node_id)
                             
                         except Exception as retry_err:
                             print(f"Failed to create subscription or monitored item after reconnection: {retry_err}")
-                            logging.error(f"Retry failed: {retry_err}")
+                            logging.error("Retry failed: %s", retry_err)
                             
                     except Exception as conn_err:
+                        _record_reconnect_failure()
                         print(f"Failed to reconnect: {conn_err}")
-                        logging.error(f"Reconnection failed: {conn_err}")
+                        logging.error("Reconnection failed: %s", conn_err)
             
             # Check if error might be related to server limitations
             elif "limit" in str(sub_err).lower() or "capacity" in str(sub_err).lower():
@@ -831,11 +1143,11 @@ async def handle_create_monitored_item():
                 print("You may not have permission to monitor this node.")
                 
     except Exception as e:
-        logger.error(f"Failed to create monitored item: {e}")
+        logger.error("Failed to create monitored item: %s", e)
         print(f"Error: {e}")
         
     # Ask if user wants to add another item
-    if input("\nAdd another monitored item? (y/n): ").lower() == 'y':
+    if (await _ainput("\nAdd another monitored item? (y/n): ")).lower() == 'y':
         await handle_create_monitored_item()
 
 
@@ -849,7 +1161,7 @@ async def handle_subscribe_data_change():
     
     # Create subscription if none exists
     if not active_subscriptions:
-        create_new = input("No active subscriptions. Create a new subscription? (y/n): ").lower() == 'y'
+        create_new = (await _ainput("No active subscriptions. Create a new subscription? (y/n): ")).lower() == 'y'
         if create_new:
             await handle_create_subscription()
         else:
@@ -861,102 +1173,120 @@ async def handle_subscribe_data_change():
     
     # List active subscriptions
     print("\nActive subscriptions:")
-    for sub_id, (sub, _) in active_subscriptions.items():
-        print(f"{sub_id}. Server ID: {sub.subscription_id}")
+    for sub_id, record in active_subscriptions.items():
+        print(f"{sub_id}. Server ID: {record.sub.subscription_id}")
     
-    sub_choice = input("\nSelect subscription ID: ")
+    sub_choice = await _ainput("\nSelect subscription ID: ")
     try:
         sub_id = int(sub_choice)
         if sub_id not in active_subscriptions:
             print("Invalid subscription selection")
             return
         
-        sub, monitored_items = active_subscriptions[sub_id]
+        record = active_subscriptions[sub_id]
+        sub = record.sub
     except (ValueError, KeyError):
         print("Invalid subscription ID")
         return
     
-    # Allow multiple nodes to be monitored
+    # 고속 구독에서는 출력 자체가 병목이 되므로 끌 수 있게 함
+    log_changes = ((await _ainput("Print value changes? (y/n) [y]: ")) or "y").lower() != 'n'
+    
+    # 반복마다 바뀌지 않는 핸들러 옵션은 루프 밖에서 한 번만 구성
+    base_opts = {"log_changes": log_changes, "timestamp_values": True}
+    
+    # 입력을 먼저 모두 수집한 뒤 단일 CreateMonitoredItems 요청으로 등록
+    pending = []
     while True:
         # Get node to monitor
-        node_id = input("\nEnter node ID to monitor (empty to finish): ")
+        node_id = await _ainput("\nEnter node ID to monitor (empty to finish): ")
         if not node_id:
             break
         
         # Get sampling interval
         try:
-            sampling_interval = float(input("Enter sampling interval in ms [100]: ") or "100")
+            sampling_interval = float(await _ainput("Enter sampling interval in ms [100]: ") or "100")
         except ValueError:
             print("Invalid sampling interval")
             continue
         
         # Advanced options
-        store_values = input("Store values for analysis? (y/n): ").lower() == 'y'
+        store_values = (await _ainput("Store values for analysis? (y/n): ")).lower() == 'y'
         max_values = 100
         if store_values:
             try:
-                max_values = int(input("Maximum values to store [100]: ") or "100")
+                max_values = int(await _ainput("Maximum values to store [100]: ") or "100")
             except ValueError:
                 max_values = 100
         
         # Setup handler options
-        handler_options = {
-            "log_changes": True,
-            "store_values": store_values,
-            "max_values": max_values,
-            "timestamp_values": True
-        }
+        handler_options = {**base_opts, "store_values": store_values, "max_values": max_values}
         
-        try:
-            # Define callback for data changes
-            async def data_change_callback(node, value, data):
-                try:
-                    node_id_str = str(node.nodeid)
-                    try:
-                        display_name = await node.read_browse_name()
-                        name = display_name.Name
-                    except:
-                        name = node_id_str
-                        
-                    value_str = str(value)
-                    if len(value_str) > 60:
-                        value_str = f"{value_str[:60]}..."
-                    print(f"Data change: {name} ({node_id_str}) = {value_str}")
-                except Exception as e:
-                    print(f"Error in callback: {e}")
-            
-            # Subscribe to data changes
-            try:
-                handle = await subscription.subscribe_data_change(
-                    sub,
-                    node_id,
-                    data_change_callback,
-                    sampling_interval,
-                    advanced_handler_options=handler_options
-                )
-                
-                # Store information about this monitored item
-                monitored_items.append({
-                    'handle': handle,
-                    'node_id': node_id,
-                    'sampling_interval': sampling_interval,
-                    'handler_options': handler_options
-                })
-                
-                print(f"Successfully subscribed to data changes for {node_id}")
-                logging.info(f"Added monitored item for node {node_id} to subscription {sub_id}")
-                
-            except Exception as e:
-                logger.error(f"Failed to subscribe to data changes: {e}")
-                print(f"Error subscribing to node {node_id}: {e}")
-        except Exception as e:
-            logger.error(f"Error setting up data change subscription: {e}")
-            print(f"Error: {e}")
+        pending.append((node_id, sampling_interval, handler_options))
         
         # Ask if user wants to add more nodes
-        if input("Subscribe to another node? (y/n): ").lower() != 'y':
+        if (await _ainput("Subscribe to another node? (y/n): ")).lower() != 'y':
             break
     
+    if not pending:
+        print("No nodes selected")
+        return
+    
+    # 구독 전에 BrowseName을 일괄 조회해 캐시 - 콜백이 알림마다
+    # read_browse_name() 왕복을 하지 않고 딕셔너리 조회만 하도록 함
+    node_ids = [entry[0] for entry in pending]
+    try:
+        name_nodes = [_get_cached_node(active_connection, single_id) for single_id in node_ids]
+        name_results = await _batch_read_attributes(
+            active_connection, name_nodes, (ua.AttributeIds.BrowseName,))
+        for single_id, node_obj, result in zip(node_ids, name_nodes, name_results):
+            try:
+                name = result.Value.Value.Name
+                _browse_name_cache[single_id] = name
+                _browse_name_cache[str(node_obj.nodeid)] = name
+            except Exception:
+                pass
+    except Exception as e:
+        logger.warning("Could not prefetch browse names: %s", e)
+    
+    # Define callback for data changes - 출력이 꺼져 있으면 즉시 반환
+    async def data_change_callback(node, value, data):
+        if not log_changes:
+            return
+        try:
+            node_id_str = _nodeid_str(node)
+            name = _browse_name_cache.get(node_id_str, node_id_str)
+            value_str = _format_value_short(value, 60)
+            print(f"Data change: {name} ({node_id_str}) = {value_str}")
+        except Exception as e:
+            print(f"Error in callback: {e}")
+    
+    try:
+        handles = await subscription.subscribe_data_changes(
+            sub,
+            node_ids,
+            data_change_callback,
+            sampling_intervals=[entry[1] for entry in pending],
+            advanced_handler_options_list=[entry[2] for entry in pending]
+        )
+        
+        # Store information about the monitored items
+        for (node_id, sampling_interval, handler_options), handle in zip(pending, handles):
+            record.add_item({
+                'handle': handle,
+                'node_id': node_id,
+                'sampling_interval': sampling_interval,
+                'handler_options': handler_options
+            })
+            print(f"Successfully subscribed to data changes for {node_id}")
+        
+        logging.info("Added %s monitored item(s) to subscription %s in batch", len(pending), sub_id)
+        
+    except Exception as e:
+        logger.error("Failed to subscribe to data changes: %s", e)
+        print(f"Error subscribing to nodes: {e}")
+        return
+    
     print(f"Data change subscriptions configured. Changes will be printed as they occur.")
 
 
@@ -972,17 +1302,18 @@ async def handle_modify_subscription():
         print("\n=== Modify Subscription ===")
         # 구독 목록 표시
         print("Active subscriptions:")
-        for sub_id, (sub, items) in active_subscriptions.items():
-            print(f"{sub_id}: Server ID {sub.subscription_id} (Items: {len(items)})")
+        for sub_id, record in active_subscriptions.items():
+            print(f"{sub_id}: Server ID {record.sub.subscription_id} (Items: {len(record.by_handle)})")
         
         # 구독 선택
         try:
-            sub_id = int(input("Enter subscription ID to modify: "))
+            sub_id = int(await _ainput("Enter subscription ID to modify: "))
             if sub_id not in active_subscriptions:
                 print(f"Subscription with ID {sub_id} not found")
                 return
                 
-            sub, monitored_items = active_subscriptions[sub_id]
+            record = active_subscriptions[sub_id]
+            sub = record.sub
         except ValueError:
             print("Invalid subscription ID")
             return
@@ -992,13 +1323,14 @@ async def handle_modify_subscription():
         print("1. Change publishing parameters")
         print("2. Set publishing mode")
         print("3. Add monitored item")
-        option = input("Select option [1]: ") or "1"
+        print("4. Bulk change sampling interval")
+        option = await _ainput("Select option [1]: ") or "1"
         
         if option == "1":
             # 구독 파라미터 수정
-            publishing_interval = float(input("Enter new publishing interval in ms [1000]: ") or "1000")
-            lifetime_count = int(input("Enter new lifetime count [2400]: ") or "2400")
-            max_keep_alive_count = int(input("Enter new max keep alive count [10]: ") or "10")
+            publishing_interval = float(await _ainput("Enter new publishing interval in ms [1000]: ") or "1000")
+            lifetime_count = int(await _ainput("Enter new lifetime count [2400]: ") or "2400")
+            max_keep_alive_count = int(await _ainput("Enter new max keep alive count [10]: ") or "10")
             
             # 구독 수정
             result = await subscription.modify_subscription(
@@ -1028,13 +1360,13 @@ async def handle_modify_subscription():
                     print(f"New lifetime count: {lifetime_count}")
                     print(f"New max keep alive count: {max_keep_alive_count}")
                 
-                logging.info(f"Modified subscription {sub_id}")
+                logging.info("Modified subscription %s", sub_id)
             else:
                 print(f"Failed to modify subscription {sub_id}")
                 
         elif option == "2":
             # 발행 모드 설정
-            mode_input = input("Enter publishing mode (enabled/disabled) [enabled]: ").lower()
+            mode_input = (await _ainput("Enter publishing mode (enabled/disabled) [enabled]: ")).lower()
             publishing_enabled = mode_input != "disabled"
             
             # 발행 모드 설정
@@ -1043,7 +1375,7 @@ async def handle_modify_subscription():
             if result:
                 mode_str = "enabled" if publishing_enabled else "disabled"
                 print(f"Set publishing mode for subscription {sub_id} to {mode_str}")
-                logging.info(f"Set publishing mode for subscription {sub_id} to {mode_str}")
+                logging.info("Set publishing mode for subscription %s to %s", sub_id, mode_str)
             else:
                 print(f"Failed to set publishing mode for subscription {sub_id}")
             
@@ -1051,14 +1383,82 @@ async def handle_modify_subscription():
             # 모니터링 항목 추가 - use the existing handle_create_monitored_item functionality
             await handle_create_monitored_item()
             
+        elif option == "4":
+            # 모든 항목의 샘플링 주기를 단일 ModifyMonitoredItems 요청으로 변경
+            if not record.by_handle:
+                print("No monitored items in this subscription")
+                return
+            
+            try:
+                new_interval = float(await _ainput("Enter new sampling interval in ms [100]: ") or "100")
+            except ValueError:
+                print("Invalid sampling interval")
+                return
+            
+            entries = [(handle, new_interval, 1) for handle in record.by_handle]
+            results = await subscription.modify_monitored_items(sub, entries)
+            
+            changed = 0
+            for (handle, _interval, _queuesize), ok in zip(entries, results):
+                if ok:
+                    record.by_handle[handle]['sampling_interval'] = new_interval
+                    changed += 1
+            
+            print(f"Changed sampling interval on {changed}/{len(entries)} item(s)")
+            logging.info("Bulk-modified %s monitored items on subscription %s", changed, sub_id)
+            
         else:
             print("Invalid option")
         
     except Exception as e:
-        logging.error(f"Error modifying subscription: {e}")
+        logging.error("Error modifying subscription: %s", e)
         print(f"Failed to modify subscription: {e}")
 
 
+async def handle_set_publishing_mode():
+    """Handle setting the publishing mode of a subscription."""
+    global active_subscriptions
+    
+    if not active_subscriptions:
+        print("No active subscriptions")
+        return
+    
+    try:
+        print("\n=== Set Publishing Mode ===")
+        # 구독 목록 표시
+        print("Active subscriptions:")
+        for sub_id, record in active_subscriptions.items():
+            print(f"{sub_id}: Server ID {record.sub.subscription_id} (Items: {len(record.by_handle)})")
+        
+        # 구독 선택
+        try:
+            sub_id = int(await _ainput("Enter subscription ID: "))
+            if sub_id not in active_subscriptions:
+                print(f"Subscription with ID {sub_id} not found")
+                return
+            sub = active_subscriptions[sub_id].sub
+        except ValueError:
+            print("Invalid subscription ID")
+            return
+        
+        # 발행 모드 설정
+        mode_input = (await _ainput("Enter publishing mode (enabled/disabled) [enabled]: ")).lower()
+        publishing_enabled = mode_input != "disabled"
+        
+        result = await subscription.set_publishing_mode(sub, publishing_enabled)
+        
+        if result:
+            mode_str = "enabled" if publishing_enabled else "disabled"
+            print(f"Set publishing mode for subscription {sub_id} to {mode_str}")
+            logging.info("Set publishing mode for subscription %s to %s", sub_id, mode_str)
+        else:
+            print(f"Failed to set publishing mode for subscription {sub_id}")
+        
+    except Exception as e:
+        logging.error("Error setting publishing mode: %s", e)
+        print(f"Failed to set publishing mode: {e}")
+
+
 async def handle_delete_subscription():
     """Handle deleting a subscription."""
     global active_subscriptions
@@ -1071,44 +1471,42 @@ async def handle_delete_subscription():
         print("\n=== Delete Subscription ===")
         # 구독 목록 표시
         print("Active subscriptions:")
-        for sub_id, (sub, items) in active_subscriptions.items():
-            print(f"{sub_id}: Server ID {sub.subscription_id} (Items: {len(items)})")
+        for sub_id, record in active_subscriptions.items():
+            print(f"{sub_id}: Server ID {record.sub.subscription_id} (Items: {len(record.by_handle)})")
         
         # 구독 선택
-        sub_id_input = input("Enter subscription ID to delete (or 'all' for all): ")
+        sub_id_input = await _ainput("Enter subscription ID to delete (or 'all' for all): ")
         
         if sub_id_input.lower() == 'all':
-            # 모든 구독 삭제
+            # 모든 구독을 단일 DeleteSubscriptions 요청으로 삭제
+            sub_ids = list(active_subscriptions)
+            results = await subscription.delete_subscriptions(
+                [active_subscriptions[sub_id].sub for sub_id in sub_ids])
+            
             success_count = 0
             fail_count = 0
-            
-            for sub_id, (sub, _) in list(active_subscriptions.items()):
-                try:
-                    result = await subscription.delete_subscription(sub)
-                    if result:
-                        del active_subscriptions[sub_id]
-                        success_count += 1
-                    else:
-                        fail_count += 1
-                except Exception as e:
-                    logging.error(f"Error deleting subscription {sub_id}: {e}")
+            for sub_id, deleted in zip(sub_ids, results):
+                if deleted:
+                    del active_subscriptions[sub_id]
+                    success_count += 1
+                else:
                     fail_count += 1
                     
             print(f"Deleted {success_count} subscriptions, failed to delete {fail_count}")
-            logging.info(f"Deleted {success_count} subscriptions, failed {fail_count}")
+            logging.info("Deleted %s subscriptions, failed %s", success_count, fail_count)
             
         else:
             # 특정 구독 삭제
             try:
                 sub_id = int(sub_id_input)
                 if sub_id in active_subscriptions:
-                    sub, _ = active_subscriptions[sub_id]
+                    sub = active_subscriptions[sub_id].sub
                     result = await subscription.delete_subscription(sub)
                     
                     if result:
                         del active_subscriptions[sub_id]
                         print(f"Subscription {sub_id} deleted")
-                        logging.info(f"Subscription {sub_id} deleted")
+                        logging.info("Subscription %s deleted", sub_id)
                     else:
                         print(f"Failed to delete subscription {sub_id}")
                 else:
@@ -1117,7 +1515,7 @@ async def handle_delete_subscription():
                 print("Invalid subscription ID")
         
     except Exception as e:
-        logging.error(f"Error deleting subscription: {e}")
+        logging.error("Error deleting subscription: %s", e)
         print(f"Failed to delete subscription: {e}")
 
 
@@ -1129,4 +1527,38 @@ async def exit_application():
 
 
 if __name__ == "__main__":
-    print("This module should not be run directly. Run opcua_app.py instead.") 
\ No newline at end of file
+    print("This module should not be run directly. Run opcua_app.py instead.")
+
+# 메뉴 문자열과 디스패치 테이블 - 매 입력마다 dict 생성과 print 호출을 반복하지 않도록
+# 모든 핸들러가 정의된 뒤 모듈 수준에서 한 번만 구성합니다.
+_MENU_TEXT = "\n".join([
+    "",
+    "=== OPC UA Client Application Menu ===",
+    "1. Connect to OPC UA Server",
+    "2. Disconnect from OPC UA Server",
+    "3. Read Node Value",
+    "4. Write Node Value",
+    "5. Browse Server Nodes",
+    "6. Create Subscription",
+    "7. Modify Subscription",
+    "8. Subscribe to Data Change",
+    "9. Set Publishing Mode",
+    "10. Delete Subscription",
+    "11. Exit",
+    "=====================================",
+    "",
+])
+
+_HANDLERS = (
+    None,  # 0번 메뉴는 없음
+    handle_connect,
+    handle_disconnect,
+    handle_read_node,
+    handle_write_node,
+    handle_browse_nodes,
+    handle_create_subscription,
+    handle_modify_subscription,
+    handle_subscribe_data_change,
+    handle_set_publishing_mode,
+    handle_delete_subscription,
+)
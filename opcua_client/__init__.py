@@ -2,8 +2,23 @@
 OPC UA Client Python package.
 """
 
-from opcua_client.client import OpcUaClient
-from opcua_client.utils import setup_logging
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from opcua_client.client import OpcUaClient
+    from opcua_client.utils import setup_logging
 
 __version__ = "0.1.0"
-__all__ = ["OpcUaClient", "setup_logging"] 
\ No newline at end of file
+__all__ = ["OpcUaClient", "setup_logging"]
+
+
+def __getattr__(name):
+    # PEP 562 지연 임포트 - asyncua(crypto/XML 파서 포함)를 실제 사용 전에는
+    # 로드하지 않아 --help 같은 짧은 CLI 실행의 시작 시간을 줄입니다.
+    if name == "OpcUaClient":
+        from opcua_client.client import OpcUaClient
+        return OpcUaClient
+    if name == "setup_logging":
+        from opcua_client.utils import setup_logging
+        return setup_logging
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
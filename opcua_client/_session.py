@@ -0,0 +1,107 @@
+"""
+Session pool module for OPC UA client.
+
+method.py / node.py 의 함수들은 모두 살아 있는 Client를 인자로 받습니다.
+호출마다 Client를 새로 만들면 TCP 연결과 OPC UA 핸드셰이크 비용을
+매번 지불하게 되므로, 이 모듈의 get_session으로 URL당 미리 연결된
+장수(long-lived) Client를 재사용하세요.
+"""
+
+import asyncio
+import logging
+from typing import Dict, List
+
+from asyncua import Client, ua
+
+from opcua_client import connection
+
+logger = logging.getLogger(__name__)
+
+# 상태 확인용 - Server_ServerStatus_State (i=2259) 읽기는 가장 저렴한 요청
+_HEALTH_CHECK_NODEID = ua.NodeId(2259, 0)
+
+# URL별 연결 풀과 라운드로빈 인덱스
+_pools: Dict[str, List[Client]] = {}
+_pool_index: Dict[str, int] = {}
+_pool_locks: Dict[str, asyncio.Lock] = {}
+
+
+def _health_check_params() -> ua.ReadParameters:
+    params = ua.ReadParameters()
+    rv = ua.ReadValueId()
+    rv.NodeId = _HEALTH_CHECK_NODEID
+    rv.AttributeId = ua.AttributeIds.Value
+    params.NodesToRead.append(rv)
+    return params
+
+
+async def _is_healthy(client: Client) -> bool:
+    """가벼운 ServerStatus 읽기로 연결 상태를 확인합니다."""
+    try:
+        await client.uaclient.read(_health_check_params())
+        return True
+    except Exception:
+        return False
+
+
+async def get_session(url: str, *, max_clients: int = 4) -> Client:
+    """
+    URL에 대한 풀링된 Client를 얻습니다.
+
+    풀에 여유가 있으면 새로 연결하고, 가득 차면 라운드로빈으로
+    기존 Client를 재사용합니다. 반환 전 저렴한 상태 확인을 거쳐
+    죽은 연결은 교체합니다. call_method / read_node_attribute 등은
+    이 함수가 돌려주는 장수 Client와 함께 쓰도록 설계되었습니다.
+
+    Args:
+        url: The URL of the OPC UA server
+        max_clients: Maximum pooled connections per URL
+
+    Returns:
+        A connected Client instance (shared, do not disconnect directly;
+        use close_sessions)
+    """
+    lock = _pool_locks.setdefault(url, asyncio.Lock())
+    async with lock:
+        pool = _pools.setdefault(url, [])
+
+        if len(pool) < max_clients:
+            client = await connection.reconnect_with_backoff(url)
+            pool.append(client)
+            return client
+
+        index = _pool_index.get(url, 0) % len(pool)
+        _pool_index[url] = index + 1
+        client = pool[index]
+
+        if await _is_healthy(client):
+            return client
+
+        # 죽은 연결은 풀에서 교체
+        logger.info("Pooled session for %s is stale, reconnecting", url)
+        try:
+            await client.disconnect()
+        except Exception:
+            pass
+        client = await connection.reconnect_with_backoff(url)
+        pool[index] = client
+        return client
+
+
+async def close_sessions(url: str = None) -> None:
+    """
+    풀의 연결을 닫습니다.
+
+    Args:
+        url: 특정 URL의 풀만 닫기 (None이면 전체)
+    """
+    urls = [url] if url is not None else list(_pools)
+    for pool_url in urls:
+        pool = _pools.pop(pool_url, [])
+        _pool_index.pop(pool_url, None)
+        results = await asyncio.gather(
+            *(client.disconnect() for client in pool),
+            return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.debug("Error closing pooled session: %s", result)
@@ -40,7 +40,9 @@ class OpcUaClient:
         Args:
             security: Whether to use security (default: False)
         """
-        self.client = await connection.create_session(self.server_url, security)
+        self.client = await connection.reconnect_with_backoff(self.server_url, security)
+        # 생존 확인과 타입 정의 프리페치를 겹쳐 수행
+        await connection.activate_session(self.client)
         logger.info(f"Connected to {self.server_url}")
         
     async def disconnect(self) -> None:
@@ -48,15 +50,19 @@ class OpcUaClient:
         Disconnect from the OPC UA server.
         """
         if self.client:
-            # Delete all subscriptions
-            for sub in self.subscriptions:
-                try:
-                    await subscription.delete_subscription(sub)
-                except Exception as e:
-                    logger.error(f"Error deleting subscription: {e}")
+            # Delete all subscriptions - 순차 대기 대신 동시에 삭제
+            if self.subscriptions:
+                results = await asyncio.gather(
+                    *(subscription.delete_subscription(sub) for sub in self.subscriptions),
+                    return_exceptions=True)
+                for result in results:
+                    if isinstance(result, Exception):
+                        logger.error(f"Error deleting subscription: {result}")
                     
             # Close the session
             await connection.close_session(self.client)
+            node.clear_node_cache(self.client)
+            method.clear_method_caches(self.client)
             self.client = None
             logger.info("Disconnected from the server")
             
@@ -96,6 +102,35 @@ class OpcUaClient:
         self._check_connection()
         return await node.read_node_attribute(self.client, node_id, attribute)
         
+    async def read_nodes(
+        self,
+        node_ids: List[str],
+        attribute: ua.AttributeIds = ua.AttributeIds.Value
+    ) -> List[Any]:
+        """
+        Read an attribute from multiple nodes in a single request.
+        
+        노드 N개를 개별 read_node 호출로 읽으면 N번의 왕복이 들지만,
+        하나의 ReadRequest로 묶으면 1번의 왕복으로 끝납니다.
+        
+        Args:
+            node_ids: The IDs of the nodes to read from
+            attribute: The attribute to read (default: Value)
+            
+        Returns:
+            List of attribute values in the same order as node_ids
+        """
+        self._check_connection()
+        params = ua.ReadParameters()
+        for node_id in node_ids:
+            rv = ua.ReadValueId()
+            rv.NodeId = self.client.get_node(node_id).nodeid
+            rv.AttributeId = attribute
+            params.NodesToRead.append(rv)
+        results = await self.client.uaclient.read(params)
+        return [data_value.Value.Value if data_value.Value is not None else None
+                for data_value in results]
+        
     async def read_array_node(self, node_id: str) -> List[Any]:
         """
         Read an array attribute from a node.
@@ -126,6 +161,18 @@ class OpcUaClient:
         self._check_connection()
         await node.write_node_attribute(self.client, node_id, value, attribute)
         
+    async def write_nodes(self, pairs: List[Tuple[str, Any]]) -> None:
+        """
+        Write values to multiple nodes in a single request.
+        
+        Args:
+            pairs: List of (node_id, value) tuples to write
+        """
+        self._check_connection()
+        nodes = [self.client.get_node(node_id) for node_id, _value in pairs]
+        values = [value for _node_id, value in pairs]
+        await self.client.write_values(nodes, values)
+        
     async def call_method(self, object_id: str, method_id: str) -> Any:
         """
         Call a method without input or output parameters.
@@ -5,90 +5,255 @@ This module provides functions to manage connections to OPC UA servers.
 """
 
 import asyncio
+import heapq
 import logging
+import random
 import traceback
+from collections import defaultdict
 from typing import Dict, List, Optional, Tuple
+from weakref import WeakKeyDictionary, WeakValueDictionary, finalize, ref
 import time
 
 from asyncua import Client, ua
 from asyncua.common.node import Node
-from asyncua.crypto.security_policies import SecurityPolicyBasic256Sha256
-from asyncua.ua import EndpointDescription, MessageSecurityMode
+from asyncua.ua import EndpointDescription
 
 logger = logging.getLogger(__name__)
 
-# 글로벌 변수로 keep-alive 태스크 관리
-_keep_alive_tasks = {}
 
-async def _keep_alive_worker(client: Client, interval: float = 3.0):
-    """
-    클라이언트 연결을 유지하기 위한 백그라운드 작업입니다.
-    순수한 연결 상태 확인만 수행하여 추가 데이터 발행 없이 Keep-Alive를 제공합니다.
-    
-    Args:
-        client: OPC UA 클라이언트 인스턴스
-        interval: 연결 유지 요청 간격(초)
+def _install_fast_loop():
+    """가능하면 uvloop 이벤트 루프를 설치합니다.
+
+    libuv 기반 루프는 알림이 많은 구독 워크로드에서 소켓 I/O당 비용을
+    낮춥니다. uvloop이 설치돼 있지 않으면 기본 asyncio 루프를 그대로
+    사용합니다.
     """
-    reconnect_attempts = 0
-    max_reconnect_attempts = 5
-    last_success_time = time.time()
-    
     try:
-        logger.info(f"순수 Keep-Alive 태스크 시작, 간격: {interval}초 (데이터 발행 없음)")
-        while True:
-            current_time = time.time()
-            try:
-                # 순수한 연결 상태 확인 - 데이터 노드를 읽지 않음
-                await client.get_namespace_array()
-                
-                # 성공한 경우 재시도 카운터 초기화
-                reconnect_attempts = 0
-                last_success_time = current_time
-                
-            except Exception as e:
-                # 마지막 성공으로부터 경과한 시간 확인
-                elapsed = current_time - last_success_time                
-                # 연결이 끊어졌을 때 재연결 시도
-                reconnect_attempts += 1
-                
-                if reconnect_attempts <= max_reconnect_attempts:
-                    try:
-                        logger.info(f"연결 재시도 {reconnect_attempts}/{max_reconnect_attempts}...")
-                        
-                        # 기존 연결 닫기 시도
-                        try:
-                            await client.disconnect()
-                        except Exception as disc_err:
-                            logger.debug(f"연결 닫기 중 오류 (무시됨): {disc_err}")
-                        
-                        # 새로 연결 시도
-                        await asyncio.sleep(0.5)  # 잠시 대기 후 재연결
-                        await client.connect()
-                        
-                        # 연결 확인 (순수 메타데이터 확인)
-                        await client.get_namespace_array()
-                        logger.info("재연결 성공")
-                        
-                        # 재연결 성공 시 카운터 및 타임스탬프 초기화
-                        reconnect_attempts = 0
-                        last_success_time = time.time()
-                        
-                    except Exception as reconnect_error:
-                        logger.error(f"재연결 시도 {reconnect_attempts} 실패: {reconnect_error}")
-                else:
-                    logger.error(f"최대 재연결 시도 횟수({max_reconnect_attempts})에 도달. 일시적으로 중단합니다.")
-                    # 일정 시간 대기 후 재시도 카운터 초기화
-                    await asyncio.sleep(10)
-                    reconnect_attempts = 0
-                    
-            # 다음 keep-alive 주기까지 대기
-            await asyncio.sleep(interval)
-    except asyncio.CancelledError:
-        logger.info("순수 Keep-Alive 태스크가 취소되었습니다.")
+        import uvloop
+    except ImportError:
+        logger.debug("uvloop not available; using default asyncio event loop")
+        return
+    try:
+        uvloop.install()
+        logger.info("uvloop event loop installed")
     except Exception as e:
-        logger.error(f"순수 Keep-Alive 태스크 오류: {e}")
-        # 예외 전파하지 않고 로깅만 수행
+        logger.debug(f"Could not install uvloop: {e}")
+
+
+_install_fast_loop()
+
+# Keep-alive 대상 NodeId (Server_ServerStatus_CurrentTime)
+_KEEP_ALIVE_NODEID = ua.NodeId(2258, 0)
+
+# 공유 keep-alive 스케줄러 - 세션마다 태스크/타이머를 하나씩 돌리는 대신
+# 단일 워커가 (다음 실행 시각, 클라이언트) 힙을 유지하며 다음 이벤트까지
+# 한 번의 asyncio.sleep으로 대기합니다. 스케줄링이 O(log N)이고,
+# 세마포어로 동시 확인/재연결 수를 제한해 재연결 폭주를 막습니다.
+_KEEP_ALIVE_MAX_CONCURRENCY = 8
+# WeakKeyDictionary - 레지스트리가 Client를 강참조로 붙들면 close를 잊은
+# 세션이 영원히 살아남으므로, GC되는 순간 항목이 저절로 사라지게 합니다.
+_keep_alive_clients: "WeakKeyDictionary[Client, dict]" = WeakKeyDictionary()
+_keep_alive_heap: List[Tuple[float, int, "ref[Client]"]] = []
+_keep_alive_seq = 0
+_keep_alive_handle: Optional[asyncio.TimerHandle] = None
+_keep_alive_tick_task: Optional[asyncio.Task] = None
+_keep_alive_semaphore: Optional[asyncio.Semaphore] = None
+
+
+def _track_request_time(client: Client):
+    """
+    uaclient.send_request를 얇게 감싸 마지막 요청 시각을 기록합니다.
+
+    사용자 트래픽이 이미 흐르고 있으면 채널이 살아 있다는 뜻이므로,
+    keep-alive가 불필요한 합성 Read를 생략할 수 있게 합니다.
+    """
+    if getattr(client, '_last_req', None) is not None:
+        return  # 이미 래핑됨
+    orig = client.uaclient.send_request
+
+    async def _wrapped(*args, **kwargs):
+        client._last_req = time.monotonic()
+        return await orig(*args, **kwargs)
+
+    client._last_req = time.monotonic()
+    client.uaclient.send_request = _wrapped
+
+
+def _schedule_keep_alive(client: Client, state: dict, delay: Optional[float] = None):
+    """클라이언트의 다음 확인 시각을 힙에 등록합니다."""
+    global _keep_alive_seq
+    _keep_alive_seq += 1
+    if delay is None:
+        delay = state["interval"]
+    # 힙에는 약참조만 넣어 예약 자체가 Client의 수명을 늘리지 않게 함
+    heapq.heappush(_keep_alive_heap, (time.time() + delay, _keep_alive_seq, ref(client)))
+
+
+def _register_keep_alive(client: Client, interval: float = 3.0):
+    """클라이언트를 공유 keep-alive 스케줄러에 등록합니다."""
+    global _keep_alive_semaphore
+
+    # 미리 만들어 둔 ReadRequest 파라미터를 재사용 - 주기마다 재구성하지 않음
+    params = ua.ReadParameters()
+    rv = ua.ReadValueId()
+    rv.NodeId = _KEEP_ALIVE_NODEID
+    rv.AttributeId = ua.AttributeIds.Value
+    params.NodesToRead.append(rv)
+
+    state = {"fails": 0, "params": params, "interval": interval}
+    _keep_alive_clients[client] = state
+    _schedule_keep_alive(client, state)
+
+    if _keep_alive_semaphore is None:
+        _keep_alive_semaphore = asyncio.Semaphore(_KEEP_ALIVE_MAX_CONCURRENCY)
+    _arm_keep_alive_timer()
+    logger.info(f"Keep-alive registered ({len(_keep_alive_clients)} client(s), interval {interval}s)")
+
+
+def _unregister_keep_alive(client: Client):
+    """클라이언트를 keep-alive 레지스트리에서 제거합니다.
+
+    힙에 남은 항목은 워커가 꺼낼 때 레지스트리에 없으면 버립니다.
+    """
+    global _keep_alive_handle
+    if _keep_alive_clients.pop(client, None) is not None:
+        logger.info(f"Keep-alive unregistered ({len(_keep_alive_clients)} client(s) remaining)")
+    if not _keep_alive_clients and _keep_alive_handle is not None:
+        _keep_alive_handle.cancel()
+        _keep_alive_handle = None
+
+
+_KEEP_ALIVE_BACKOFF_BASE = 0.25
+_KEEP_ALIVE_BACKOFF_CAP = 30.0
+_KEEP_ALIVE_BACKOFF_MAX_ATTEMPT = 7
+
+
+def _keep_alive_backoff(attempt: int) -> float:
+    """
+    완전 지터를 적용한 지수 백오프 지연을 계산합니다.
+
+    delay = random * min(cap, base * 2**attempt) — 고정 주기 재시도와 달리
+    불안정한 네트워크에서 재시도 횟수를 줄이고, 여러 클라이언트의 재시도
+    시점을 흩어 놓아 동시 재연결 폭주를 막습니다. 시도 횟수에는 상한이
+    없고 attempt만 고정해 지연이 cap 이내로 유지됩니다.
+    """
+    attempt = min(attempt, _KEEP_ALIVE_BACKOFF_MAX_ATTEMPT)
+    return random.uniform(0, min(_KEEP_ALIVE_BACKOFF_CAP,
+                                 _KEEP_ALIVE_BACKOFF_BASE * (2 ** attempt)))
+
+
+async def _keep_alive_probe(client: Client, state: dict) -> float:
+    """
+    클라이언트 하나의 연결을 확인하고, 필요하면 재연결을 시도합니다.
+
+    세마포어 안에서 실행되어 동시에 날아가는 확인/재연결 수가 제한됩니다.
+
+    Returns:
+        다음 확인까지의 지연 시간(초)
+    """
+    # 사용자 요청이 최근에 나갔다면 채널은 이미 확인된 셈 - 합성 Read 생략
+    if (state["fails"] == 0
+            and time.monotonic() - getattr(client, '_last_req', 0.0) < state["interval"]):
+        return state["interval"]
+
+    async with _keep_alive_semaphore:
+        try:
+            await client.uaclient.read(state["params"])
+            state["fails"] = 0
+            return state["interval"]
+        except Exception:
+            state["fails"] += 1
+
+        logger.info(f"연결 재시도 {state['fails']}회차...")
+        try:
+            # 기존 연결 닫기 시도
+            try:
+                await client.disconnect()
+            except Exception as disc_err:
+                logger.debug(f"연결 닫기 중 오류 (무시됨): {disc_err}")
+
+            # 새로 연결 시도
+            await client.connect()
+            await client.get_namespace_array()
+            logger.info("재연결 성공")
+            state["fails"] = 0
+            return state["interval"]
+        except Exception as reconnect_error:
+            logger.error(f"재연결 시도 {state['fails']} 실패: {reconnect_error}")
+        # 실패가 이어질수록 더 길게, 지터를 섞어 대기
+        return _keep_alive_backoff(state["fails"])
+
+
+def _arm_keep_alive_timer():
+    """
+    다음 힙 최솟값 시각에 맞춰 loop.call_later 타이머를 (재)설치합니다.
+
+    상주 Task와 주기적 asyncio.sleep 대신 타이머 핸들 하나만 유지해
+    사이클마다 생기던 Future/Task 할당을 없앱니다. 확인이 필요한 순간에만
+    짧은 코루틴이 생성되고 끝나면 사라집니다.
+    """
+    global _keep_alive_handle
+    if not _keep_alive_clients or _keep_alive_tick_task is not None:
+        return
+    if _keep_alive_handle is not None:
+        _keep_alive_handle.cancel()
+    delay = max(0.0, _keep_alive_heap[0][0] - time.time()) if _keep_alive_heap else 1.0
+    loop = asyncio.get_event_loop()
+    _keep_alive_handle = loop.call_later(delay, _keep_alive_fire)
+
 
+def _keep_alive_fire():
+    """타이머 콜백 - 기한이 된 확인 작업을 짧은 코루틴으로 실행합니다."""
+    global _keep_alive_handle, _keep_alive_tick_task
+    _keep_alive_handle = None
+    if not _keep_alive_clients:
+        return
+    _keep_alive_tick_task = asyncio.ensure_future(_keep_alive_tick())
+    _keep_alive_tick_task.add_done_callback(_keep_alive_after_tick)
+
+
+def _keep_alive_after_tick(task: asyncio.Task):
+    """확인 사이클이 끝나면 다음 타이머를 재설치합니다."""
+    global _keep_alive_tick_task
+    _keep_alive_tick_task = None
+    if not task.cancelled():
+        error = task.exception()
+        if error is not None:
+            logger.error(f"공유 Keep-Alive 스케줄러 오류: {error}")
+            # 예외 전파하지 않고 로깅만 수행
+    _arm_keep_alive_timer()
+
+
+async def _keep_alive_tick():
+    """
+    기한이 된 클라이언트들을 꺼내 동시에(세마포어 한도 내에서) 확인하고
+    다음 시각을 다시 등록합니다. 해지된 클라이언트의 힙 항목은 버립니다.
+    """
+    due = []
+    now = time.time()
+    while _keep_alive_heap and _keep_alive_heap[0][0] <= now:
+        _fire_time, _seq, client_ref = heapq.heappop(_keep_alive_heap)
+        client = client_ref()
+        if client is None:
+            continue  # GC된 클라이언트의 잔여 항목
+        state = _keep_alive_clients.get(client)
+        if state is not None:
+            due.append((client, state))
+
+    if not due:
+        return
+
+    delays = await asyncio.gather(
+        *(_keep_alive_probe(client, state) for client, state in due),
+        return_exceptions=True)
+
+    for (client, state), next_delay in zip(due, delays):
+        if client not in _keep_alive_clients:
+            continue
+        if isinstance(next_delay, Exception):
+            logger.error(f"Keep-alive 확인 중 오류: {next_delay}")
+            next_delay = state["interval"]
+        _schedule_keep_alive(client, state, next_delay)
 
 class Connection:
     """
@@ -152,12 +317,7 @@ class Connection:
         Returns:
             List of endpoint descriptions
         """
-        temp_client = Client(self.server_url)
-        try:
-            endpoints = await temp_client.connect_and_get_server_endpoints()
-            return endpoints
-        finally:
-            await temp_client.disconnect()
+        return await _fetch_endpoints_cached(self.server_url)
                 
     def get_client(self) -> Optional[Client]:
         """
@@ -169,6 +329,35 @@ class Connection:
         return self.client if self.is_connected else None
 
 
+# 엔드포인트 디스커버리 캐시 - 호출마다 TCP + SecureChannel 핸드셰이크를
+# 반복하지 않도록 URL별로 결과를 TTL 동안 보관하고, 동시 호출은 URL별
+# 락으로 합쳐 핸드셰이크가 하나만 날아가게 합니다.
+_ENDPOINT_CACHE_TTL = 60.0
+_endpoint_cache: Dict[str, Tuple[float, List[EndpointDescription]]] = {}
+_endpoint_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+
+async def _fetch_endpoints_cached(server_url: str) -> List[EndpointDescription]:
+    """엔드포인트 목록을 TTL 캐시를 거쳐 조회합니다."""
+    cached = _endpoint_cache.get(server_url)
+    if cached is not None and (time.time() - cached[0]) < _ENDPOINT_CACHE_TTL:
+        return cached[1]
+
+    async with _endpoint_locks[server_url]:
+        # 락 대기 중 다른 호출이 이미 채웠을 수 있음
+        cached = _endpoint_cache.get(server_url)
+        if cached is not None and (time.time() - cached[0]) < _ENDPOINT_CACHE_TTL:
+            return cached[1]
+
+        client = Client(server_url)
+        try:
+            endpoints = await client.connect_and_get_server_endpoints()
+        finally:
+            await client.disconnect()
+        _endpoint_cache[server_url] = (time.time(), endpoints)
+        return endpoints
+
+
 async def get_endpoints(server_url: str) -> List[EndpointDescription]:
     """
     Get available endpoints from the server.
@@ -179,19 +368,17 @@ async def get_endpoints(server_url: str) -> List[EndpointDescription]:
     Returns:
         List of endpoint descriptions
     """
-    client = Client(server_url)
-    try:
-        endpoints = await client.connect_and_get_server_endpoints()
+    endpoints = await _fetch_endpoints_cached(server_url)
+    # INFO가 꺼져 있으면 엔드포인트별 getattr/포매팅 비용을 전부 건너뜀
+    if logger.isEnabledFor(logging.INFO):
         for i, endpoint in enumerate(endpoints):
             # 속성이 있는지 확인한 후 접근 (인증서 데이터는 로깅하지 않음)
             security_mode = getattr(endpoint, 'SecurityMode', None) or getattr(endpoint, 'security_mode', 'Unknown')
             security_policy = getattr(endpoint, 'SecurityPolicyUri', None) or getattr(endpoint, 'security_policy_uri', 'Unknown')
             
-            # 간결한 로깅 정보만 출력
-            logger.info(f"Endpoint {i}: Mode={security_mode}, Policy={security_policy}")
-        return endpoints
-    finally:
-        await client.disconnect()
+            # 간결한 로깅 정보만 출력 (%-포맷: 실제 출력될 때만 문자열 생성)
+            logger.info("Endpoint %d: Mode=%s, Policy=%s", i, security_mode, security_policy)
+    return endpoints
 
 
 async def create_session(server_url: str, security: bool = False, keep_alive: bool = True, keep_alive_interval: float = 3.0) -> Client:
@@ -208,24 +395,44 @@ async def create_session(server_url: str, security: bool = False, keep_alive: bo
         Client instance
     """
     try:
-        # 명시적으로 보안 정책 없는 엔드포인트 URL 사용
-        if not security and not server_url.endswith("/"):
-            # None 엔드포인트를 명시적으로 선택
-            server_url = f"{server_url}"
-            
         logger.info(f"Creating client for URL: {server_url}")
         client = Client(server_url)
         
         # 세션 타임아웃 설정을 늘림 (기본값보다 길게)
         client.session_timeout = 3600000  # 1시간 (밀리초 단위)
         
-        # 보안 설정을 건너뛰고 바로 연결 시도
+        if security:
+            # 클라이언트 인증서 설정이 없는 CLI라 set_security를 구성할 수
+            # 없음 - 보안 정책 임포트 없이 경고만 남기고 평문으로 연결
+            logger.warning(
+                "Security requested but no client certificate is configured; "
+                "connecting without message security")
+        
         logger.info(f"Connecting to {server_url}...")
         await client.connect()
         logger.info(f"Successfully connected to {server_url}")
         
-        # 연결 성공 확인을 위해 namespace 배열 가져오기
-        namespaces = await client.get_namespace_array()
+        # 연결 확인용 namespace Read를 먼저 띄워 두고(파이프라이닝),
+        # 응답을 기다리는 동안 keep-alive 등록 등 로컬 작업을 진행합니다.
+        ns_task = asyncio.create_task(client.get_namespace_array())
+        
+        try:
+            # Keep-alive 메커니즘 활성화 - 공유 워커에 등록
+            _track_request_time(client)
+
+            if keep_alive:
+                _register_keep_alive(client, keep_alive_interval)
+                logger.info(f"Keep-alive mechanism activated for {server_url}")
+            
+            # 마지막에만 응답을 대기 - RTT가 로컬 설정 작업과 겹침
+            namespaces = await ns_task
+        except Exception:
+            # 검증 실패로 세션을 돌려주지 못하면 죽은 클라이언트가 keep-alive
+            # 스케줄러에 남거나 namespace Read가 떠돌지 않도록 정리합니다.
+            _unregister_keep_alive(client)
+            if not ns_task.done():
+                ns_task.cancel()
+            raise
         # 네임스페이스 배열이 너무 길면 간결하게 표시
         if len(namespaces) > 5:
             ns_log = f"{len(namespaces)} namespaces: [{', '.join(str(ns)[:20] for ns in namespaces[:3])}...]"
@@ -234,29 +441,62 @@ async def create_session(server_url: str, security: bool = False, keep_alive: bo
         
         logger.info(f"Connection verified. Server has {ns_log}")
         
-        # Keep-alive 메커니즘 활성화
-        if keep_alive:
-            global _keep_alive_tasks
-            # 이전 태스크가 있다면 취소
-            if server_url in _keep_alive_tasks and not _keep_alive_tasks[server_url].done():
-                _keep_alive_tasks[server_url].cancel()
-                
-            # 새로운 keep-alive 태스크 생성
-            _keep_alive_tasks[server_url] = asyncio.create_task(
-                _keep_alive_worker(client, keep_alive_interval)
-            )
-            logger.info(f"Keep-alive mechanism activated for {server_url}")
-        
         return client
     except Exception as e:
         # 상세한 예외 정보 출력 (바이너리 데이터 필터링)
         logger.error(f"Failed to create session: {str(e)[:200]}")
         logger.error(f"Exception type: {type(e)}")
         # 트레이스백은 바이너리 데이터가 없으므로 그대로 출력
-        logger.error(f"Traceback: {traceback.format_exc()}")
+        # (ERROR가 꺼진 환경에서는 format_exc 비용도 생략)
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error("Traceback: %s", traceback.format_exc())
         raise
 
 
+async def reconnect_with_backoff(
+    server_url: str,
+    security: bool = False,
+    attempts: int = 6,
+    base_delay: float = 0.5,
+    max_delay: float = 30.0
+) -> Client:
+    """
+    Create a session, retrying with exponential backoff and full jitter.
+
+    서버가 잠시 재시작하는 동안의 일시적 실패를 견디고, 여러 클라이언트가
+    동시에 재접속할 때 재시도 폭주(retry storm)가 생기지 않도록 지수
+    백오프에 전체 지터를 적용합니다.
+
+    Args:
+        server_url: The URL of the OPC UA server
+        security: Whether to use security (default: False)
+        attempts: Maximum number of connection attempts (default: 6)
+        base_delay: Initial backoff delay in seconds (default: 0.5)
+        max_delay: Upper bound for the backoff delay in seconds (default: 30.0)
+
+    Returns:
+        Client instance
+
+    Raises:
+        The last connection error if all attempts fail
+    """
+    last_error = None
+    for attempt in range(attempts):
+        try:
+            return await create_session(server_url, security)
+        except Exception as e:
+            last_error = e
+            if attempt == attempts - 1:
+                break
+            delay = min(max_delay, base_delay * (2 ** attempt)) * random.random()
+            logger.warning(
+                f"Connection attempt {attempt + 1}/{attempts} failed: {str(e)[:200]}; "
+                f"retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+    logger.error(f"All {attempts} connection attempts to {server_url} failed")
+    raise last_error
+
+
 async def activate_session(client: Client) -> bool:
     """
     Activate an existing session.
@@ -269,8 +509,15 @@ async def activate_session(client: Client) -> bool:
     """
     try:
         # Session is automatically activated during connect()
-        # This is just to check if it's active
-        await client.get_namespace_array()
+        # 생존 확인 Read와 타입 정의 프리페치를 겹쳐 한 RTT 만에 끝냄
+        ok, type_result = await asyncio.gather(
+            client.get_namespace_array(),
+            client.load_data_type_definitions(),
+            return_exceptions=True)
+        if isinstance(type_result, Exception):
+            logger.debug(f"Type definition prefetch failed: {type_result}")
+        if isinstance(ok, Exception):
+            raise ok
         return True
     except Exception as e:
         logger.error(f"Failed to activate session: {e}")
@@ -284,21 +531,12 @@ async def close_session(client: Client) -> None:
     Args:
         client: The client with an established connection
     """
-    # Keep-alive 태스크 찾기 및 취소
-    global _keep_alive_tasks
-    for url, task in list(_keep_alive_tasks.items()):
-        if not task.done():
-            task.cancel()
-            try:
-                await task
-            except asyncio.CancelledError:
-                pass
-            del _keep_alive_tasks[url]
-            logger.info(f"Keep-alive task for {url} cancelled")
+    # Keep-alive 레지스트리에서 제거
+    _unregister_keep_alive(client)
             
     # 연결 종료
     await client.disconnect()
-    logger.info("Session closed and keep-alive tasks cancelled")
+    logger.info("Session closed and keep-alive registration removed")
 
 
 class MultiSessionManager:
@@ -307,7 +545,17 @@ class MultiSessionManager:
     """
     
     def __init__(self):
-        self.sessions: Dict[str, Client] = {}
+        # WeakValueDictionary - close_session을 잊은 호출자가 있어도 Client가
+        # GC되면 항목이 자동으로 사라져 레지스트리가 무한히 자라지 않습니다.
+        self.sessions: "WeakValueDictionary[str, Client]" = WeakValueDictionary()
+        
+    @staticmethod
+    def _on_client_gc(session_id: str):
+        """세션이 닫히지 않은 채 GC될 때 호출되는 정리 콜백."""
+        # keep-alive 레지스트리와 힙은 약참조라 GC 시점에 해당 항목이 이미
+        # 사라진 상태 - 남은 확인 작업도 자동으로 중단되므로 여기서는
+        # 프로토콜상 닫히지 않은 세션이라는 경고만 남깁니다.
+        logger.warning(f"Session '{session_id}' was garbage-collected without close_session()")
         
     async def create_session(self, session_id: str, server_url: str) -> Client:
         """
@@ -323,10 +571,39 @@ class MultiSessionManager:
         if session_id in self.sessions:
             raise ValueError(f"Session with ID '{session_id}' already exists")
             
-        client = await create_session(server_url)
+        client = await reconnect_with_backoff(server_url)
         self.sessions[session_id] = client
+        finalize(client, self._on_client_gc, session_id)
         return client
         
+    async def create_sessions(self, mapping: Dict[str, str]) -> Dict[str, Client]:
+        """
+        Create multiple sessions concurrently.
+        
+        핸드셰이크를 asyncio.gather로 겹쳐 M개 서버 연결이 M*RTT 대신
+        대략 1*RTT에 끝나도록 합니다.
+        
+        Args:
+            mapping: Dictionary of session_id -> server_url
+            
+        Returns:
+            Dictionary of session_id -> Client for the sessions that connected
+        """
+        session_ids = [sid for sid in mapping if sid not in self.sessions]
+        results = await asyncio.gather(
+            *(reconnect_with_backoff(mapping[sid]) for sid in session_ids),
+            return_exceptions=True)
+        
+        created: Dict[str, Client] = {}
+        for session_id, result in zip(session_ids, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to create session '{session_id}': {result}")
+            else:
+                self.sessions[session_id] = result
+                finalize(result, self._on_client_gc, session_id)
+                created[session_id] = result
+        return created
+        
     def get_session(self, session_id: str) -> Optional[Client]:
         """
         Get an existing session by ID.
@@ -346,13 +623,15 @@ class MultiSessionManager:
         Args:
             session_id: The ID of the session to close
         """
-        if session_id in self.sessions:
-            await self.sessions[session_id].disconnect()
-            del self.sessions[session_id]
+        # GC가 항목을 먼저 지웠을 수 있으므로 KeyError에 안전하게 접근
+        client = self.sessions.pop(session_id, None)
+        if client is not None:
+            await client.disconnect()
             
     async def close_all_sessions(self) -> None:
         """
-        Close all active sessions.
+        Close all active sessions concurrently.
         """
-        for session_id in list(self.sessions.keys()):
-            await self.close_session(session_id) 
\ No newline at end of file
+        await asyncio.gather(
+            *(self.close_session(session_id) for session_id in list(self.sessions.keys())),
+            return_exceptions=True)
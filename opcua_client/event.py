@@ -14,6 +14,13 @@ from asyncua.common.subscription import Subscription
 logger = logging.getLogger(__name__)
 
 
+def _truncate(s: str, head: int = 30, tail: int = 10, limit: int = 50) -> str:
+    """로그용으로 긴 문자열을 앞/뒤만 남기고 줄입니다."""
+    if len(s) <= limit:
+        return s
+    return f"{s[:head]}...{s[-tail:]}" if tail else f"{s[:head]}..."
+
+
 async def subscribe_events(
     subscription: Subscription,
     node_id: str,
@@ -32,46 +39,30 @@ async def subscribe_events(
     Returns:
         Handle ID for the monitored item
     """
-    # 노드 객체 획득 방법 개선
-    node = None
-    if hasattr(subscription.server, 'get_node'):
-        node = subscription.server.get_node(node_id)
-    elif hasattr(subscription, '_client'):
-        node = subscription._client.get_node(node_id)
-    else:
-        # 대체 방법 시도
-        from asyncua import ua
-        node_id_obj = ua.NodeId.from_string(node_id)
-        node = Node(subscription.server, node_id_obj)
+    node = _resolve_node(subscription, node_id)
     
     if event_filter is None:
-        # Create a default event filter that includes standard fields
-        event_filter = await _create_default_event_filter(subscription.server)
+        # Use the shared default event filter with standard fields
+        event_filter = _default_event_filter()
     
     try:
         handle = await subscription.subscribe_events(node, callback, event_filter)
-        # 로그에는 간결한 정보만 기록
-        node_id_str = str(node_id)
-        if len(node_id_str) > 50:
-            node_id_str = f"{node_id_str[:30]}...{node_id_str[-10:]}"
-        logger.info(f"Subscribed to events for node {node_id_str}")
+        # 로그에는 간결한 정보만 기록 (INFO가 꺼져 있으면 슬라이싱도 생략)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Subscribed to events for node %s", _truncate(str(node_id)))
         return handle
     except Exception as e:
         # 예외 메시지 간결화
-        err_msg = str(e)
-        if len(err_msg) > 100:
-            err_msg = f"{err_msg[:100]}... [내용 생략]"
-        logger.error(f"Failed to subscribe to events: {err_msg}")
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error("Failed to subscribe to events: %s",
+                         _truncate(str(e), head=100, tail=0, limit=100))
         raise
 
 
-async def _create_default_event_filter(client: Client) -> ua.EventFilter:
+def _build_default_event_filter() -> ua.EventFilter:
     """
     Create a default event filter with standard fields.
     
-    Args:
-        client: The client with an established connection
-        
     Returns:
         EventFilter object
     """
@@ -89,52 +80,118 @@ async def _create_default_event_filter(client: Client) -> ua.EventFilter:
     return event_filter
 
 
-async def add_monitored_item(
+# 기본 필터의 내용은 상수이므로 한 번만 만들어 모든 구독이 공유합니다.
+# (asyncua는 필터를 직렬화만 하고 변경하지 않으므로 공유해도 안전)
+_DEFAULT_EVENT_FILTER = _build_default_event_filter()
+
+
+def _default_event_filter() -> ua.EventFilter:
+    """공유 기본 이벤트 필터를 반환합니다."""
+    return _DEFAULT_EVENT_FILTER
+
+
+# (서버 id, NodeId 문자열) -> Node 캐시. 재연결 후 같은 태그를 다시 등록할 때
+# NodeId 문자열 파싱과 Node 생성을 반복하지 않기 위한 것입니다.
+_NODE_CACHE_MAXSIZE = 4096
+_node_cache: Dict[Tuple[int, str], Node] = {}
+
+
+def _resolve_node(subscription: Subscription, node_id: str) -> Node:
+    """구독이 사용하는 클라이언트에서 노드 객체를 얻습니다 (캐시 사용)."""
+    cache_key = (id(subscription.server), node_id)
+    node = _node_cache.get(cache_key)
+    if node is not None:
+        return node
+    
+    # EAFP - asyncua 구독은 거의 항상 server.get_node를 제공하므로
+    # hasattr 이중 탐사 대신 바로 호출하고 AttributeError만 잡습니다.
+    try:
+        node = subscription.server.get_node(node_id)
+    except AttributeError:
+        try:
+            node = subscription._client.get_node(node_id)
+        except AttributeError:
+            # 대체 방법 시도
+            node = Node(subscription.server, ua.NodeId.from_string(node_id))
+    
+    # 단순 용량 제한 - 초과 시 가장 오래된 항목부터 제거 (삽입 순서 유지)
+    if len(_node_cache) >= _NODE_CACHE_MAXSIZE:
+        _node_cache.pop(next(iter(_node_cache)))
+    _node_cache[cache_key] = node
+    return node
+
+
+async def add_monitored_items(
     subscription: Subscription,
-    node_id: str,
+    node_ids: List[str],
     callback: Callable[[Node, Any, Any], None],
     sampling_interval: float = 100,
     queuesize: int = 1
-) -> int:
+) -> List[int]:
     """
-    Add a monitored item to a subscription.
+    Add multiple monitored items to a subscription in one service call.
+    
+    노드마다 subscribe_data_change를 호출하면 CreateMonitoredItems 요청이
+    N번 나가지만, 리스트 형태로 넘기면 한 번의 왕복으로 끝납니다.
     
     Args:
         subscription: The subscription to use
-        node_id: The ID of the node to monitor
+        node_ids: The IDs of the nodes to monitor
         callback: The callback function to be called when the data changes
         sampling_interval: The sampling interval in milliseconds
-        queuesize: The queue size for the monitored item
+        queuesize: The queue size for the monitored items
         
     Returns:
-        Handle ID for the monitored item
+        List of handle IDs in the same order as node_ids
     """
-    # 노드 객체 획득 방법 개선
-    node = None
-    if hasattr(subscription.server, 'get_node'):
-        node = subscription.server.get_node(node_id)
-    elif hasattr(subscription, '_client'):
-        node = subscription._client.get_node(node_id)
-    else:
-        # 대체 방법 시도
-        from asyncua import ua
-        node_id_obj = ua.NodeId.from_string(node_id)
-        node = Node(subscription.server, node_id_obj)
+    nodes = [_resolve_node(subscription, node_id) for node_id in node_ids]
+    
+    # 첫 등록 시 발행 파이프라인 깊이를 조정 (멱등)
+    from opcua_client.subscription import tune_subscription
+    await tune_subscription(subscription)
     
     try:
-        handle = await subscription.subscribe_data_change(
-            node, 
+        handles = await subscription.subscribe_data_change(
+            nodes,
             callback,
             sampling_interval=sampling_interval,
             queuesize=queuesize
         )
-        logger.info(f"Added monitored item for node {node_id}")
-        return handle
+        logger.info(f"Added {len(node_ids)} monitored item(s)")
+        return handles
     except Exception as e:
-        logger.error(f"Failed to add monitored item: {e}")
+        logger.error(f"Failed to add monitored items: {e}")
         raise
 
 
+async def add_monitored_item(
+    subscription: Subscription,
+    node_id: str,
+    callback: Callable[[Node, Any, Any], None],
+    sampling_interval: float = 100,
+    queuesize: int = 1
+) -> int:
+    """
+    Add a monitored item to a subscription.
+    
+    Args:
+        subscription: The subscription to use
+        node_id: The ID of the node to monitor
+        callback: The callback function to be called when the data changes
+        sampling_interval: The sampling interval in milliseconds
+        queuesize: The queue size for the monitored item
+        
+    Returns:
+        Handle ID for the monitored item
+    """
+    handles = await add_monitored_items(
+        subscription, [node_id], callback,
+        sampling_interval=sampling_interval,
+        queuesize=queuesize
+    )
+    return handles[0]
+
+
 async def modify_monitored_item(
     subscription: Subscription,
     handle: int,
@@ -4,14 +4,122 @@ Method module for OPC UA client.
 This module provides functions to call methods on OPC UA servers.
 """
 
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional, Tuple, Union
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple, Set, Union
 
 from asyncua import Client, ua
 from asyncua.common.node import Node
 
+from opcua_client.node import get_cached_node
+
 logger = logging.getLogger(__name__)
 
+__all__ = [
+    "call_method",
+    "call_method_with_params",
+    "call_method_with_typed_params",
+    "get_method_info",
+    "invalidate_method_info",
+    "find_methods",
+    "clear_method_caches",
+]
+
+# 기본 탐색 시작점 - 호출마다 문자열 "i=85"를 파싱하지 않도록 미리 구성
+_OBJECTS_FOLDER_NODEID = ua.NodeId(85, 0)
+
+# 메서드 탐색 재귀 시 동시에 진행할 요청 수 제한
+_FIND_METHODS_PARALLELISM = 32
+
+# 메서드 탐색 결과 캐시 - 서버의 메서드 구성은 런타임에 거의 바뀌지 않으므로
+# (id(client), parent_id 문자열) 단위로 TTL 동안 재사용합니다.
+_FIND_METHODS_CACHE_TTL = 60.0  # 초
+_FIND_METHODS_CACHE: Dict[Tuple[int, str], Tuple[float, List[Dict[str, Any]]]] = {}
+
+
+def clear_method_caches(client: Optional[Client] = None) -> None:
+    """
+    메서드 관련 캐시를 비웁니다. 연결 해제 시 호출하세요.
+    
+    Args:
+        client: 특정 클라이언트의 탐색 항목만 제거 (None이면 전체)
+    """
+    if client is None:
+        _FIND_METHODS_CACHE.clear()
+        _METHOD_INFO_CACHE.clear()
+        return
+    client_id = id(client)
+    for cache_key in [k for k in _FIND_METHODS_CACHE if k[0] == client_id]:
+        del _FIND_METHODS_CACHE[cache_key]
+    for cache_key in [k for k in _METHOD_INFO_CACHE if k[0] == client_id]:
+        del _METHOD_INFO_CACHE[cache_key]
+
+# 메서드 메타데이터 캐시 - 같은 메서드를 반복 호출하는 일반적인 워크로드에서
+# get_method_info의 다중 왕복을 호출당 한 번으로 줄입니다. (용량 제한부 LRU)
+# 다른 캐시들과 동일하게 (id(client), method_id)로 키를 잡아 서버 간
+# 메타데이터가 섞이지 않게 하고 클라이언트 단위 무효화를 가능하게 합니다.
+_METHOD_INFO_CACHE_MAXSIZE = 256
+_METHOD_INFO_CACHE: "OrderedDict[Tuple[int, str], Dict[str, Any]]" = OrderedDict()
+
+def _input_variant_types(method_info: Dict[str, Any]) -> List[Optional["ua.VariantType"]]:
+    """
+    캐시된 메서드 정보에서 입력 인자별 VariantType을 한 번만 계산합니다.
+
+    이름이 표준 VariantType과 일치하지 않는 타입은 None으로 남겨
+    Variant 생성자의 타입 추론에 맡깁니다.
+    """
+    vtypes = method_info.get("_input_variant_types")
+    if vtypes is None:
+        vtypes = [getattr(ua.VariantType, arg.get("DataType") or "", None)
+                  for arg in method_info.get("InputArguments", [])]
+        method_info["_input_variant_types"] = vtypes
+    return vtypes
+
+
+def _to_bool(value: Any) -> bool:
+    """문자열 진리값("true"/"yes"/"1"/"y")을 포함해 bool로 변환합니다."""
+    if isinstance(value, str):
+        return value.lower() in ("true", "yes", "1", "y")
+    return bool(value)
+
+
+# 인자 타입별 (기대 파이썬 타입, 변환 함수) - 호출마다 부분 문자열 검사를
+# 반복하는 대신 타입 이름으로 O(1) 디스패치합니다.
+_ARG_CONVERTERS: Dict[str, Tuple[type, Any]] = {
+    "Boolean": (bool, _to_bool),
+    "SByte": (int, int),
+    "Byte": (int, int),
+    "Int16": (int, int),
+    "Int32": (int, int),
+    "Int64": (int, int),
+    "UInt16": (int, int),
+    "UInt32": (int, int),
+    "UInt64": (int, int),
+    "Float": (float, float),
+    "Double": (float, float),
+    "String": (str, str),
+    "LocalizedText": (str, str),
+    "QualifiedName": (str, str),
+}
+
+# DataType 이름 캐시 - 실제 워크로드에서는 소수의 표준 타입(Int32, Double 등)이
+# 반복되므로 프로세스 수명 동안 해석 결과를 재사용합니다.
+_DATA_TYPE_NAME_CACHE: Dict[Tuple[int, Any], str] = {}
+# 표준(ns=0) 기본 데이터 타입 식별자 -> 이름. ua.ObjectIds 전체를 색인하면
+# Object/Method 등 데이터 타입이 아닌 식별자까지 섞여 들어가므로,
+# OPC UA 기본 타입만 직접 나열합니다.
+_STANDARD_DATA_TYPES: Dict[int, str] = {
+    1: "Boolean", 2: "SByte", 3: "Byte", 4: "Int16", 5: "UInt16",
+    6: "Int32", 7: "UInt32", 8: "Int64", 9: "UInt64", 10: "Float",
+    11: "Double", 12: "String", 13: "DateTime", 14: "Guid",
+    15: "ByteString", 16: "XmlElement", 17: "NodeId", 18: "ExpandedNodeId",
+    19: "StatusCode", 20: "QualifiedName", 21: "LocalizedText",
+    22: "Structure", 23: "DataValue", 24: "BaseDataType", 25: "DiagnosticInfo",
+    26: "Number", 27: "Integer", 28: "UInteger", 29: "Enumeration", 30: "Image",
+}
+
 
 async def call_method(client: Client, object_id: str, method_id: str) -> Any:
     """
@@ -25,15 +133,15 @@ async def call_method(client: Client, object_id: str, method_id: str) -> Any:
     Returns:
         Result of the method call
     """
-    parent_node = client.get_node(object_id)
-    method_node = client.get_node(method_id)
+    parent_node = get_cached_node(client, object_id)
+    method_node = get_cached_node(client, method_id)
     
     try:
         result = await parent_node.call_method(method_node)
-        logger.info(f"Method {method_id} called successfully")
+        logger.info("Method %s called successfully", method_id)
         return result
     except Exception as e:
-        logger.error(f"Failed to call method {method_id}: {e}")
+        logger.error("Failed to call method %s: %s", method_id, e)
         raise
 
 
@@ -55,22 +163,28 @@ async def call_method_with_params(
     Returns:
         Result of the method call (typically a list of output arguments)
     """
-    parent_node = client.get_node(object_id)
-    method_node = client.get_node(method_id)
+    parent_node = get_cached_node(client, object_id)
+    method_node = get_cached_node(client, method_id)
     
     try:
-        # Convert Python types to OPC UA Variants if necessary
+        # Convert Python types to OPC UA Variants if necessary.
+        # 캐시된 메서드 정보가 있으면 VariantType을 명시해 생성자의
+        # 파이썬 타입 추론을 건너뛰고 오타이핑도 방지합니다.
+        cached_info = _METHOD_INFO_CACHE.get((id(client), method_id))
+        vtypes = _input_variant_types(cached_info) if cached_info is not None else []
+        
         ua_input_args = []
-        for arg in input_args:
+        for i, arg in enumerate(input_args):
             if not isinstance(arg, ua.Variant):
-                arg = ua.Variant(arg)
+                vtype = vtypes[i] if i < len(vtypes) else None
+                arg = ua.Variant(arg, vtype) if vtype is not None else ua.Variant(arg)
             ua_input_args.append(arg)
             
         result = await parent_node.call_method(method_node, *ua_input_args)
-        logger.info(f"Method {method_id} called successfully with parameters")
+        logger.info("Method %s called successfully with parameters", method_id)
         return result
     except Exception as e:
-        logger.error(f"Failed to call method {method_id} with parameters: {e}")
+        logger.error("Failed to call method %s with parameters: %s", method_id, e)
         raise
 
 
@@ -85,7 +199,7 @@ async def get_method_info(client: Client, method_id: str) -> Dict[str, Any]:
     Returns:
         Dictionary containing method information
     """
-    method_node = client.get_node(method_id)
+    method_node = get_cached_node(client, method_id)
     
     try:
         info = {}
@@ -93,80 +207,166 @@ async def get_method_info(client: Client, method_id: str) -> Dict[str, Any]:
         # Get basic node information
         info["NodeId"] = str(method_node.nodeid)
         
-        browse_name = await method_node.read_browse_name()
-        info["BrowseName"] = browse_name.Name
-        
-        display_name = await method_node.read_display_name()
-        info["DisplayName"] = display_name.Text
-        
-        # 메서드 노드에 대한 참조 정보 조회
-        references = await method_node.get_references(refs=ua.ObjectIds.HasProperty)
+        # 속성 참조와 부모 참조는 서로 독립 - 한 연결 위에서 파이프라이닝
+        references, parent_refs = await asyncio.gather(
+            method_node.get_references(refs=ua.ObjectIds.HasProperty),
+            method_node.get_references(direction=ua.BrowseDirection.Inverse))
         properties = []
         
-        # InputArguments, OutputArguments 속성 찾기
-        input_args = None
-        output_args = None
+        # InputArguments, OutputArguments 속성 노드 찾기
+        input_node_id = None
+        output_node_id = None
         
         for ref in references:
             if ref.BrowseName and ref.BrowseName.Name == "InputArguments":
-                input_node = client.get_node(ref.NodeId)
-                input_args = await input_node.read_value()
-                
-            if ref.BrowseName and ref.BrowseName.Name == "OutputArguments":
-                output_node = client.get_node(ref.NodeId)
-                output_args = await output_node.read_value()
-        
-        # InputArguments 정보 처리
-        if input_args:
-            input_info = []
-            for arg in input_args:
-                arg_info = {
-                    "Name": arg.Name,
-                    "DataType": await _get_data_type_name(client, arg.DataType),
-                    "ValueRank": arg.ValueRank,
-                    "Description": arg.Description.Text if arg.Description else None
-                }
-                input_info.append(arg_info)
-            info["InputArguments"] = input_info
-        else:
-            info["InputArguments"] = []
+                input_node_id = client.get_node(ref.NodeId).nodeid
+            elif ref.BrowseName and ref.BrowseName.Name == "OutputArguments":
+                output_node_id = client.get_node(ref.NodeId).nodeid
             
-        # OutputArguments 정보 처리
-        if output_args:
-            output_info = []
-            for arg in output_args:
-                arg_info = {
-                    "Name": arg.Name,
-                    "DataType": await _get_data_type_name(client, arg.DataType),
-                    "ValueRank": arg.ValueRank,
-                    "Description": arg.Description.Text if arg.Description else None
-                }
-                output_info.append(arg_info)
-            info["OutputArguments"] = output_info
+            # 둘 다 찾으면 나머지 속성 참조는 볼 필요 없음
+            if input_node_id is not None and output_node_id is not None:
+                break
+        
+        # 메서드 이름 속성과 인자 Value들을 단일 ReadRequest로 일괄 조회
+        read_plan = [
+            (method_node.nodeid, ua.AttributeIds.BrowseName),
+            (method_node.nodeid, ua.AttributeIds.DisplayName),
+        ]
+        if input_node_id is not None:
+            read_plan.append((input_node_id, ua.AttributeIds.Value))
+        if output_node_id is not None:
+            read_plan.append((output_node_id, ua.AttributeIds.Value))
+        
+        params = ua.ReadParameters()
+        for target_id, attr_id in read_plan:
+            rv = ua.ReadValueId()
+            rv.NodeId = target_id
+            rv.AttributeId = attr_id
+            params.NodesToRead.append(rv)
+        results = await client.uaclient.read(params)
+        
+        info["BrowseName"] = results[0].Value.Value.Name
+        info["DisplayName"] = results[1].Value.Value.Text
+        
+        input_args = None
+        output_args = None
+        next_index = 2
+        if input_node_id is not None:
+            input_args = results[next_index].Value.Value
+            next_index += 1
+        if output_node_id is not None:
+            output_args = results[next_index].Value.Value
+        
+        # 부모 객체 찾기 - DisplayName들을 단일 ReadRequest로 조회하고,
+        # 인자 DataType 이름 해석과 동시에 진행 (서로 독립)
+        object_refs = [ref for ref in parent_refs if ref.NodeClass == ua.NodeClass.Object]
+        all_args = list(input_args or []) + list(output_args or [])
+        
+        name_params = None
+        if object_refs:
+            name_params = ua.ReadParameters()
+            for ref in object_refs:
+                rv = ua.ReadValueId()
+                rv.NodeId = client.get_node(ref.NodeId).nodeid
+                rv.AttributeId = ua.AttributeIds.DisplayName
+                name_params.NodesToRead.append(rv)
+        
+        if name_params is not None:
+            type_names, name_results = await asyncio.gather(
+                _get_data_type_names(client, [arg.DataType for arg in all_args]),
+                client.uaclient.read(name_params))
         else:
-            info["OutputArguments"] = []
+            type_names = await _get_data_type_names(client, [arg.DataType for arg in all_args])
+            name_results = []
         
-        # 부모 객체 찾기
-        parent_refs = await method_node.get_references(direction=ua.BrowseDirection.Inverse)
-        parent_objects = []
+        def _arg_info(arg):
+            return {
+                "Name": arg.Name,
+                "DataType": type_names.get(arg.DataType, f"Unknown({arg.DataType})"),
+                "ValueRank": arg.ValueRank,
+                "Description": arg.Description.Text if arg.Description else None
+            }
         
-        for ref in parent_refs:
-            if ref.NodeClass == ua.NodeClass.Object:
-                parent_node = client.get_node(ref.NodeId)
-                parent_name = await parent_node.read_display_name()
-                parent_objects.append({
-                    "NodeId": str(ref.NodeId),
-                    "DisplayName": parent_name.Text
-                })
+        info["InputArguments"] = [_arg_info(arg) for arg in (input_args or [])]
+        info["OutputArguments"] = [_arg_info(arg) for arg in (output_args or [])]
+        
+        parent_objects = []
+        for ref, data_value in zip(object_refs, name_results):
+            display_name = data_value.Value.Value if data_value.Value is not None else None
+            parent_objects.append({
+                "NodeId": str(ref.NodeId),
+                "DisplayName": display_name.Text if display_name else None
+            })
                 
         info["ParentObjects"] = parent_objects
         
         return info
     except Exception as e:
-        logger.error(f"Failed to get method info for {method_id}: {e}")
+        logger.error("Failed to get method info for %s: %s", method_id, e)
         raise
 
 
+async def _get_data_type_names(
+    client: Client,
+    data_type_ids: List[ua.NodeId]
+) -> Dict[ua.NodeId, str]:
+    """
+    Resolve the names of multiple data types in one server round-trip.
+    
+    표준(ns=0) 타입은 로컬에서 해석하고, 나머지만 하나의 ReadRequest로
+    BrowseName을 읽어 타입 개수만큼의 왕복을 1번으로 줄입니다.
+    
+    Args:
+        client: The client with an established connection
+        data_type_ids: The IDs of the data type nodes
+        
+    Returns:
+        Dictionary mapping each data type ID to its name
+    """
+    names: Dict[ua.NodeId, str] = {}
+    unresolved: List[ua.NodeId] = []
+    
+    for data_type_id in data_type_ids:
+        if data_type_id in names:
+            continue
+        cache_key = (data_type_id.NamespaceIndex, data_type_id.Identifier)
+        cached = _DATA_TYPE_NAME_CACHE.get(cache_key)
+        if cached is not None:
+            names[data_type_id] = cached
+            continue
+        if data_type_id.NamespaceIndex == 0:
+            name = _STANDARD_DATA_TYPES.get(data_type_id.Identifier)
+            if name is not None:
+                names[data_type_id] = name
+                _DATA_TYPE_NAME_CACHE[cache_key] = name
+        if data_type_id not in names and data_type_id not in unresolved:
+            unresolved.append(data_type_id)
+    
+    if unresolved:
+        params = ua.ReadParameters()
+        for data_type_id in unresolved:
+            rv = ua.ReadValueId()
+            rv.NodeId = data_type_id
+            rv.AttributeId = ua.AttributeIds.BrowseName
+            params.NodesToRead.append(rv)
+        try:
+            results = await client.uaclient.read(params)
+            for data_type_id, data_value in zip(unresolved, results):
+                try:
+                    name = data_value.Value.Value.Name
+                    # 서버에서 해석한 이름도 캐시 (Unknown은 일시적일 수 있어 제외)
+                    _DATA_TYPE_NAME_CACHE[(data_type_id.NamespaceIndex, data_type_id.Identifier)] = name
+                    names[data_type_id] = name
+                except Exception:
+                    names[data_type_id] = f"Unknown({data_type_id})"
+        except Exception as e:
+            logger.debug("Failed to get data type names: %s", e)
+            for data_type_id in unresolved:
+                names.setdefault(data_type_id, f"Unknown({data_type_id})")
+    
+    return names
+
+
 async def _get_data_type_name(client: Client, data_type_id: ua.NodeId) -> str:
     """
     Helper function to get the name of a data type from its ID.
@@ -179,72 +379,123 @@ async def _get_data_type_name(client: Client, data_type_id: ua.NodeId) -> str:
         Name of the data type
     """
     try:
-        # Check if it's a standard data type
+        cache_key = (data_type_id.NamespaceIndex, data_type_id.Identifier)
+        cached = _DATA_TYPE_NAME_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        # Check if it's a standard data type - O(1) 역방향 사전 조회
         if data_type_id.NamespaceIndex == 0:
-            # Use the standard UA DataType dictionary
-            for name, id_val in vars(ua.ObjectIds).items():
-                if id_val == data_type_id.Identifier:
-                    return name
+            name = _STANDARD_DATA_TYPES.get(data_type_id.Identifier)
+            if name is not None:
+                _DATA_TYPE_NAME_CACHE[cache_key] = name
+                return name
                     
         # If not found or not a standard type, get it from the server
         type_node = client.get_node(data_type_id)
         browse_name = await type_node.read_browse_name()
+        _DATA_TYPE_NAME_CACHE[cache_key] = browse_name.Name
         return browse_name.Name
     except Exception as e:
-        logger.debug(f"Failed to get data type name: {e}")
+        logger.debug("Failed to get data type name: %s", e)
         return f"Unknown({data_type_id})"
 
 
-async def find_methods(client: Client, parent_id: Optional[str] = None) -> List[Dict[str, Any]]:
+async def find_methods(client: Client, parent_id: Optional[Union[str, ua.NodeId]] = None, force_refresh: bool = False, _semaphore: Optional[asyncio.Semaphore] = None, _visited: Optional[Set[str]] = None) -> List[Dict[str, Any]]:
     """
     Find all methods under a parent node.
     
     Args:
         client: The client with an established connection
-        parent_id: The ID of the parent node (None for root)
+        parent_id: The ID of the parent node as a string or NodeId (None for Objects folder)
+        force_refresh: Skip the discovery cache and re-walk the server
+        _semaphore: Shared semaphore bounding concurrent requests (for internal use)
+        _visited: NodeIds already visited, to avoid re-walking shared objects (for internal use)
         
     Returns:
         List of dictionaries containing method information
     """
+    # 탐색 루트 호출만 캐시 대상 (재귀 내부 호출은 _visited가 전달됨)
+    cache_key = None
+    if _visited is None:
+        cache_key = (id(client), str(parent_id) if parent_id is not None else "i=85")
+        if not force_refresh:
+            cached = _FIND_METHODS_CACHE.get(cache_key)
+            if cached is not None and time.monotonic() - cached[0] < _FIND_METHODS_CACHE_TTL:
+                return cached[1]
+    
+    # 전체 탐색이 하나의 세마포어를 공유해 동시 요청 수를 제한
+    if _semaphore is None:
+        _semaphore = asyncio.Semaphore(_FIND_METHODS_PARALLELISM)
+    # 같은 Object가 Organizes/HasComponent 등 여러 참조로 도달 가능하므로
+    # 방문 집합으로 중복 탐색(DAG에서의 지수적 폭증)을 차단
+    if _visited is None:
+        _visited = set()
+    
     try:
         if parent_id is None:
-            # Start from Objects folder if no parent specified
-            parent_id = "i=85"  # Objects folder
+            # Start from Objects folder if no parent specified - 미리 만든 NodeId 사용
+            parent_id = _OBJECTS_FOLDER_NODEID
             
         parent_node = client.get_node(parent_id)
         
-        # Get all references
-        references = await parent_node.get_references()
+        # Get all references - I/O 구간만 세마포어로 감싸 재귀 대기 중 교착을 방지
+        async with _semaphore:
+            references = await parent_node.get_references()
         
         methods = []
         
-        # Find method nodes
+        # Find method nodes - 이 레벨의 메서드 이름들을 하나의 ReadRequest로 조회
+        # (여러 참조로 중복 노출된 메서드는 한 번만)
+        method_refs = []
         for ref in references:
             if ref.NodeClass == ua.NodeClass.Method:
-                method_node = client.get_node(ref.NodeId)
-                
-                # Get basic information
-                display_name = await method_node.read_display_name()
-                browse_name = await method_node.read_browse_name()
-                
+                ref_key = str(ref.NodeId)
+                if ref_key not in _visited:
+                    _visited.add(ref_key)
+                    method_refs.append(ref)
+        if method_refs:
+            params = ua.ReadParameters()
+            for ref in method_refs:
+                for attr_id in (ua.AttributeIds.BrowseName, ua.AttributeIds.DisplayName):
+                    rv = ua.ReadValueId()
+                    rv.NodeId = client.get_node(ref.NodeId).nodeid
+                    rv.AttributeId = attr_id
+                    params.NodesToRead.append(rv)
+            async with _semaphore:
+                results = await client.uaclient.read(params)
+            
+            for i, ref in enumerate(method_refs):
+                browse_name = results[2 * i].Value.Value
+                display_name = results[2 * i + 1].Value.Value
                 methods.append({
                     "NodeId": str(ref.NodeId),
-                    "BrowseName": browse_name.Name,
-                    "DisplayName": display_name.Text,
-                    "ParentId": parent_id
+                    "BrowseName": browse_name.Name if browse_name else None,
+                    "DisplayName": display_name.Text if display_name else None,
+                    "ParentId": str(parent_id)
                 })
                 
-        # Get methods from child objects recursively
+        # Get methods from child objects - 순차 재귀 대신 동시에 탐색
+        object_refs = []
         for ref in references:
             if ref.NodeClass == ua.NodeClass.Object:
-                try:
-                    # Convert NodeId properly to string
-                    child_node_id = str(ref.NodeId)
-                    child_methods = await find_methods(client, child_node_id)
+                ref_key = str(ref.NodeId)
+                if ref_key not in _visited:
+                    _visited.add(ref_key)
+                    object_refs.append(ref)
+        if object_refs:
+            # NodeId를 문자열로 변환했다 다시 파싱하지 않고 그대로 전달
+            child_results = await asyncio.gather(
+                *(find_methods(client, ref.NodeId, _semaphore=_semaphore, _visited=_visited) for ref in object_refs),
+                return_exceptions=True)
+            for ref, child_methods in zip(object_refs, child_results):
+                if isinstance(child_methods, Exception):
+                    logger.debug("Failed to get methods from child node %s: %s", ref.NodeId, child_methods)
+                else:
                     methods.extend(child_methods)
-                except Exception as e:
-                    logger.debug(f"Failed to get methods from child node {ref.NodeId}: {e}")
         
+        if cache_key is not None:
+            _FIND_METHODS_CACHE[cache_key] = (time.monotonic(), methods)
         return methods
     except Exception as e:
         # More detailed error information
@@ -258,6 +509,21 @@ async def find_methods(client: Client, parent_id: Optional[str] = None) -> List[
         return []
 
 
+def invalidate_method_info(method_id: Optional[str] = None) -> None:
+    """
+    Invalidate cached method metadata.
+    
+    Args:
+        method_id: The ID of the method to invalidate (None for all)
+    """
+    if method_id is None:
+        _METHOD_INFO_CACHE.clear()
+    else:
+        # 어느 클라이언트에서 캐시됐든 해당 메서드 항목을 모두 제거
+        for cache_key in [k for k in _METHOD_INFO_CACHE if k[1] == method_id]:
+            del _METHOD_INFO_CACHE[cache_key]
+
+
 async def call_method_with_typed_params(
     client: Client,
     object_id: str,
@@ -277,43 +543,37 @@ async def call_method_with_typed_params(
         List of output values with proper types
     """
     try:
-        # Get method information
-        method_info = await get_method_info(client, method_id)
+        # Get method information - 캐시에 있으면 서버 왕복 생략
+        cache_key = (id(client), method_id)
+        method_info = _METHOD_INFO_CACHE.get(cache_key)
+        if method_info is not None:
+            _METHOD_INFO_CACHE.move_to_end(cache_key)
+        else:
+            method_info = await get_method_info(client, method_id)
+            _METHOD_INFO_CACHE[cache_key] = method_info
+            if len(_METHOD_INFO_CACHE) > _METHOD_INFO_CACHE_MAXSIZE:
+                _METHOD_INFO_CACHE.popitem(last=False)
         input_args_info = method_info.get("InputArguments", [])
         
         # Check if number of provided arguments matches
         if len(input_values) != len(input_args_info):
             raise ValueError(f"Expected {len(input_args_info)} arguments, got {len(input_values)}")
         
-        # Convert input values to appropriate types
+        # Convert input values to appropriate types - 타입 이름으로 O(1) 디스패치
         converted_args = []
         
-        for i, (value, arg_info) in enumerate(zip(input_values, input_args_info)):
+        for value, arg_info in zip(input_values, input_args_info):
             data_type = arg_info.get("DataType", "")
+            base_type = data_type.split("(")[0]
             
-            # Convert value based on data type
             converted_value = value
-            
-            # Handle common data types
-            if "Boolean" in data_type and not isinstance(value, bool):
-                if isinstance(value, str):
-                    converted_value = value.lower() in ("true", "yes", "1", "y")
-                else:
-                    converted_value = bool(value)
-                    
-            elif "Int" in data_type and not isinstance(value, int):
-                converted_value = int(value)
-                
-            elif ("Double" in data_type or "Float" in data_type) and not isinstance(value, float):
-                converted_value = float(value)
+            expected_type, convert = _ARG_CONVERTERS.get(base_type, (None, None))
+            if convert is not None and not isinstance(value, expected_type):
+                converted_value = convert(value)
                 # For OPC UA Double type, ensure proper precision
-                if "Double" in data_type:
+                if base_type == "Double":
                     converted_value = ua.Variant(converted_value, ua.VariantType.Double)
-                    
-            elif "String" in data_type and not isinstance(value, str):
-                converted_value = str(value)
             
-            # If we haven't created a Variant yet, do it now
             converted_args.append(converted_value)
         
         # Call the method with converted arguments
@@ -338,5 +598,5 @@ async def call_method_with_typed_params(
         # (opcua_app.py에서 None을 "success"로 표시)
         return result
     except Exception as e:
-        logger.error(f"Failed to call method with typed parameters: {e}")
+        logger.error("Failed to call method with typed parameters: %s", e)
         raise 
\ No newline at end of file
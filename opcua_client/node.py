@@ -4,14 +4,131 @@ Node module for OPC UA client.
 This module provides functions to browse nodes and read/write node attributes.
 """
 
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional, Union, Set
+from typing import Any, Dict, List, Optional, Tuple, Union, Set
 
 from asyncua import Client, ua
 from asyncua.common.node import Node
 
 logger = logging.getLogger(__name__)
 
+# (클라이언트 id, NodeId 문자열) -> Node 캐시 - 빡빡한 루프에서 같은 노드를
+# 반복 참조할 때 NodeId 문자열 파싱과 Node 생성을 아낍니다. (용량 제한)
+_NODE_CACHE_MAXSIZE = 4096
+_node_cache: Dict[Tuple[int, str], Node] = {}
+
+
+def get_cached_node(client: Client, node_id: str) -> Node:
+    """문자열 NodeId로 Node 객체를 얻습니다 (캐시 사용)."""
+    cache_key = (id(client), node_id)
+    node = _node_cache.get(cache_key)
+    if node is None:
+        node = client.get_node(node_id)
+        # 단순 용량 제한 - 초과 시 가장 오래된 항목부터 제거
+        if len(_node_cache) >= _NODE_CACHE_MAXSIZE:
+            _node_cache.pop(next(iter(_node_cache)))
+        _node_cache[cache_key] = node
+    return node
+
+
+# 같은 이벤트 루프 틱에 몰려 들어오는 단건 읽기들을 작은 시간 창 동안 모아
+# 하나의 ReadRequest로 내보내는 투명 배처 설정
+_READ_BATCH_MAX_SIZE = 50
+_READ_BATCH_MAX_DELAY = 0.002  # 초
+
+
+class _ReadBatcher:
+    """
+    단건 속성 읽기를 모아 일괄 전송하는 배처.
+
+    첫 항목이 들어오면 loop.call_later로 짧은 플러시 타이머를 걸고,
+    창이 닫히거나 최대 크기에 도달하면 모인 항목을 한 번의
+    uaclient.read로 내보낸 뒤 각 호출자의 Future에 결과를 나눠 줍니다.
+    """
+
+    __slots__ = ("_client", "_pending", "_handle")
+
+    def __init__(self, client: Client):
+        self._client = client
+        self._pending: List[Tuple[ua.ReadValueId, asyncio.Future]] = []
+        self._handle: Optional[asyncio.TimerHandle] = None
+
+    def submit(self, node_id: ua.NodeId, attribute: ua.AttributeIds) -> asyncio.Future:
+        """읽기 요청 하나를 등록하고 결과(DataValue)를 받을 Future를 돌려줍니다."""
+        loop = asyncio.get_event_loop()
+        future = loop.create_future()
+        rv = ua.ReadValueId()
+        rv.NodeId = node_id
+        rv.AttributeId = attribute
+        self._pending.append((rv, future))
+
+        if len(self._pending) >= _READ_BATCH_MAX_SIZE:
+            if self._handle is not None:
+                self._handle.cancel()
+                self._handle = None
+            asyncio.ensure_future(self._flush())
+        elif self._handle is None:
+            self._handle = loop.call_later(_READ_BATCH_MAX_DELAY, self._fire)
+        return future
+
+    def _fire(self):
+        self._handle = None
+        asyncio.ensure_future(self._flush())
+
+    async def _flush(self):
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+        params = ua.ReadParameters()
+        params.NodesToRead = [rv for rv, _future in pending]
+        try:
+            results = await self._client.uaclient.read(params)
+        except Exception as e:
+            for _rv, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_rv, future), data_value in zip(pending, results):
+            if future.done():
+                continue
+            # 기존 Node.read_attribute와 동일하게 불량 상태는 예외로 전달
+            try:
+                data_value.StatusCode.check()
+            except Exception as status_err:
+                future.set_exception(status_err)
+            else:
+                future.set_result(data_value)
+
+
+_read_batchers: Dict[int, _ReadBatcher] = {}
+
+
+def _get_read_batcher(client: Client) -> _ReadBatcher:
+    """클라이언트별 읽기 배처를 얻습니다 (없으면 생성)."""
+    batcher = _read_batchers.get(id(client))
+    if batcher is None:
+        batcher = _ReadBatcher(client)
+        _read_batchers[id(client)] = batcher
+    return batcher
+
+
+def clear_node_cache(client: Optional[Client] = None) -> None:
+    """
+    Node 캐시를 비웁니다. 연결 해제 시 호출하세요.
+    
+    Args:
+        client: 특정 클라이언트의 항목만 제거 (None이면 전체)
+    """
+    if client is None:
+        _node_cache.clear()
+        _read_batchers.clear()
+        return
+    client_id = id(client)
+    for cache_key in [k for k in _node_cache if k[0] == client_id]:
+        del _node_cache[cache_key]
+    _read_batchers.pop(client_id, None)
+
 
 async def browse_node(client: Client, node_id: Optional[str] = None) -> List[Node]:
     """
@@ -32,57 +149,68 @@ async def browse_node(client: Client, node_id: Optional[str] = None) -> List[Nod
     try:
         children = await node.get_children()
         
-        # 중복 제거를 위해 각 노드의 DisplayName과 NodeId를 추적
+        # NodeId 기준 중복 제거 - 이름 읽기는 로깅에만 필요하므로 분리
         unique_children = []
-        seen_nodes = set()  # (display_name, nodeid) 튜플의 집합
-        
+        seen_nodes = set()
         for child in children:
-            # 노드 정보 가져오기
-            browse_name = await child.read_browse_name()
-            display_name = await child.read_display_name()
-            
-            # 노드 ID 처리 및 로깅
-            node_id_str = str(child.nodeid)
-            if len(node_id_str) > 50:
-                node_id_str_display = f"{node_id_str[:30]}...{node_id_str[-10:]}"
-            else:
-                node_id_str_display = node_id_str
-                
-            logger.info(f"Node: {display_name.Text}, ID: {node_id_str_display}")
-            
-            # 중복 확인 (DisplayName과 NodeId 둘 다 확인)
-            node_key = (display_name.Text, node_id_str)
-            
+            node_key = str(child.nodeid)
             if node_key not in seen_nodes:
                 seen_nodes.add(node_key)
                 unique_children.append(child)
         
+        # 로깅이 켜져 있을 때만 DisplayName을 단일 ReadRequest로 일괄 조회
+        # (꺼져 있으면 자식 수만큼의 왕복을 전부 생략)
+        if unique_children and logger.isEnabledFor(logging.INFO):
+            params = ua.ReadParameters()
+            for child in unique_children:
+                rv = ua.ReadValueId()
+                rv.NodeId = child.nodeid
+                rv.AttributeId = ua.AttributeIds.DisplayName
+                params.NodesToRead.append(rv)
+            results = await client.uaclient.read(params)
+            
+            for child, data_value in zip(unique_children, results):
+                display_name = data_value.Value.Value if data_value.Value is not None else None
+                node_id_str = str(child.nodeid)
+                if len(node_id_str) > 50:
+                    node_id_str = f"{node_id_str[:30]}...{node_id_str[-10:]}"
+                logger.info("Node: %s, ID: %s",
+                            display_name.Text if display_name else None, node_id_str)
+        
         return unique_children
     except Exception as e:
         # 예외 메시지 간결화
         err_msg = str(e)
         if len(err_msg) > 100:
             err_msg = f"{err_msg[:100]}... [내용 생략]"
-        logger.error(f"Failed to browse node: {err_msg}")
+        logger.error("Failed to browse node: %s", err_msg)
         return []
 
 
-async def browse_nodes_recursive(client: Client, node_id: Optional[Union[str, Node]] = None, max_depth: int = 1, current_depth: int = 0) -> Dict[str, Any]:
+async def browse_nodes_recursive(client: Client, node_id: Optional[Union[str, Node]] = None, max_depth: int = 1, current_depth: int = 0, _semaphore: Optional[asyncio.Semaphore] = None) -> Dict[str, Any]:
     """
     Browse nodes recursively starting from the specified node up to a maximum depth.
     
+    노드 단위 재귀 대신 레벨 단위 BFS로 진행하며, 레벨마다 속성 읽기와
+    자식 브라우즈를 각각 하나의 배치 요청으로 내보냅니다 - 왕복 수가
+    O(노드 수)에서 O(깊이)로 줄어듭니다.
+    
     Args:
         client: The client with an established connection
         node_id: The ID of the node to browse or Node object (None for root node)
         max_depth: Maximum recursion depth
         current_depth: Current recursion depth (for internal use)
+        _semaphore: Unused; kept for call compatibility
         
     Returns:
         Dictionary containing node information in a hierarchical structure
     """
     if current_depth > max_depth:
         return {}
-        
+
+    _LEVEL_ATTRS = (ua.AttributeIds.BrowseName, ua.AttributeIds.DisplayName,
+                    ua.AttributeIds.NodeClass)
+
     try:
         # Get the Node object
         if node_id is None:
@@ -91,61 +219,86 @@ async def browse_nodes_recursive(client: Client, node_id: Optional[Union[str, No
             node = node_id
         else:
             node = client.get_node(node_id)
-            
-        # Get node info
-        browse_name = await node.read_browse_name()
-        display_name = await node.read_display_name()
-        node_class = await node.read_node_class()
-        
-        # Create node info dictionary
-        node_info = {
+
+        root_info: Dict[str, Any] = {
             "NodeId": str(node.nodeid),
-            "BrowseName": browse_name.Name,
-            "DisplayName": display_name.Text,
-            "NodeClass": node_class.name,
             "Level": current_depth,
             "Children": []
         }
-        
-        # If we haven't reached max depth, get children
-        if current_depth < max_depth:
-            children = await node.get_children()
-            for child in children:
+        level = [(node, root_info)]
+        depth = current_depth
+
+        while level and depth <= max_depth:
+            # 이 레벨 전체의 BrowseName/DisplayName/NodeClass를 한 번에 읽기
+            params = ua.ReadParameters()
+            for level_node, _info in level:
+                for attr_id in _LEVEL_ATTRS:
+                    rv = ua.ReadValueId()
+                    rv.NodeId = level_node.nodeid
+                    rv.AttributeId = attr_id
+                    params.NodesToRead.append(rv)
+            results = await client.uaclient.read(params)
+
+            for i, (_level_node, info) in enumerate(level):
+                browse_dv, display_dv, class_dv = results[3 * i:3 * i + 3]
+                try:
+                    info["BrowseName"] = browse_dv.Value.Value.Name
+                except Exception:
+                    info["BrowseName"] = "Unknown"
+                try:
+                    info["DisplayName"] = display_dv.Value.Value.Text
+                except Exception:
+                    info["DisplayName"] = "Unknown"
                 try:
-                    # 직접 노드 객체를 전달하여 문자열 변환 문제 방지
-                    child_info = await browse_nodes_recursive(
-                        client, 
-                        child,  # 문자열 대신 노드 객체 전달
-                        max_depth, 
-                        current_depth + 1
-                    )
-                    if child_info:  # Only add if we got valid info
-                        node_info["Children"].append(child_info)
-                except Exception as child_e:
-                    # 자식 노드 처리 중 오류 발생 시 오류 정보를 표시하는 노드 추가
-                    error_info = {
+                    info["NodeClass"] = ua.NodeClass(class_dv.Value.Value).name
+                except Exception:
+                    info["NodeClass"] = "Unknown"
+
+            if depth >= max_depth:
+                break
+
+            # 이 레벨 전체의 자식을 한 번의 Browse 요청으로 조회
+            browse_params = ua.BrowseParameters()
+            browse_params.RequestedMaxReferencesPerNode = 0
+            for level_node, _info in level:
+                bd = ua.BrowseDescription()
+                bd.NodeId = level_node.nodeid
+                bd.BrowseDirection = ua.BrowseDirection.Forward
+                bd.ReferenceTypeId = ua.NodeId(ua.ObjectIds.HierarchicalReferences)
+                bd.IncludeSubtypes = True
+                bd.NodeClassMask = 0
+                bd.ResultMask = 63  # 모든 참조 필드 포함
+                browse_params.NodesToBrowse.append(bd)
+            browse_results = await client.uaclient.browse(browse_params)
+
+            next_level = []
+            for (_level_node, info), result in zip(level, browse_results):
+                references = getattr(result, "References", None) or []
+                for ref in references:
+                    child = client.get_node(ref.NodeId)
+                    child_info: Dict[str, Any] = {
                         "NodeId": str(child.nodeid),
-                        "BrowseName": "Error",
-                        "DisplayName": f"Error: {str(child_e)}",
-                        "NodeClass": "Unknown",
-                        "Level": current_depth + 1,
+                        "Level": depth + 1,
                         "Children": []
                     }
-                    node_info["Children"].append(error_info)
-        
-        return node_info
+                    info["Children"].append(child_info)
+                    next_level.append((child, child_info))
+            level = next_level
+            depth += 1
+
+        return root_info
     except Exception as e:
         # 오류 발생 시 오류 정보를 포함한 노드 반환
         node_id_str = str(node_id) if not isinstance(node_id, Node) else str(node_id.nodeid)
-        error_info = {
-            "NodeId": node_id_str if node_id else "root",
+        logger.error("Failed to browse node %s: %s", node_id_str, e)
+        return {
+            "NodeId": node_id_str,
             "BrowseName": "Error",
             "DisplayName": f"Error: {str(e)}",
             "NodeClass": "Unknown",
             "Level": current_depth,
             "Children": []
         }
-        return error_info
 
 
 async def get_node_info(client: Client, node_id: str) -> Dict[str, Any]:
@@ -159,63 +312,91 @@ async def get_node_info(client: Client, node_id: str) -> Dict[str, Any]:
     Returns:
         Dictionary containing node information
     """
-    node = client.get_node(node_id)
+    node = get_cached_node(client, node_id)
     try:
         info = {}
         # 기본 속성들 읽기
         info["NodeId"] = str(node.nodeid)
         
-        # 주요 속성들 읽기 - 각 속성에 대해 개별 예외 처리
-        try:
-            browse_name = await node.read_browse_name()
-            info["BrowseName"] = browse_name.Name
-        except Exception as e:
-            logger.debug(f"Failed to read BrowseName: {e}")
+        # 주요 속성들을 동시에 읽기 - 순차 대기(sum) 대신 max(read)로 단축
+        (browse_name, display_name, node_class,
+         description, value, references) = await asyncio.gather(
+            node.read_browse_name(),
+            node.read_display_name(),
+            node.read_node_class(),
+            node.read_description(),
+            node.read_value(),
+            node.get_references(),
+            return_exceptions=True)
+        
+        # 각 속성에 대해 개별 예외 처리
+        if isinstance(browse_name, Exception):
+            logger.debug("Failed to read BrowseName: %s", browse_name)
             info["BrowseName"] = None
-            
-        try:
-            display_name = await node.read_display_name()
-            info["DisplayName"] = display_name.Text
-        except Exception as e:
-            logger.debug(f"Failed to read DisplayName: {e}")
+        else:
+            info["BrowseName"] = browse_name.Name
+        
+        if isinstance(display_name, Exception):
+            logger.debug("Failed to read DisplayName: %s", display_name)
             info["DisplayName"] = None
-            
-        try:
-            node_class = await node.read_node_class()
-            info["NodeClass"] = node_class.name
-        except Exception as e:
-            logger.debug(f"Failed to read NodeClass: {e}")
+        else:
+            info["DisplayName"] = display_name.Text
+        
+        if isinstance(node_class, Exception):
+            logger.debug("Failed to read NodeClass: %s", node_class)
             info["NodeClass"] = None
+        else:
+            info["NodeClass"] = node_class.name
         
-        try:
-            description = await node.read_description()
-            info["Description"] = description.Text if description.Text else None
-        except Exception as e:
-            logger.debug(f"Failed to read Description: {e}")
+        if isinstance(description, Exception):
+            logger.debug("Failed to read Description: %s", description)
             info["Description"] = None
-            
-        # Value 속성 읽기 시도
-        try:
-            value = await node.read_value()
-            info["Value"] = value
-        except Exception as e:
-            logger.debug(f"Failed to read Value: {e}")
+        else:
+            info["Description"] = description.Text if description.Text else None
+        
+        if isinstance(value, Exception):
+            logger.debug("Failed to read Value: %s", value)
             info["Value"] = None
+        else:
+            info["Value"] = value
         
-        # 참조 정보 추가
-        try:
-            references = await node.get_references()
-            info["ReferenceCount"] = len(references)
-        except Exception as e:
-            logger.debug(f"Failed to get references: {e}")
+        if isinstance(references, Exception):
+            logger.debug("Failed to get references: %s", references)
             info["ReferenceCount"] = None
+        else:
+            info["ReferenceCount"] = len(references)
         
         return info
     except Exception as e:
-        logger.error(f"Failed to get node info: {e}")
+        logger.error("Failed to get node info: %s", e)
         raise
 
 
+# 표준 OPC UA 속성 목록 - 호출마다 딕셔너리를 다시 만들지 않도록 모듈 로드 시 한 번만 구성
+_ALL_ATTR_NAMES = {
+    ua.AttributeIds.NodeId: "NodeId",
+    ua.AttributeIds.NodeClass: "NodeClass",
+    ua.AttributeIds.BrowseName: "BrowseName",
+    ua.AttributeIds.DisplayName: "DisplayName",
+    ua.AttributeIds.Description: "Description",
+    ua.AttributeIds.WriteMask: "WriteMask",
+    ua.AttributeIds.UserWriteMask: "UserWriteMask",
+    ua.AttributeIds.Value: "Value",
+    ua.AttributeIds.DataType: "DataType",
+    ua.AttributeIds.ValueRank: "ValueRank",
+    ua.AttributeIds.ArrayDimensions: "ArrayDimensions",
+    ua.AttributeIds.AccessLevel: "AccessLevel",
+    ua.AttributeIds.UserAccessLevel: "UserAccessLevel",
+    ua.AttributeIds.MinimumSamplingInterval: "MinimumSamplingInterval",
+    ua.AttributeIds.Historizing: "Historizing",
+    ua.AttributeIds.Executable: "Executable",
+    ua.AttributeIds.UserExecutable: "UserExecutable",
+    ua.AttributeIds.EventNotifier: "EventNotifier",
+    ua.AttributeIds.IsAbstract: "IsAbstract",
+}
+_ALL_ATTR_IDS = tuple(_ALL_ATTR_NAMES)
+
+
 async def get_all_node_attributes(client: Client, node_id: str) -> Dict[str, Any]:
     """
     Get all available attributes for a node.
@@ -227,7 +408,7 @@ async def get_all_node_attributes(client: Client, node_id: str) -> Dict[str, Any
     Returns:
         Dictionary containing all available node attributes
     """
-    node = client.get_node(node_id)
+    node = get_cached_node(client, node_id)
     attributes = {}
     
     try:
@@ -235,43 +416,26 @@ async def get_all_node_attributes(client: Client, node_id: str) -> Dict[str, Any
         node_id_str = str(node.nodeid)
         attributes["NodeId"] = node_id_str
     except Exception as e:
-        logger.debug(f"Failed to convert NodeId to string: {e}")
-    
-    # 표준 OPC UA 속성 목록
-    attr_dict = {
-        ua.AttributeIds.NodeId: "NodeId",
-        ua.AttributeIds.NodeClass: "NodeClass",
-        ua.AttributeIds.BrowseName: "BrowseName",
-        ua.AttributeIds.DisplayName: "DisplayName",
-        ua.AttributeIds.Description: "Description",
-        ua.AttributeIds.WriteMask: "WriteMask",
-        ua.AttributeIds.UserWriteMask: "UserWriteMask",
-        ua.AttributeIds.Value: "Value",
-        ua.AttributeIds.DataType: "DataType",
-        ua.AttributeIds.ValueRank: "ValueRank",
-        ua.AttributeIds.ArrayDimensions: "ArrayDimensions",
-        ua.AttributeIds.AccessLevel: "AccessLevel",
-        ua.AttributeIds.UserAccessLevel: "UserAccessLevel",
-        ua.AttributeIds.MinimumSamplingInterval: "MinimumSamplingInterval",
-        ua.AttributeIds.Historizing: "Historizing",
-        ua.AttributeIds.Executable: "Executable",
-        ua.AttributeIds.UserExecutable: "UserExecutable",
-        ua.AttributeIds.EventNotifier: "EventNotifier",
-        ua.AttributeIds.IsAbstract: "IsAbstract"
-    }
+        logger.debug("Failed to convert NodeId to string: %s", e)
     
     # 모든 속성을 한 번에 읽기 위한 준비
+    attr_dict = _ALL_ATTR_NAMES
     try:
         # 한 번에 모든 속성 읽기 - 단일 Read Request/Response
-        # GitHub 공식 레포지토리 방법 사용: node.read_attributes()
-        attr_list = list(attr_dict.keys())
+        attr_list = _ALL_ATTR_IDS
         
-        logger.info(f"Reading {len(attr_list)} attributes with single request using read_attributes()")
+        logger.info("Reading %s attributes with a single batched request", len(attr_list))
         
-        # 단일 Read Request로 모든 속성 읽기
-        results = await node.read_attributes(attr_list)
+        # 단일 Read Request로 모든 속성 읽기 (ReadValueId 목록을 직접 구성)
+        params = ua.ReadParameters()
+        for attr_id in attr_list:
+            rv = ua.ReadValueId()
+            rv.NodeId = node.nodeid
+            rv.AttributeId = attr_id
+            params.NodesToRead.append(rv)
+        results = await client.uaclient.read(params)
         
-        logger.info(f"Single read request successful - got {len(results)} results")
+        logger.info("Single read request successful - got %s results", len(results))
         
         # 결과 처리 - GitHub 레포지토리 방법 참고
         for i, attr_id in enumerate(attr_list):
@@ -284,7 +448,7 @@ async def get_all_node_attributes(client: Client, node_id: str) -> Dict[str, Any
                     try:
                         # Value 접근 - GitHub 방법
                         if result.Value is None:
-                            logger.debug(f"Attribute {attr_name} has None value")
+                            logger.debug("Attribute %s has None value", attr_name)
                             continue
                             
                         # 속성 타입에 따른 가공
@@ -305,7 +469,7 @@ async def get_all_node_attributes(client: Client, node_id: str) -> Dict[str, Any
                                 data_type_name = await data_type_node.read_browse_name()
                                 attributes["DataTypeName"] = data_type_name.Name
                             except Exception as e:
-                                logger.debug(f"Failed to get DataTypeName: {e}")
+                                logger.debug("Failed to get DataTypeName: %s", e)
                         elif attr_id == ua.AttributeIds.AccessLevel or attr_id == ua.AttributeIds.UserAccessLevel:
                             access_level = result.Value.Value
                             access_texts = []
@@ -323,84 +487,15 @@ async def get_all_node_attributes(client: Client, node_id: str) -> Dict[str, Any
                         else:
                             attributes[attr_name] = result.Value.Value
                     except Exception as e:
-                        logger.debug(f"Failed to process attribute {attr_name}: {e}")
+                        logger.debug("Failed to process attribute %s: %s", attr_name, e)
                 else:
-                    logger.debug(f"Attribute {attr_name} returned bad status: {result.StatusCode}")
+                    logger.debug("Attribute %s returned bad status: %s", attr_name, result.StatusCode)
         
-        logger.info(f"Successfully read {len(attributes)} attributes using single read_attributes() request")
+        logger.info("Successfully read %s attributes using single read_attributes() request", len(attributes))
     
     except Exception as e:
-        logger.error(f"Failed to read attributes with single request: {e}")
-        # 단일 요청 실패 시 개별 요청으로 폴백 (호환성 보장)
-        logger.info("Falling back to individual attribute reads")
-        
-        # 중요 속성 먼저 가져오기 시도 (표시 이름, 값, 데이터 타입)
-        important_attrs = [
-            ua.AttributeIds.BrowseName,
-            ua.AttributeIds.DisplayName,
-            ua.AttributeIds.Value,
-            ua.AttributeIds.DataType,
-            ua.AttributeIds.NodeClass
-        ]
-        
-        for attr_id in important_attrs:
-            attr_name = attr_dict.get(attr_id)
-            if attr_name:
-                try:
-                    value = await node.read_attribute(attr_id)
-                    if not value.Value.is_empty():
-                        if attr_id == ua.AttributeIds.NodeClass:
-                            attributes[attr_name] = ua.NodeClass(value.Value.Value).name
-                        elif attr_id == ua.AttributeIds.BrowseName:
-                            attributes[attr_name] = value.Value.Value.Name
-                        elif attr_id == ua.AttributeIds.DisplayName:
-                            attributes[attr_name] = value.Value.Value.Text
-                        elif attr_id == ua.AttributeIds.Value:
-                            attributes[attr_name] = value.Value.Value
-                        elif attr_id == ua.AttributeIds.DataType:
-                            attributes[attr_name] = value.Value.Value
-                            # 데이터 타입 이름 직접 조회
-                            try:
-                                data_type_id = value.Value.Value
-                                data_type_node = client.get_node(data_type_id)
-                                data_type_name = await data_type_node.read_browse_name()
-                                attributes["DataTypeName"] = data_type_name.Name
-                            except Exception as e:
-                                logger.debug(f"Failed to get DataTypeName: {e}")
-                except Exception as e:
-                    logger.debug(f"Failed to read important attribute {attr_name}: {e}")
-        
-        # 각 속성 읽기 시도 (중요하지 않은 나머지 속성들)
-        for attr_id, attr_name in attr_dict.items():
-            # 이미 처리한 중요 속성은 건너뛰기
-            if attr_id in important_attrs:
-                continue
-                
-            try:
-                value = await node.read_attribute(attr_id)
-                
-                # 값이 비어있지 않은 경우만 처리
-                if not value.Value.is_empty():
-                    # 속성 타입에 따른 가공
-                    if attr_id == ua.AttributeIds.AccessLevel or attr_id == ua.AttributeIds.UserAccessLevel:
-                        access_level = value.Value.Value
-                        access_texts = []
-                        if access_level & ua.AccessLevel.CurrentRead:
-                            access_texts.append("Read")
-                        if access_level & ua.AccessLevel.CurrentWrite:
-                            access_texts.append("Write")
-                        if access_level & ua.AccessLevel.HistoryRead:
-                            access_texts.append("HistoryRead")
-                        if access_level & ua.AccessLevel.HistoryWrite:
-                            access_texts.append("HistoryWrite")
-                        if access_level & ua.AccessLevel.SemanticChange:
-                            access_texts.append("SemanticChange")
-                        attributes[attr_name] = ", ".join(access_texts) if access_texts else "None"
-                    else:
-                        attributes[attr_name] = value.Value.Value
-            except Exception as e:
-                # 속성이 지원되지 않는 경우 무시하고 다음 속성으로 이동
-                logger.debug(f"Attribute {attr_name} not supported: {e}")
+        logger.error("Failed to read attributes with single request: %s", e)
+        # 일괄 읽기가 실패한 서버는 아래의 기본 정보 폴백(get_node_info)으로 처리
     
     # 추가 정보 가져오기 시도
     try:
@@ -417,18 +512,18 @@ async def get_all_node_attributes(client: Client, node_id: str) -> Dict[str, Any
                     type_name = await type_node.read_browse_name()
                     attributes["TypeName"] = type_name.Name
                 except Exception as e:
-                    logger.debug(f"Failed to get TypeName: {e}")
+                    logger.debug("Failed to get TypeName: %s", e)
         except Exception as e:
-            logger.debug(f"Failed to get TypeDefinition: {e}")
+            logger.debug("Failed to get TypeDefinition: %s", e)
             
         # 참조 개수 추가
         try:
             references = await node.get_references()
             attributes["ReferenceCount"] = len(references)
         except Exception as e:
-            logger.debug(f"Failed to get references: {e}")
+            logger.debug("Failed to get references: %s", e)
     except Exception as e:
-        logger.debug(f"Failed to get additional attributes: {e}")
+        logger.debug("Failed to get additional attributes: %s", e)
     
     # 적어도 하나 이상의 속성이 없으면 빈 dict 대신 기본 정보라도 채우기
     if not attributes or len(attributes) < 3:  # 최소한의 정보가 필요
@@ -439,11 +534,60 @@ async def get_all_node_attributes(client: Client, node_id: str) -> Dict[str, Any
                     if key not in attributes:
                         attributes[key] = value
         except Exception as e:
-            logger.debug(f"Failed to get fallback info: {e}")
+            logger.debug("Failed to get fallback info: %s", e)
     
     return attributes
 
 
+async def read_node_attributes(
+    client: Client,
+    node_ids: List[str],
+    attribute: ua.AttributeIds = ua.AttributeIds.Value
+) -> List[Any]:
+    """
+    Read the same attribute from multiple nodes in one server round-trip.
+    
+    노드별 read_node_attribute를 반복 호출하면 왕복이 N번 들지만,
+    하나의 ReadRequest로 묶으면 1번으로 끝납니다. 다수 노드를 읽는
+    루프는 이 함수로 옮기는 것을 권장합니다.
+    
+    Args:
+        client: The client with an established connection
+        node_ids: The IDs of the nodes to read from
+        attribute: The attribute to read (default: Value)
+        
+    Returns:
+        List of attribute values aligned with node_ids
+    """
+    params = ua.ReadParameters()
+    for node_id in node_ids:
+        rv = ua.ReadValueId()
+        rv.NodeId = get_cached_node(client, node_id).nodeid
+        rv.AttributeId = attribute
+        params.NodesToRead.append(rv)
+    try:
+        results = await client.uaclient.read(params)
+        return [data_value.Value.Value if data_value.Value is not None else None
+                for data_value in results]
+    except Exception as e:
+        logger.error("Failed to read node attributes: %s", e)
+        raise
+
+
+async def read_node_values(client: Client, node_ids: List[str]) -> List[Any]:
+    """
+    Read the Value attribute of multiple nodes in one server round-trip.
+    
+    Args:
+        client: The client with an established connection
+        node_ids: The IDs of the nodes to read from
+        
+    Returns:
+        List of values aligned with node_ids
+    """
+    return await read_node_attributes(client, node_ids, ua.AttributeIds.Value)
+
+
 async def read_node_attribute(client: Client, node_id: str, attribute: ua.AttributeIds = ua.AttributeIds.Value) -> Any:
     """
     Read an attribute from a node.
@@ -456,12 +600,13 @@ async def read_node_attribute(client: Client, node_id: str, attribute: ua.Attrib
     Returns:
         The value of the attribute
     """
-    node = client.get_node(node_id)
+    # 같은 틱에 몰린 단건 읽기들은 배처가 하나의 요청으로 묶어 줍니다.
     try:
-        value = await node.read_attribute(attribute)
-        return value.Value.Value
+        data_value = await _get_read_batcher(client).submit(
+            get_cached_node(client, node_id).nodeid, attribute)
+        return data_value.Value.Value if data_value.Value is not None else None
     except Exception as e:
-        logger.error(f"Failed to read node attribute: {e}")
+        logger.error("Failed to read node attribute: %s", e)
         raise
 
 
@@ -476,14 +621,45 @@ async def read_array_node_attribute(client: Client, node_id: str) -> List[Any]:
     Returns:
         List of values
     """
-    node = client.get_node(node_id)
+    node = get_cached_node(client, node_id)
     try:
         value = await node.read_value()
         if not isinstance(value, list):
             raise TypeError(f"Node does not contain an array. Actual type: {type(value)}")
         return value
     except Exception as e:
-        logger.error(f"Failed to read array node attribute: {e}")
+        logger.error("Failed to read array node attribute: %s", e)
+        raise
+
+
+async def write_node_attributes(
+    client: Client,
+    items: List[Tuple[str, Any, ua.AttributeIds]]
+) -> None:
+    """
+    Write values to multiple node attributes in one server round-trip.
+    
+    태그 1000개를 단건 write_node_attribute로 쓰면 왕복이 1000번 들지만,
+    하나의 WriteRequest로 묶으면 1번으로 끝납니다.
+    
+    Args:
+        client: The client with an established connection
+        items: List of (node_id, value, attribute) tuples to write
+    """
+    params = ua.WriteParameters()
+    for node_id, value, attribute in items:
+        wv = ua.WriteValue()
+        wv.NodeId = get_cached_node(client, node_id).nodeid
+        wv.AttributeId = attribute
+        wv.Value = ua.DataValue(ua.Variant(value))
+        params.NodesToWrite.append(wv)
+    try:
+        results = await client.uaclient.write(params)
+        for (node_id, _value, _attribute), status in zip(items, results):
+            status.check()
+        logger.info("Successfully wrote %s value(s)", len(items))
+    except Exception as e:
+        logger.error("Failed to write node attributes: %s", e)
         raise
 
 
@@ -502,13 +678,7 @@ async def write_node_attribute(
         value: The value to write
         attribute: The attribute to write to (default: Value)
     """
-    node = client.get_node(node_id)
-    try:
-        await node.write_attribute(attribute, ua.DataValue(ua.Variant(value)))
-        logger.info(f"Successfully wrote value to node {node_id}")
-    except Exception as e:
-        logger.error(f"Failed to write node attribute: {e}")
-        raise
+    await write_node_attributes(client, [(node_id, value, attribute)])
 
 
 async def find_nodes_by_name(client: Client, name_pattern: str, start_node_id: Optional[str] = None, case_sensitive: bool = False) -> List[Node]:
@@ -527,34 +697,52 @@ async def find_nodes_by_name(client: Client, name_pattern: str, start_node_id: O
     if not case_sensitive:
         name_pattern = name_pattern.lower()
     
+    # 탐색 배치 크기 - 한 번의 요청에 담을 노드 수
+    batch_size = 50
+    
     matches = []
     visited = set()
     
-    async def _search_recursive(node_id):
-        if node_id in visited:
-            return
-        
-        visited.add(node_id)
-        node = client.get_node(node_id)
+    # 재귀 대신 반복 DFS - 코루틴 프레임 할당을 줄이고 배치 요청을 가능하게 함
+    start_node = client.nodes.root if start_node_id is None else client.get_node(start_node_id)
+    stack = [start_node]
+    visited.add(start_node.nodeid)
+    
+    while stack:
+        batch = [stack.pop() for _ in range(min(batch_size, len(stack)))]
         
         try:
-            # Check if current node matches
-            display_name = await node.read_display_name()
-            name = display_name.Text
+            # 배치 전체의 DisplayName을 하나의 ReadRequest로 읽기
+            params = ua.ReadParameters()
+            for node in batch:
+                rv = ua.ReadValueId()
+                rv.NodeId = node.nodeid
+                rv.AttributeId = ua.AttributeIds.DisplayName
+                params.NodesToRead.append(rv)
+            results = await client.uaclient.read(params)
             
-            if (case_sensitive and name_pattern in name) or (not case_sensitive and name_pattern in name.lower()):
-                matches.append(node)
+            for node, data_value in zip(batch, results):
+                try:
+                    name = data_value.Value.Value.Text
+                except Exception:
+                    continue
+                if name and ((case_sensitive and name_pattern in name)
+                             or (not case_sensitive and name_pattern in name.lower())):
+                    matches.append(node)
             
-            # Search in children
-            children = await node.get_children()
-            for child in children:
-                await _search_recursive(child.nodeid)
-                
+            # 자식 조회는 동시에 수행하고, 방문한 노드는 건너뜀
+            children_lists = await asyncio.gather(
+                *(node.get_children() for node in batch),
+                return_exceptions=True)
+            for node, children in zip(batch, children_lists):
+                if isinstance(children, Exception):
+                    logger.debug("Error searching node %s: %s", node.nodeid, children)
+                    continue
+                for child in children:
+                    if child.nodeid not in visited:
+                        visited.add(child.nodeid)
+                        stack.append(child)
         except Exception as e:
-            logger.debug(f"Error searching node {node_id}: {e}")
-    
-    # Start search
-    start_node = client.nodes.root if start_node_id is None else client.get_node(start_node_id)
-    await _search_recursive(start_node.nodeid)
+            logger.debug("Error searching node batch: %s", e)
     
     return matches 
\ No newline at end of file
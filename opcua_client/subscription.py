@@ -8,6 +8,7 @@ import asyncio
 import logging
 import datetime
 import time
+from collections import deque
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union, Set
 
 from asyncua import Client, ua
@@ -73,6 +74,37 @@ def get_fallback_parameters(sub_info: dict) -> Tuple[float, int, int, int]:
     return publishing_interval, lifetime_count, max_keep_alive_count, priority
 
 
+async def tune_subscription(subscription: Subscription, in_flight_publishes: int = 4) -> None:
+    """
+    구독의 발행(Publish) 파이프라인 깊이를 조정합니다.
+
+    asyncua는 기본적으로 적은 수의 PublishRequest만 서버에 대기시키므로,
+    데이터 변경률이 높을 때 알림이 단일 왕복 창에 직렬화될 수 있습니다.
+    추가 PublishRequest를 미리 넣어 두면 서버가 응답을 연속으로 보낼 수
+    있어 처리량이 올라갑니다. 구독당 한 번만 적용됩니다(멱등).
+
+    Args:
+        subscription: The subscription to tune
+        in_flight_publishes: Desired number of outstanding publish requests
+    """
+    if getattr(subscription, '_publish_pipeline_tuned', False):
+        return
+    subscription._publish_pipeline_tuned = True
+
+    publish = getattr(subscription.server, 'publish', None)
+    if publish is None:
+        logger.debug("publish 파이프라인 조정 불가 - server.publish 미지원")
+        return
+    try:
+        # asyncua의 publish는 응답을 기다리지 않고 요청만 내보냅니다.
+        for _ in range(max(0, in_flight_publishes - 1)):
+            await publish([])
+        logger.debug(f"Publish 파이프라인 깊이를 {in_flight_publishes}로 조정했습니다.")
+    except Exception as e:
+        # 조정 실패는 기능에 영향 없음 - 기본 파이프라인으로 동작
+        logger.debug(f"Publish 파이프라인 조정 실패 (무시됨): {e}")
+
+
 async def create_subscription(
     client: Client, 
     period: float = DEFAULT_PUBLISHING_INTERVAL, 
@@ -359,6 +391,57 @@ async def delete_subscription(subscription: Subscription) -> bool:
         return False
 
 
+async def delete_subscriptions(subs: List[Subscription]) -> List[bool]:
+    """
+    Delete multiple subscriptions with a single service call.
+
+    OPC UA DeleteSubscriptions는 SubscriptionId 배열을 받으므로 N개 구독을
+    N번의 왕복 대신 한 번의 요청으로 삭제할 수 있습니다.
+
+    Args:
+        subs: The subscriptions to delete
+
+    Returns:
+        List of success flags in the same order as subs
+    """
+    if not subs:
+        return []
+
+    first = subs[0]
+    try:
+        # 배열 삭제를 지원하는 서비스 경로 사용
+        # (asyncua 1.0.4에서 subscription.server는 UaClient 자체)
+        server = getattr(first, 'server', None)
+        if server is not None and hasattr(server, 'delete_subscriptions'):
+            sub_ids = [sub.subscription_id for sub in subs]
+            results = await server.delete_subscriptions(sub_ids)
+
+            # Subscription.delete()가 하던 publish 콜백 해제를 그대로 수행 -
+            # 빼놓으면 서버가 구독 id를 재사용할 때 잘못 배달될 수 있음
+            subscription_callbacks = getattr(server, '_subscription_callbacks', None)
+
+            outcome = []
+            for sub, status in zip(subs, results):
+                try:
+                    status.check()
+                    if subscription_callbacks is not None:
+                        subscription_callbacks.pop(sub.subscription_id, None)
+                    logger.info(f"Deleted subscription {sub.subscription_id}")
+                    outcome.append(True)
+                except Exception as status_err:
+                    logger.error(f"Failed to delete subscription {sub.subscription_id}: {status_err}")
+                    outcome.append(False)
+            return outcome
+    except Exception as e:
+        logger.warning(f"Batch subscription delete failed, falling back to per-subscription delete: {e}")
+
+    # 폴백: 배열 삭제를 지원하지 않는 서버에서도 개별 삭제를 순차가 아닌
+    # 동시에 수행해 전체 소요 시간이 N*RTT 대신 ~max(RTT)가 되도록 함
+    results = await asyncio.gather(
+        *(delete_subscription(sub) for sub in subs), return_exceptions=True)
+    return [result is True for result in results]
+
+
 async def set_publishing_mode(subscription: Subscription, publishing: bool) -> bool:
     """
     Set the publishing mode of an existing subscription.
@@ -410,6 +493,33 @@ def normalize_node_id(node_id):
         return str(node_id)
 
 
+class _ValueRingBuffer:
+    """
+    고정 크기 값 저장 버퍼 (병렬 deque 구조).
+
+    알림마다 리스트를 늘리고 슬라이스로 잘라내는 대신 maxlen이 걸린
+    deque에 기록합니다. C 수준 append라 인덱스 연산 없이 O(1)이고,
+    가득 차면 오래된 항목이 자동으로 밀려나 메모리가 용량에 고정됩니다.
+    """
+    __slots__ = ("capacity", "_timestamps", "_values")
+
+    def __init__(self, capacity: int):
+        self.capacity = max(1, capacity)
+        self._timestamps = deque(maxlen=self.capacity)
+        self._values = deque(maxlen=self.capacity)
+
+    def append(self, timestamp, value):
+        self._timestamps.append(timestamp)
+        self._values.append(value)
+
+    def snapshot(self):
+        """오래된 항목부터 (timestamp, value) 튜플 리스트로 반환합니다."""
+        return list(zip(self._timestamps, self._values))
+
+    def __len__(self):
+        return len(self._values)
+
+
 class DataChangeHandler:
     """
     Advanced handler for data change notifications with customization options.
@@ -438,8 +548,9 @@ class DataChangeHandler:
         self.store_values = store_values
         self.max_values = max_values
         self.timestamp_values = timestamp_values
-        self.stored_values = {}  # Dictionary: node_id -> list of (timestamp, value) tuples
+        self.stored_values = {}  # Dictionary: node_id -> _ValueRingBuffer
         self.logger = logging.getLogger(__name__)
+        self._callback_tasks = set()  # 병렬 실행 중인 코루틴 콜백 태스크 추적
         
     async def datachange_notification(self, node: Node, val, data):
         """
@@ -521,42 +632,52 @@ class DataChangeHandler:
                     
                 self.logger.log(self.log_level, f"Data change for {name} ({node_id}): {value_str}")
             
-            # Store the value if enabled
+            # Store the value if enabled - 링 버퍼에 제자리 기록
             if self.store_values:
-                if node_id not in self.stored_values:
-                    self.stored_values[node_id] = []
-                    
-                if self.timestamp_values:
-                    self.stored_values[node_id].append((timestamp, value))
-                else:
-                    self.stored_values[node_id].append(value)
-                    
-                # Trim list if it exceeds max_values
-                if len(self.stored_values[node_id]) > self.max_values:
-                    self.stored_values[node_id] = self.stored_values[node_id][-self.max_values:]
+                buf = self.stored_values.get(node_id)
+                if buf is None:
+                    buf = self.stored_values[node_id] = _ValueRingBuffer(self.max_values)
+                buf.append(timestamp if self.timestamp_values else None, value)
             
             # Call the external callback if provided
             if self.callback:
                 if asyncio.iscoroutinefunction(self.callback):
-                    await self.callback(node, value, data)
+                    # 하나의 publish로 여러 알림이 도착하면 코루틴 콜백들을
+                    # 순차 await 하지 않고 태스크로 띄워 병렬로 실행되게 함
+                    task = asyncio.create_task(self.callback(node, value, data))
+                    self._callback_tasks.add(task)
+                    task.add_done_callback(self._on_callback_done)
                 else:
                     # Support for non-async callbacks
                     self.callback(node, value, data)
-                
+
         except Exception as e:
             self.logger.error(f"Error in data change handler: {e}")
-            
+
+    def _on_callback_done(self, task):
+        """병렬 실행된 콜백 태스크를 정리하고 예외를 로깅합니다."""
+        self._callback_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            self.logger.error(f"Error in data change callback: {task.exception()}")
+
     def get_stored_values(self, node_id: str = None):
         """Get stored values for a specific node or all nodes."""
         if node_id:
-            return self.stored_values.get(node_id, [])
-        return self.stored_values
-        
+            buf = self.stored_values.get(node_id)
+            return self._export_values(buf) if buf is not None else []
+        return {nid: self._export_values(buf) for nid, buf in self.stored_values.items()}
+
+    def _export_values(self, buf):
+        """링 버퍼 내용을 기존과 같은 리스트 형태로 변환합니다."""
+        pairs = buf.snapshot()
+        if self.timestamp_values:
+            return pairs
+        return [value for _timestamp, value in pairs]
+
     def clear_stored_values(self, node_id: str = None):
         """Clear stored values for a specific node or all nodes."""
         if node_id:
-            if node_id in self.stored_values:
-                self.stored_values[node_id] = []
+            self.stored_values.pop(node_id, None)
         else:
             self.stored_values = {}
 
@@ -571,44 +692,167 @@ async def subscribe_data_change(
 ) -> int:
     """
     Subscribe to data changes for a specific node.
-    
+
     Args:
         subscription: The subscription to use
-        node_id: The ID of the node to subscribe to
+        node_id: The ID of the node to subscribe to, or a list of IDs to
+            register in a single CreateMonitoredItems request
         callback: The callback function to be called when the data changes
         sampling_interval: The sampling interval in milliseconds
         queuesize: Size of data change notification queue
         advanced_handler_options: Options for DataChangeHandler if used
-        
+
     Returns:
-        Handle ID for the monitored item
+        Handle ID for the monitored item, or a list of handles when a
+        list of node IDs was given
     """
     try:
         # Get a reference to the client or server
         client = _get_client_from_subscription(subscription)
         if not client:
             raise ValueError("Invalid subscription object: missing client/server reference")
-            
-        # Get the node
-        node = _get_node_from_client(client, node_id)
-        
+
         # Create the appropriate handler
         handler = _create_handler(callback, advanced_handler_options)
-                
+
+        # 리스트 입력은 asyncua의 리스트 지원을 이용해 단일 서비스 호출로 등록
+        if isinstance(node_id, (list, tuple)):
+            nodes = [_get_node_from_client(client, single_id) for single_id in node_id]
+            handles = await _create_monitored_item(subscription, nodes, handler, sampling_interval, queuesize)
+            if handles is None:
+                raise ValueError("Subscription handles are None - this should not happen")
+            logger.info(f"Subscribed to data changes for {len(nodes)} nodes in one request")
+            return handles
+
+        # Get the node
+        node = _get_node_from_client(client, node_id)
+
         # Create the monitored item with multiple approaches
         handle = await _create_monitored_item(subscription, node, handler, sampling_interval, queuesize)
-        
+
         if handle is not None:
             logger.info(f"Subscribed to data changes for node {node_id} with handle {handle}")
             return handle
         else:
             raise ValueError("Subscription handle is None - this should not happen")
-            
+
     except Exception as e:
         logger.error(f"Failed to subscribe to data changes: {e}")
         raise
 
 
+async def subscribe_data_changes(
+    subscription: Subscription,
+    node_ids: List[str],
+    callback: Callable[[Node, Any, Any], None] = None,
+    sampling_intervals: Union[float, List[float]] = 100,
+    queuesize: int = 1,
+    advanced_handler_options_list: Optional[List[Optional[Dict[str, Any]]]] = None
+) -> List[int]:
+    """
+    Subscribe to data changes for multiple nodes with minimal round-trips.
+
+    같은 (sampling_interval, handler options) 조합의 노드끼리 묶어 그룹마다
+    한 번의 CreateMonitoredItems 요청을 보냅니다. 모든 항목이 같은 설정이면
+    N개 등록이 단일 왕복으로 끝납니다.
+
+    Args:
+        subscription: The subscription to use
+        node_ids: List of node IDs to subscribe to
+        callback: The callback function to be called when the data changes
+        sampling_intervals: A single interval in milliseconds, or one per node
+        queuesize: Size of data change notification queue
+        advanced_handler_options_list: Optional per-node handler options
+
+    Returns:
+        List of handle IDs in the same order as node_ids
+    """
+    if not isinstance(sampling_intervals, (list, tuple)):
+        sampling_intervals = [sampling_intervals] * len(node_ids)
+    if advanced_handler_options_list is None:
+        advanced_handler_options_list = [None] * len(node_ids)
+
+    # (interval, options) 조합별로 그룹화해 요청 수를 최소화
+    groups = {}
+    for index, (interval, options) in enumerate(zip(sampling_intervals, advanced_handler_options_list)):
+        key = (interval, tuple(sorted((options or {}).items())))
+        groups.setdefault(key, []).append(index)
+
+    handles: List[Optional[int]] = [None] * len(node_ids)
+    for (interval, _options_key), indices in groups.items():
+        group_ids = [node_ids[i] for i in indices]
+        group_handles = await subscribe_data_change(
+            subscription,
+            group_ids,
+            callback,
+            interval,
+            queuesize,
+            advanced_handler_options=advanced_handler_options_list[indices[0]]
+        )
+        for i, handle in zip(indices, group_handles):
+            handles[i] = handle
+
+    logger.info(f"Subscribed to {len(node_ids)} nodes in {len(groups)} request(s)")
+    return handles
+
+
+async def create_parallel_subscriptions(
+    client: Client,
+    node_ids: List[str],
+    callback: Callable[[Node, Any, Any], None] = None,
+    count: int = 2,
+    period: float = DEFAULT_PUBLISHING_INTERVAL,
+    sampling_interval: float = 100
+) -> List[Tuple[Subscription, List[int]]]:
+    """
+    Create several subscriptions at once and spread nodes across them.
+
+    구독 생성은 asyncio.gather로 동시에 진행하고, 노드는 라운드로빈으로
+    나눈 뒤 구독별로 한 번의 CreateMonitoredItems 요청으로 등록합니다.
+    순차 처리 시 O(count + N)이던 왕복이 동시 1~2파동으로 줄어듭니다.
+
+    Args:
+        client: The client with an established connection
+        node_ids: List of node IDs to distribute across subscriptions
+        callback: The callback function to be called when the data changes
+        count: Number of subscriptions to create
+        period: The publishing interval in milliseconds
+        sampling_interval: The sampling interval in milliseconds
+
+    Returns:
+        List of (subscription, handles) tuples; handles align with the
+        node_ids assigned to that subscription (round-robin order)
+    """
+    count = max(1, count)
+    
+    # 구독들을 동시에 생성
+    subs = await asyncio.gather(
+        *(create_subscription(client, period) for _ in range(count)))
+    
+    # 라운드로빈 분배 후 구독별로 일괄 등록 (등록도 동시에)
+    groups: List[List[str]] = [node_ids[i::count] for i in range(count)]
+    handle_lists = await asyncio.gather(
+        *(subscribe_data_changes(sub, group, callback, sampling_interval)
+          for sub, group in zip(subs, groups) if group),
+        return_exceptions=True)
+    
+    results: List[Tuple[Subscription, List[int]]] = []
+    handle_iter = iter(handle_lists)
+    for sub, group in zip(subs, groups):
+        if not group:
+            results.append((sub, []))
+            continue
+        handles = next(handle_iter)
+        if isinstance(handles, Exception):
+            logger.error(f"Failed to subscribe nodes on subscription: {handles}")
+            results.append((sub, []))
+        else:
+            results.append((sub, handles))
+    
+    logger.info(f"Created {count} subscription(s) covering {len(node_ids)} node(s) concurrently")
+    return results
+
+
 def _get_client_from_subscription(subscription: Subscription):
     """Get client reference from subscription."""
     if hasattr(subscription, 'server'):
@@ -757,6 +1001,76 @@ async def modify_monitored_item(
         return False
 
 
+async def modify_monitored_items(
+    subscription: Subscription,
+    entries: List[Tuple[int, float, int]]
+) -> List[bool]:
+    """
+    Modify multiple monitored items with a single service call.
+
+    (handle, new_sampling_interval, new_queuesize) 항목들을 하나의
+    ModifyMonitoredItemsRequest로 묶어 보내므로 N개 항목 변경이 N번의
+    왕복 대신 1번으로 끝납니다.
+
+    Args:
+        subscription: The subscription containing the monitored items
+        entries: List of (handle, new_sampling_interval, new_queuesize) tuples
+
+    Returns:
+        List of success flags in the same order as entries
+    """
+    if not entries:
+        return []
+
+    # asyncua 1.0.4에서 subscription.server는 UaClient 자체이므로
+    # 서비스 메서드를 server에서 직접 찾습니다.
+    server = getattr(subscription, 'server', None)
+    if server is None or not hasattr(server, 'modify_monitored_items'):
+        # 일괄 서비스를 쓸 수 없으면 항목별 수정으로 폴백
+        results = await asyncio.gather(
+            *(modify_monitored_item(subscription, handle, interval, queuesize)
+              for handle, interval, queuesize in entries),
+            return_exceptions=True)
+        return [result is True for result in results]
+
+    try:
+        # server handle -> client handle 역매핑 구성
+        monitored_items_map = getattr(subscription, '_monitoreditems_map', {})
+        server_to_client = {}
+        for client_handle, data in monitored_items_map.items():
+            server_handle = getattr(data, 'server_handle', None)
+            if server_handle is not None:
+                server_to_client[server_handle] = client_handle
+
+        params = ua.ModifyMonitoredItemsParameters()
+        params.SubscriptionId = subscription.subscription_id
+        for handle, new_sampling_interval, new_queuesize in entries:
+            modif_item = ua.MonitoredItemModifyRequest()
+            modif_item.MonitoredItemId = handle
+            req_params = ua.MonitoringParameters()
+            req_params.ClientHandle = server_to_client.get(handle, handle)
+            req_params.SamplingInterval = new_sampling_interval
+            req_params.QueueSize = new_queuesize
+            modif_item.RequestedParameters = req_params
+            params.ItemsToModify.append(modif_item)
+
+        results = await server.modify_monitored_items(params)
+
+        outcome = []
+        for (handle, _interval, _queuesize), result in zip(entries, results):
+            ok = hasattr(result, 'StatusCode') and result.StatusCode.is_good()
+            if ok:
+                logger.info(f"Successfully modified monitored item {handle}")
+            else:
+                logger.error(f"Failed to modify monitored item {handle}")
+            outcome.append(bool(ok))
+        return outcome
+
+    except Exception as e:
+        logger.error(f"Failed to modify monitored items: {e}")
+        return [False] * len(entries)
+
+
 async def _manual_modify_monitored_item(subscription, handle, new_sampling_interval, new_queuesize, deadband_filter_value):
     """Manual implementation for modifying monitored items."""
     logger.warning("modify_monitored_item method not available, using manual implementation")